@@ -0,0 +1 @@
+default_app_config = "kic.api.apps.APIConfig"
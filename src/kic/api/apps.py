@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class APIConfig(AppConfig):
+    name = "kic.api"
+
+    def ready(self):
+        from .specs import load_specs
+
+        load_specs()
@@ -1,14 +1,97 @@
 import logging
+import threading
+import time
+from typing import List, Union
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 from vng_api_common.models import APICredential
+from zds_client import ClientAuth
 
 logger = logging.getLogger(__name__)
 
+# renew the JWT this many seconds before the remote API considers it expired
+JWT_RENEWAL_MARGIN = 60
+
+
+class CredentialStore:
+    """
+    Process-level cache of the configured :class:`APICredential` objects.
+
+    The credentials are read from the database at most once every
+    ``API_CREDENTIALS_CACHE_TIMEOUT`` seconds, and the signed JWT for an API
+    root is re-used until it is about to expire.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._credentials = None
+            self._loaded_at = 0
+            self._auths = {}
+
+    def _get_credentials(self) -> List[APICredential]:
+        now = time.monotonic()
+        expired = now - self._loaded_at > settings.API_CREDENTIALS_CACHE_TIMEOUT
+        if self._credentials is None or expired:
+            # longest API root first, so that the most specific one matches
+            self._credentials = sorted(
+                APICredential.objects.all(),
+                key=lambda credential: len(credential.api_root),
+                reverse=True,
+            )
+            self._loaded_at = now
+            self._auths = {}
+        return self._credentials
+
+    def get_auth(self, url: str) -> Union[ClientAuth, None]:
+        with self._lock:
+            for credential in self._get_credentials():
+                if url.startswith(credential.api_root):
+                    break
+            else:
+                return None
+
+            auth, created_at = self._auths.get(credential.api_root, (None, 0))
+            now = time.time()
+            if auth is None or now - created_at > (
+                settings.JWT_EXPIRY - JWT_RENEWAL_MARGIN
+            ):
+                auth = ClientAuth(
+                    client_id=credential.client_id,
+                    secret=credential.secret,
+                    user_id=credential.user_id,
+                    user_representation=credential.user_representation,
+                )
+                self._auths[credential.api_root] = (auth, now)
+            return auth
+
+
+credential_store = CredentialStore()
+
+
+def get_client_auth(url: str) -> Union[ClientAuth, None]:
+    return credential_store.get_auth(url)
+
 
 def get_auth(url: str) -> dict:
     logger.info("Authenticating for %s", url)
-    auth = APICredential.get_auth(url)
+    auth = get_client_auth(url)
     if auth is None:
         logger.warning("Could not authenticate for %s", url)
         return {}
     return auth.credentials()
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=APICredential,
+    dispatch_uid="api.clear_credential_store",
+)
+def clear_credential_store(sender, **kwargs):
+    credential_store.clear()
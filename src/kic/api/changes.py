@@ -0,0 +1,195 @@
+"""
+Feed of the changes to a resource, for synchronisation.
+
+A change is either an object that was created or modified, or the tombstone
+of an object that was deleted. The changes are ordered by the moment of the
+change and paged through with a cursor on that moment, so the cost of reading
+the changes depends on the number of changes rather than on the number of
+objects.
+
+The moment of a change is set before its transaction is committed, so a change
+can become visible after later changes were read already. The feed therefore
+only gives the changes older than ``CHANGE_FEED_DELAY`` seconds, which should
+be longer than the longest transaction, so that the cursor never passes a
+change that is still being committed.
+"""
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+from uuid import UUID
+
+from django.conf import settings
+from django.db import models
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.translation import ugettext_lazy as _
+
+from rest_framework import serializers
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor
+from rest_framework.response import Response
+from rest_framework.reverse import reverse
+from rest_framework.utils.urls import remove_query_param
+
+from kic.datamodel.models import Verwijdering
+
+from .pagination import CursorPagination
+
+# moment of the change, whether it's a deletion and the primary key
+Position = Tuple[datetime, bool, Optional[int]]
+
+
+class Wijziging(NamedTuple):
+    gewijzigd: datetime
+    verwijderd: bool
+    pk: int
+    url: str
+    object: Optional[models.Model]
+
+
+def filter_after(
+    queryset: QuerySet, field: str, deleted: bool, position: Position, until: datetime
+) -> QuerySet:
+    """
+    Filter the changes that come after the position and before ``until``, in
+    order.
+    """
+    moment, position_deleted, pk = position
+    queryset = queryset.filter(**{f"{field}__lt": until})
+    query = Q(**{f"{field}__gt": moment})
+    # at the same moment the changed objects come before the deletions
+    if pk is not None and deleted > position_deleted:
+        query |= Q(**{field: moment})
+    elif pk is not None and deleted == position_deleted:
+        query |= Q(**{field: moment, "pk__gt": pk})
+    return queryset.filter(query).order_by(field, "pk")
+
+
+class ChangeFeedPagination(CursorPagination):
+    """
+    Keyset pagination over the changed objects and the deletions of a resource.
+
+    The first page starts after the moment in the ``gewijzigdSinds`` query
+    parameter. The ``next`` link is also given on the last page, so that a
+    client can pick up the later changes with it.
+    """
+
+    since_query_param = "gewijzigdSinds"
+
+    def get_since(self, request) -> Position:
+        field = serializers.DateTimeField()
+        value = request.query_params.get(self.since_query_param, serializers.empty)
+        try:
+            since = field.run_validation(value)
+        except serializers.ValidationError as exc:
+            raise serializers.ValidationError({self.since_query_param: exc.detail})
+        return (since, False, None)
+
+    def get_position(self, request) -> Position:
+        cursor = self.decode_cursor(request)
+        if cursor is None:
+            return self.get_since(request)
+
+        try:
+            moment, deleted, pk = cursor.position.split("|")
+            position = (
+                parse_datetime(moment),
+                bool(int(deleted)),
+                int(pk) if pk else None,
+            )
+        except (AttributeError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if position[0] is None:
+            raise NotFound(self.invalid_cursor_message)
+        return position
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = remove_query_param(
+            request.build_absolute_uri(), self.since_query_param
+        )
+        self.position = self.get_position(request)
+
+        resource = queryset.model._meta.model_name
+        until = timezone.now() - timedelta(seconds=settings.CHANGE_FEED_DELAY)
+        changed = filter_after(queryset, "modified", False, self.position, until)
+        deleted = filter_after(
+            Verwijdering.objects.filter(resource=resource),
+            "verwijderd",
+            True,
+            self.position,
+            until,
+        )
+
+        changes = [
+            Wijziging(
+                obj.modified, False, obj.pk, self.get_url(resource, obj.uuid), obj
+            )
+            for obj in changed[: self.page_size]
+        ] + [
+            Wijziging(
+                verwijdering.verwijderd,
+                True,
+                verwijdering.pk,
+                self.get_url(resource, verwijdering.uuid),
+                None,
+            )
+            for verwijdering in deleted[: self.page_size]
+        ]
+        changes = sorted(changes)[: self.page_size]
+
+        if changes:
+            last = changes[-1]
+            self.position = (last.gewijzigd, last.verwijderd, last.pk)
+        return changes
+
+    def get_url(self, resource: str, uuid: UUID) -> str:
+        return reverse(
+            f"{resource}-detail", kwargs={"uuid": uuid}, request=self.request
+        )
+
+    def get_next_link(self) -> str:
+        moment, deleted, pk = self.position
+        position = f"{moment.isoformat()}|{int(deleted)}|{'' if pk is None else pk}"
+        return self.encode_cursor(Cursor(offset=0, reverse=False, position=position))
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict([("next", self.get_next_link()), ("results", data)])
+        )
+
+
+class WijzigingSerializer(serializers.Serializer):
+    url = serializers.URLField(
+        help_text=_("URL-referentie naar het gewijzigde of verwijderde object.")
+    )
+    gewijzigd = serializers.DateTimeField(
+        help_text=_("Het tijdstip waarop het object is gewijzigd of verwijderd.")
+    )
+    verwijderd = serializers.BooleanField(
+        help_text=_("Geeft aan of het object is verwijderd.")
+    )
+
+
+@lru_cache(maxsize=None)
+def get_wijziging_serializer_class(serializer_class: type) -> type:
+    """
+    Build the serializer of the changes with the objects of the resource.
+    """
+    name = serializer_class.Meta.model.__name__
+    return type(
+        f"{name}WijzigingSerializer",
+        (WijzigingSerializer,),
+        {
+            "object": serializer_class(
+                allow_null=True,
+                help_text=_(
+                    "Het object zoals het nu is, of `null` als het is verwijderd."
+                ),
+            ),
+            "__module__": __name__,
+        },
+    )
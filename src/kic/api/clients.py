@@ -0,0 +1,109 @@
+"""
+Connection pooling for the calls to remote APIs.
+
+Every remote API gets one :class:`requests.Session` per process, so that
+consecutive calls re-use the kept-alive (TLS) connections instead of opening
+a new one for each request.
+"""
+import threading
+from typing import List, Tuple, Union
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+import requests
+import zds_client.client
+from requests.adapters import HTTPAdapter
+from zds_client import Client
+from zds_client.client import Object
+
+from kic.utils.performance import timed_remote_call
+
+
+class SessionRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sessions = {}
+
+    def get(self, url: str) -> requests.Session:
+        parsed = urlparse(url)
+        key = f"{parsed.scheme}://{parsed.netloc}"
+        with self._lock:
+            if key not in self._sessions:
+                self._sessions[key] = self._create_session()
+            return self._sessions[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions = {}
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=settings.ZDS_CLIENT_POOL_SIZE
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+
+sessions = SessionRegistry()
+
+
+def get_timeout() -> Tuple[float, float]:
+    return (settings.ZDS_CLIENT_CONNECT_TIMEOUT, settings.ZDS_CLIENT_READ_TIMEOUT)
+
+
+def fetch(url: str, *args, **kwargs) -> requests.Response:
+    """
+    Drop-in replacement for :func:`requests.get`, used as ``LINK_FETCHER``.
+    """
+    kwargs.setdefault("timeout", get_timeout())
+    with timed_remote_call(url):
+        return sessions.get(url).get(url, *args, **kwargs)
+
+
+class PooledRequests:
+    """
+    Stand-in for the :mod:`requests` module used by :mod:`zds_client.client`.
+
+    :meth:`zds_client.Client.request` sends with :func:`requests.request`,
+    this sends through the pooled session of the API instead. Everything else
+    is taken from :mod:`requests`.
+    """
+
+    def __getattr__(self, name: str):
+        return getattr(requests, name)
+
+    @staticmethod
+    def request(method: str, url: str, **kwargs) -> requests.Response:
+        with timed_remote_call(url):
+            return sessions.get(url).request(method, url, **kwargs)
+
+
+zds_client.client.requests = PooledRequests()
+
+
+class PooledClient(Client):
+    """
+    ZDS client doing its requests through the pooled session of the API.
+    """
+
+    def request(
+        self, path: str, operation: str, method="GET", expected_status=200, **kwargs
+    ) -> Union[List[Object], Object]:
+        kwargs.setdefault("timeout", get_timeout())
+        return super().request(
+            path, operation, method=method, expected_status=expected_status, **kwargs
+        )
+
+
+@receiver(setting_changed, dispatch_uid="api.clear_sessions")
+def clear_sessions(sender, setting, **kwargs):
+    if setting == "ZDS_CLIENT_POOL_SIZE":
+        sessions.clear()
@@ -0,0 +1,125 @@
+"""
+Concurrent calls to remote APIs.
+
+The independent remote lookups of a request are done in parallel on a thread
+pool of the process, so that the latency approaches that of the slowest call
+instead of the sum of all calls. Every call has the timeouts of the ZDS
+client, the calls to one host are limited to
+``REMOTE_VALIDATION_MAX_PER_HOST`` at a time, and all calls together get
+``REMOTE_VALIDATION_DEADLINE`` seconds.
+
+The calls run outside the thread of the request, so they must not use the
+database: look up the credentials before.
+"""
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Tuple
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.translation import ugettext_lazy as _
+
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from kic.utils.performance import bind_timings, get_current_timings
+
+
+class RemoteTimeout(APIException):
+    status_code = status.HTTP_504_GATEWAY_TIMEOUT
+    default_detail = _("De externe API heeft niet op tijd geantwoord.")
+    default_code = "remote-timeout"
+
+
+class RemoteCallPool:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executor = None
+        self._semaphores = {}
+
+    def clear(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            self._executor = None
+            self._semaphores = {}
+
+    def get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=settings.REMOTE_VALIDATION_MAX_WORKERS,
+                    thread_name_prefix="remote-call",
+                )
+            return self._executor
+
+    def get_semaphore(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(
+                    settings.REMOTE_VALIDATION_MAX_PER_HOST
+                )
+            return self._semaphores[host]
+
+
+pool = RemoteCallPool()
+
+
+def call_inline(func: Callable[[], Any]) -> Future:
+    future = Future()
+    try:
+        future.set_result(func())
+    except Exception as exc:
+        future.set_exception(exc)
+    return future
+
+
+def call_concurrently(
+    calls: Dict[str, Tuple[str, Callable[[], Any]]]
+) -> Dict[str, Future]:
+    """
+    Call the functions in parallel and wait until all are done.
+
+    ``calls`` maps a name to the URL of the remote API and the function that
+    calls it. Returns the futures of the calls by name, their ``result()``
+    raises the exception of a failed call.
+
+    :raises: :class:`RemoteTimeout` if the calls are not done before the
+      deadline.
+    """
+    if not settings.REMOTE_VALIDATION_CONCURRENT or len(calls) <= 1:
+        return {name: call_inline(func) for name, (url, func) in calls.items()}
+
+    deadline = time.monotonic() + settings.REMOTE_VALIDATION_DEADLINE
+    timings = get_current_timings()
+
+    def limited(url: str, func: Callable[[], Any]) -> Any:
+        semaphore = pool.get_semaphore(url)
+        if not semaphore.acquire(timeout=max(0, deadline - time.monotonic())):
+            raise RemoteTimeout()
+        try:
+            with bind_timings(timings):
+                return func()
+        finally:
+            semaphore.release()
+
+    executor = pool.get_executor()
+    futures = {
+        name: executor.submit(limited, url, func) for name, (url, func) in calls.items()
+    }
+    done, not_done = wait(futures.values(), timeout=settings.REMOTE_VALIDATION_DEADLINE)
+    if not_done:
+        for future in not_done:
+            future.cancel()
+        raise RemoteTimeout()
+    return futures
+
+
+@receiver(setting_changed, dispatch_uid="api.clear_remote_call_pool")
+def clear_remote_call_pool(sender, setting, **kwargs):
+    if setting in ("REMOTE_VALIDATION_MAX_WORKERS", "REMOTE_VALIDATION_MAX_PER_HOST"):
+        pool.clear()
@@ -0,0 +1,111 @@
+"""
+Streaming export of a queryset as NDJSON or CSV.
+
+The rows are read with a server-side cursor and serialized one at a time, so
+the memory use of an export does not depend on the number of rows and the
+first bytes are sent before the last row is read.
+"""
+import csv
+from typing import Iterable, Iterator
+
+from django.conf import settings
+from django.db.models import QuerySet
+
+from djangorestframework_camel_case.render import CamelCaseJSONRenderer
+from djangorestframework_camel_case.util import camelize
+from rest_framework.negotiation import DefaultContentNegotiation
+from rest_framework.serializers import Serializer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class Echo:
+    """
+    File-like object that returns what is written to it.
+    """
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def iter_rows(serializer: Serializer, queryset: QuerySet) -> Iterator[dict]:
+    for obj in queryset.iterator(chunk_size=settings.EXPORT_CHUNK_SIZE):
+        yield camelize(serializer.to_representation(obj))
+
+
+def get_columns(serializer: Serializer) -> list:
+    fields = serializer.fields
+    return list(
+        camelize({name: None for name, field in fields.items() if not field.write_only})
+    )
+
+
+def iter_ndjson(serializer: Serializer, queryset: QuerySet) -> Iterable[str]:
+    encoder = JSONEncoder(ensure_ascii=False)
+    for row in iter_rows(serializer, queryset):
+        yield f"{encoder.encode(row)}\n"
+
+
+def iter_csv(serializer: Serializer, queryset: QuerySet) -> Iterable[str]:
+    columns = get_columns(serializer)
+    writer = csv.writer(Echo())
+    encoder = JSONEncoder(ensure_ascii=False)
+
+    yield writer.writerow(columns)
+    for row in iter_rows(serializer, queryset):
+        # nested objects and lists don't fit in a cell, so they're written
+        # as JSON
+        yield writer.writerow(
+            [
+                encoder.encode(row[column])
+                if isinstance(row[column], (dict, list))
+                else row[column]
+                for column in columns
+            ]
+        )
+
+
+class ExportRenderer(CamelCaseJSONRenderer):
+    """
+    Select the export format by content negotiation.
+
+    The exported rows are written by :meth:`stream`, anything else that is
+    rendered, like an error response, is rendered as JSON.
+    """
+
+    charset = "utf-8"
+
+    def stream(self, serializer: Serializer, queryset: QuerySet) -> Iterable[str]:
+        raise NotImplementedError
+
+
+class NDJSONRenderer(ExportRenderer):
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+
+    def stream(self, serializer, queryset):
+        return iter_ndjson(serializer, queryset)
+
+
+class CSVRenderer(ExportRenderer):
+    media_type = "text/csv"
+    format = "csv"
+
+    def stream(self, serializer, queryset):
+        return iter_csv(serializer, queryset)
+
+
+class ExportContentNegotiation(DefaultContentNegotiation):
+    """
+    Also select the export format with the ``formaat`` query parameter.
+
+    The ``format`` query parameter of DRF can't be used, since it's copied into
+    the URLs of the exported objects.
+    """
+
+    format_query_param = "formaat"
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        format_suffix = format_suffix or request.query_params.get(
+            self.format_query_param
+        )
+        return super().select_renderer(request, renderers, format_suffix)
@@ -1,14 +1,92 @@
+from django.utils.translation import ugettext_lazy as _
+
 from django_filters import filters
 from vng_api_common.filtersets import FilterSet
 from vng_api_common.utils import get_help_text
 
+from kic.datamodel.constants import VerzoekStatus
 from kic.datamodel.models import (
+    ContactMoment,
+    Klant,
     ObjectContactMoment,
     VerzoekContactMoment,
     VerzoekInformatieObject,
     VerzoekProduct,
 )
-from kic.datamodel.models.core import ObjectVerzoek
+from kic.datamodel.models.core import ObjectVerzoek, Verzoek
+
+
+class ArrayContainsFilter(filters.CharFilter):
+    """
+    Filter on an array containing the value.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("lookup_expr", "contains")
+        super().__init__(*args, **kwargs)
+
+    def filter(self, qs, value):
+        if not value:
+            return qs
+        return super().filter(qs, [value])
+
+
+class KlantFilter(FilterSet):
+    subject_natuurlijk_persoon__inp_bsn = filters.CharFilter(
+        field_name="natuurlijk_persoon__inp_bsn",
+        help_text=get_help_text("datamodel.NatuurlijkPersoon", "inp_bsn"),
+    )
+    subject_niet_natuurlijk_persoon__inn_nnp_id = filters.CharFilter(
+        field_name="niet_natuurlijk_persoon__inn_nnp_id",
+        help_text=get_help_text("datamodel.NietNatuurlijkPersoon", "inn_nnp_id"),
+    )
+    subject_vestiging__vestigings_nummer = filters.CharFilter(
+        field_name="vestiging__vestigings_nummer",
+        help_text=get_help_text("datamodel.Vestiging", "vestigings_nummer"),
+    )
+
+    class Meta:
+        model = Klant
+        fields = (
+            "subject",
+            "subject_type",
+            "subject_natuurlijk_persoon__inp_bsn",
+            "subject_niet_natuurlijk_persoon__inn_nnp_id",
+            "subject_vestiging__vestigings_nummer",
+            "emailadres",
+            "telefoonnummer",
+        )
+
+
+class ContactMomentFilter(FilterSet):
+    onderwerp_links__contains = ArrayContainsFilter(
+        field_name="onderwerp_links",
+        help_text=_(
+            "De CONTACTMOMENTen met deze link in `onderwerpLinks`, bijvoorbeeld "
+            "om alle CONTACTMOMENTen over een product op te vragen."
+        ),
+    )
+
+    class Meta:
+        model = ContactMoment
+        fields = {
+            "klant": ["exact"],
+            "bronorganisatie": ["exact"],
+            "interactiedatum": ["gte", "lte"],
+            "kanaal": ["exact"],
+            "medewerker": ["exact"],
+        }
+
+
+class VerzoekFilter(FilterSet):
+    status = filters.ChoiceFilter(
+        choices=VerzoekStatus.choices,
+        help_text=get_help_text("datamodel.Verzoek", "status"),
+    )
+
+    class Meta:
+        model = Verzoek
+        fields = ("identificatie", "status", "klant")
 
 
 class ObjectContactMomentFilter(FilterSet):
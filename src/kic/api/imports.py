@@ -0,0 +1,247 @@
+"""
+Bulk import of KLANTen.
+
+The KLANTen are validated with :class:`KlantSerializer`, like when they're
+created through the API, and written in chunks with one INSERT per model
+instead of one per object.
+
+A KLANT that already exists is updated instead, matched on its ``subject``
+or else on the BSN of its natuurlijk persoon. Its subject identificatie is
+replaced by the imported one.
+"""
+import logging
+from collections import OrderedDict, defaultdict
+from typing import Dict, Iterable, List, Tuple, Union
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from djangorestframework_camel_case.util import underscoreize
+from rest_framework.settings import api_settings
+
+from kic.datamodel.constants import KlantType
+from kic.datamodel.models import (
+    Adres,
+    Klant,
+    NatuurlijkPersoon,
+    NietNatuurlijkPersoon,
+    SubVerblijfBuitenland,
+    Vestiging,
+)
+from kic.datamodel.search import defer_zoektekst_updates, update_zoektekst
+from kic.datamodel.signals import skip_klant_change_marks
+from kic.utils.db import bulk_create
+
+from .serializers import KlantSerializer
+
+logger = logging.getLogger(__name__)
+
+# the model of the subject identificatie and the name of the foreign key to it
+# on Adres and SubVerblijfBuitenland
+GROUP_MODELS = {
+    KlantType.natuurlijk_persoon: (NatuurlijkPersoon, "natuurlijkpersoon"),
+    KlantType.niet_natuurlijk_persoon: (
+        NietNatuurlijkPersoon,
+        "nietnatuurlijkpersoon",
+    ),
+    KlantType.vestiging: (Vestiging, "vestiging"),
+}
+
+KLANT_FIELDS = [
+    "voornaam",
+    "achternaam",
+    "adres",
+    "telefoonnummer",
+    "emailadres",
+    "functie",
+    "subject",
+    "subject_type",
+    "_etag",
+    "modified",
+]
+
+ImportKey = Tuple[str, str]
+
+
+def get_import_key(attrs: dict) -> Union[ImportKey, None]:
+    if attrs.get("subject"):
+        return ("subject", attrs["subject"])
+
+    group_data = attrs.get("subject_identificatie") or {}
+    if attrs.get("subject_type") == KlantType.natuurlijk_persoon and group_data.get(
+        "inp_bsn"
+    ):
+        return ("bsn", group_data["inp_bsn"])
+
+    return None
+
+
+class KlantImporter:
+    def __init__(self, chunk_size: int = 500):
+        self.chunk_size = chunk_size
+        self.created = 0
+        self.updated = 0
+        self.errors = []
+
+    def run(self, records: Iterable[Tuple[int, dict]]) -> None:
+        """
+        Import the records, given as (line number, KLANT in API format) tuples.
+        """
+        chunk = []
+        for record in records:
+            chunk.append(record)
+            if len(chunk) >= self.chunk_size:
+                self.import_chunk(chunk)
+                chunk = []
+
+        if chunk:
+            self.import_chunk(chunk)
+
+    def add_error(self, line: int, errors: dict) -> None:
+        logger.info("Klant on line %d is invalid: %r", line, errors)
+        self.errors.append((line, errors))
+
+    def validate(self, chunk: List[Tuple[int, dict]]) -> List[Tuple[int, dict]]:
+        valid = []
+        for line, data in chunk:
+            serializer = KlantSerializer(data=underscoreize(data))
+            if serializer.is_valid():
+                valid.append((line, serializer.validated_data))
+            else:
+                self.add_error(line, serializer.errors)
+        return valid
+
+    def get_existing(self, keys: Iterable[ImportKey]) -> Dict[ImportKey, Klant]:
+        subjects = [value for kind, value in keys if kind == "subject"]
+        bsns = [value for kind, value in keys if kind == "bsn"]
+
+        existing = {}
+        if subjects:
+            for klant in Klant.objects.filter(subject__in=subjects):
+                existing[("subject", klant.subject)] = klant
+        if bsns:
+            klanten = Klant.objects.filter(
+                natuurlijk_persoon__inp_bsn__in=bsns
+            ).annotate(import_bsn=F("natuurlijk_persoon__inp_bsn"))
+            for klant in klanten:
+                existing[("bsn", klant.import_bsn)] = klant
+        return existing
+
+    @transaction.atomic
+    def import_chunk(self, chunk: List[Tuple[int, dict]]) -> None:
+        # the last occurrence of a KLANT in the chunk wins
+        keyed, unkeyed = OrderedDict(), []
+        for line, attrs in self.validate(chunk):
+            key = get_import_key(attrs)
+            if key is None:
+                unkeyed.append((None, line, attrs))
+            else:
+                keyed.pop(key, None)
+                keyed[key] = (key, line, attrs)
+
+        existing = self.get_existing(keyed.keys())
+        now = timezone.now()
+
+        # the line that updates an existing KLANT, by primary key
+        updated_by = {}
+        new_klanten, updated_klanten, groups = [], [], []
+        for key, line, attrs in [*keyed.values(), *unkeyed]:
+            klant = existing.get(key)
+            if klant is not None and klant.pk in updated_by:
+                # matched on subject by one line and on BSN by another
+                self.add_error(
+                    line,
+                    {
+                        api_settings.NON_FIELD_ERRORS_KEY: [
+                            f"Matches the same klant as line {updated_by[klant.pk]}."
+                        ]
+                    },
+                )
+                continue
+
+            group_data = attrs.pop("subject_identificatie", None)
+
+            if klant is None:
+                klant = Klant(**attrs)
+                new_klanten.append(klant)
+            else:
+                updated_by[klant.pk] = line
+                for field, value in attrs.items():
+                    setattr(klant, field, value)
+                # bulk updates don't send signals or set the auto_now fields
+                klant._etag = ""
+                klant.modified = now
+                updated_klanten.append(klant)
+
+            if group_data:
+                groups.append((klant, group_data))
+
+        # only the existing KLANTen with an imported subject identificatie
+        # get theirs replaced, the others keep it
+        replaced = [klant for klant, _ in groups if klant.pk]
+
+        with defer_zoektekst_updates():
+            bulk_create(Klant, new_klanten, key="uuid")
+            if updated_klanten:
+                Klant.objects.bulk_update(updated_klanten, fields=KLANT_FIELDS)
+            if replaced:
+                self.delete_groups(replaced)
+
+            self.create_groups(groups)
+
+        klanten = [*new_klanten, *updated_klanten]
+        update_zoektekst(Klant.objects.filter(pk__in=[klant.pk for klant in klanten]))
+
+        self.created += len(new_klanten)
+        self.updated += len(updated_klanten)
+
+    def delete_groups(self, klanten: List[Klant]) -> None:
+        """
+        Delete the subject identificaties of the KLANTen and their nested groups.
+
+        The KLANTen are marked as changed by the bulk update already, so that
+        is not done again for every deleted row.
+        """
+        with skip_klant_change_marks():
+            for Model, _ in GROUP_MODELS.values():
+                Model.objects.filter(klant__in=klanten).delete()
+
+    def create_groups(self, groups: List[Tuple[Klant, dict]]) -> None:
+        group_objs = defaultdict(list)
+        nested = defaultdict(list)
+
+        for klant, group_data in groups:
+            if klant.subject_type not in GROUP_MODELS:
+                continue
+
+            Model, fk_name = GROUP_MODELS[klant.subject_type]
+            verblijfsadres_data = group_data.pop("verblijfsadres", None)
+            sub_verblijf_buitenland_data = group_data.pop(
+                "sub_verblijf_buitenland", None
+            )
+
+            group = Model(klant=klant, **group_data)
+            group_objs[Model].append(group)
+
+            if verblijfsadres_data:
+                nested[Adres].append((Adres(**verblijfsadres_data), fk_name, group))
+            if sub_verblijf_buitenland_data:
+                nested[SubVerblijfBuitenland].append(
+                    (
+                        SubVerblijfBuitenland(**sub_verblijf_buitenland_data),
+                        fk_name,
+                        group,
+                    )
+                )
+
+        for Model, objs in group_objs.items():
+            for obj in objs:
+                # set the foreign key now the primary key is known
+                obj.klant = obj.klant
+            bulk_create(Model, objs, key="klant_id")
+
+        for Model, objs in nested.items():
+            for obj, fk_name, group in objs:
+                setattr(obj, fk_name, group)
+            Model.objects.bulk_create([obj for obj, _, _ in objs])
@@ -0,0 +1,29 @@
+from vng_api_common.inspectors.view import AutoSchema
+
+
+class ActionAliasAutoSchema(AutoSchema):
+    """
+    Document the error responses of a custom action like those of a default one.
+    """
+
+    alias = None
+
+    def _get_error_responses(self):
+        action = self.view.action
+        self.view.action = self.alias
+        try:
+            return super()._get_error_responses()
+        finally:
+            self.view.action = action
+
+
+class BulkCreateAutoSchema(ActionAliasAutoSchema):
+    alias = "create"
+
+
+class ExportAutoSchema(ActionAliasAutoSchema):
+    alias = "list"
+
+
+class ChangeFeedAutoSchema(ActionAliasAutoSchema):
+    alias = "list"
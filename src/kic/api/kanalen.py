@@ -0,0 +1,15 @@
+from vng_api_common.notifications.kanalen import Kanaal
+
+from kic.datamodel.models import ContactMoment, Klant, Verzoek
+
+KANAAL_KLANTEN = Kanaal("klanten", main_resource=Klant, kenmerken=("subject_type",))
+
+KANAAL_CONTACTMOMENTEN = Kanaal(
+    "contactmomenten",
+    main_resource=ContactMoment,
+    kenmerken=("bronorganisatie", "kanaal", "initiatiefnemer"),
+)
+
+KANAAL_VERZOEKEN = Kanaal(
+    "verzoeken", main_resource=Verzoek, kenmerken=("bronorganisatie", "status")
+)
@@ -0,0 +1,370 @@
+import json
+import random
+import statistics
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from typing import Callable, Dict, List, NamedTuple, Optional
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from rest_framework.test import APIClient
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+from vng_api_common.mocks import Response
+from vng_api_common.tests import JWTAuthMixin, generate_jwt_auth, reverse
+from zds_client.tests.mocks import MockClient
+
+from kic.datamodel.constants import KlantType, ObjectTypes, VerzoekStatus
+from kic.datamodel.models import ContactMoment, Klant, Verzoek
+from kic.datamodel.search import update_zoektekst
+from kic.datamodel.tests.factories import (
+    ContactMomentFactory,
+    KlantFactory,
+    VerzoekFactory,
+)
+from kic.utils.db import bulk_create
+
+CLIENT_ID = "benchmark"
+SECRET = "benchmark"
+
+# the remote calls wait this number of seconds, set with --remote-latency
+remote_latency = 0.0
+
+
+def fetch(url: str, *args, **kwargs) -> Response:
+    """
+    Link fetcher for the benchmark, the remote objects always exist.
+    """
+    time.sleep(remote_latency)
+    return Response(status_code=200)
+
+
+class RemoteClient(MockClient):
+    """
+    ZDS client for the benchmark, every object has the relation.
+    """
+
+    responses = None
+
+    def fetch_schema(self) -> None:
+        self._schema = {}
+
+    def request(self, path: str, operation: str, method="GET", *args, **kwargs):
+        time.sleep(remote_latency)
+        return [{"url": f"{self.base_url}{path}/{uuid.uuid4()}"}]
+
+
+class Rollback(Exception):
+    pass
+
+
+@contextmanager
+def rolled_back():
+    try:
+        with transaction.atomic():
+            yield
+            raise Rollback
+    except Rollback:
+        pass
+
+
+class Scenario(NamedTuple):
+    name: str
+    method: str
+    # returns the URL and the body of a request
+    build: Callable[[], tuple]
+
+
+def percentile(values: List[float], percent: int) -> float:
+    values = sorted(values)
+    index = max(0, int(round(len(values) * percent / 100)) - 1)
+    return values[index]
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the latency and the number of queries of the API endpoints. The "
+        "objects are created in bulk with the factories, and the requests are "
+        "done in a transaction that is rolled back afterwards. The calls to "
+        "remote APIs are mocked."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--klanten", type=int, default=100_000)
+        parser.add_argument("--contactmomenten", type=int, default=500_000)
+        parser.add_argument("--verzoeken", type=int, default=100_000)
+        parser.add_argument(
+            "--requests", type=int, default=200, help="Number of requests per endpoint."
+        )
+        parser.add_argument("--batch-size", type=int, default=10_000)
+        parser.add_argument(
+            "--remote-latency",
+            type=float,
+            default=50,
+            help="Number of milliseconds the mocked remote calls take.",
+        )
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="Keep the created objects, to run the benchmark again with "
+            "--klanten 0 --contactmomenten 0 --verzoeken 0.",
+        )
+        parser.add_argument("--output", help="Write the report as JSON to this file.")
+        parser.add_argument(
+            "--baseline",
+            help="Report of an earlier run. Fails if an endpoint got slower or "
+            "does more queries.",
+        )
+        parser.add_argument(
+            "--max-regression",
+            type=float,
+            default=0.2,
+            help="Fraction the p95 latency may increase compared to the baseline.",
+        )
+
+    def seed(self, klanten: int, contactmomenten: int, verzoeken: int, batch_size: int):
+        for start in range(0, klanten, batch_size):
+            objs = KlantFactory.build_batch(min(batch_size, klanten - start))
+            bulk_create(Klant, objs, key="uuid")
+            update_zoektekst(Klant.objects.filter(pk__in=[obj.pk for obj in objs]))
+            self.stdout.write(f"Created {start + len(objs)} klanten", ending="\r")
+        self.stdout.write("")
+
+        klant_ids = list(Klant.objects.values_list("pk", flat=True))
+        if not klant_ids:
+            return
+
+        for start in range(0, contactmomenten, batch_size):
+            objs = ContactMomentFactory.build_batch(
+                min(batch_size, contactmomenten - start), klant=None
+            )
+            for obj in objs:
+                obj.klant_id = random.choice(klant_ids)
+            ContactMoment.objects.bulk_create(objs)
+            self.stdout.write(
+                f"Created {start + len(objs)} contactmomenten", ending="\r"
+            )
+        self.stdout.write("")
+
+        prefix = uuid.uuid4().hex[:8]
+        for start in range(0, verzoeken, batch_size):
+            objs = VerzoekFactory.build_batch(
+                min(batch_size, verzoeken - start), klant=None
+            )
+            for i, obj in enumerate(objs, start=start):
+                obj.klant_id = random.choice(klant_ids)
+                obj.identificatie = f"BENCHMARK{prefix}{i}"
+            Verzoek.objects.bulk_create(objs)
+            self.stdout.write(f"Created {start + len(objs)} verzoeken", ending="\r")
+        self.stdout.write("")
+
+    def get_scenarios(self, count: int) -> List[Scenario]:
+        def sample(model) -> List[str]:
+            pks = list(model.objects.order_by("?").values_list("pk", flat=True)[:count])
+            return [reverse(obj) for obj in model.objects.filter(pk__in=pks)]
+
+        klanten = sample(Klant)
+        contactmomenten = sample(ContactMoment)
+        verzoeken = sample(Verzoek)
+        if not (klanten and contactmomenten and verzoeken):
+            raise CommandError("There are no klanten, contactmomenten or verzoeken.")
+
+        def klant_body():
+            return {
+                "voornaam": "Klaas",
+                "achternaam": "Bakker",
+                "subject": f"https://brp.example.com/ingeschrevenpersonen/{uuid.uuid4()}",
+                "subjectType": KlantType.natuurlijk_persoon,
+            }
+
+        def klantinteractie_body():
+            return {
+                "bronorganisatie": "423182687",
+                "klant": random.choice(klanten),
+                "kanaal": "telefoon",
+                "medewerker": "https://example.com/medewerkers/1",
+                "status": VerzoekStatus.ontvangen,
+                "tekst": "benchmark",
+            }
+
+        def tekst_body():
+            return {"tekst": f"benchmark {uuid.uuid4()}"}
+
+        scenarios = []
+        for resource, objects, create_body, update_body in (
+            ("klant", klanten, klant_body, lambda: {"voornaam": "Piet"}),
+            ("contactmoment", contactmomenten, klantinteractie_body, tekst_body),
+            ("verzoek", verzoeken, klantinteractie_body, tekst_body),
+        ):
+            list_url = reverse(f"{resource}-list")
+            scenarios += [
+                Scenario(f"{resource}-list", "get", lambda url=list_url: (url, None)),
+                Scenario(
+                    f"{resource}-retrieve",
+                    "get",
+                    lambda objects=objects: (random.choice(objects), None),
+                ),
+                Scenario(
+                    f"{resource}-create",
+                    "post",
+                    lambda url=list_url, body=create_body: (url, body()),
+                ),
+                Scenario(
+                    f"{resource}-partial-update",
+                    "patch",
+                    lambda objects=objects, body=update_body: (
+                        random.choice(objects),
+                        body(),
+                    ),
+                ),
+            ]
+
+        # validated against the remote ZAAK
+        scenarios.append(
+            Scenario(
+                "objectcontactmoment-create",
+                "post",
+                lambda: (
+                    reverse("objectcontactmoment-list"),
+                    {
+                        "contactmoment": random.choice(contactmomenten),
+                        "objectType": ObjectTypes.zaak,
+                        "object": f"https://zrc.example.com/api/v1/zaken/{uuid.uuid4()}",
+                    },
+                ),
+            )
+        )
+        return scenarios
+
+    def measure(self, client: APIClient, scenario: Scenario, count: int) -> dict:
+        timings, queries, statuses = [], [], Counter()
+        for _ in range(count):
+            url, body = scenario.build()
+            do_request = getattr(client, scenario.method)
+            with CaptureQueriesContext(connection) as context:
+                start = time.perf_counter()
+                response = do_request(url, body) if body else do_request(url)
+                timings.append((time.perf_counter() - start) * 1000)
+            queries.append(len(context))
+            statuses[str(response.status_code)] += 1
+
+        return {
+            "endpoint": scenario.name,
+            "method": scenario.method.upper(),
+            "requests": count,
+            "statuses": dict(statuses),
+            "latency_ms": {
+                "mean": round(statistics.mean(timings), 3),
+                "p50": round(percentile(timings, 50), 3),
+                "p90": round(percentile(timings, 90), 3),
+                "p95": round(percentile(timings, 95), 3),
+                "p99": round(percentile(timings, 99), 3),
+                "max": round(max(timings), 3),
+            },
+            "queries": {
+                "min": min(queries),
+                "median": statistics.median(queries),
+                "max": max(queries),
+            },
+        }
+
+    def benchmark(self, count: int) -> List[dict]:
+        JWTAuthMixin._create_credentials(
+            CLIENT_ID,
+            SECRET,
+            heeft_alle_autorisaties=True,
+            max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.zeer_geheim,
+        )
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=generate_jwt_auth(CLIENT_ID, SECRET))
+
+        results = []
+        for scenario in self.get_scenarios(count):
+            result = self.measure(client, scenario, count)
+            results.append(result)
+            latency = result["latency_ms"]
+            self.stdout.write(
+                f"{scenario.name}: p50 {latency['p50']:.1f} ms, "
+                f"p95 {latency['p95']:.1f} ms, "
+                f"queries {result['queries']['max']}, statuses {result['statuses']}"
+            )
+        return results
+
+    def check_regressions(
+        self, results: List[dict], baseline: dict, max_regression: float
+    ) -> List[str]:
+        previous = {result["endpoint"]: result for result in baseline["results"]}
+        regressions = []
+        for result in results:
+            before = previous.get(result["endpoint"])
+            if before is None:
+                continue
+            p95, p95_before = result["latency_ms"]["p95"], before["latency_ms"]["p95"]
+            if p95 > p95_before * (1 + max_regression):
+                regressions.append(
+                    f"{result['endpoint']}: p95 {p95_before:.1f} ms -> {p95:.1f} ms"
+                )
+            queries, queries_before = result["queries"]["max"], before["queries"]["max"]
+            if queries > queries_before:
+                regressions.append(
+                    f"{result['endpoint']}: {queries_before} -> {queries} queries"
+                )
+        return regressions
+
+    def handle(self, **options):
+        global remote_latency
+        remote_latency = options["remote_latency"] / 1000
+
+        volumes = {
+            "klanten": options["klanten"],
+            "contactmomenten": options["contactmomenten"],
+            "verzoeken": options["verzoeken"],
+        }
+        baseline: Optional[Dict] = None
+        if options["baseline"]:
+            with open(options["baseline"]) as infile:
+                baseline = json.load(infile)
+
+        if options["keep"]:
+            with transaction.atomic():
+                self.seed(**volumes, batch_size=options["batch_size"])
+
+        with rolled_back(), override_settings(
+            ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"],
+            LINK_FETCHER=f"{__name__}.fetch",
+            ZDS_CLIENT_CLASS=f"{__name__}.RemoteClient",
+        ), patch(
+            "zds_client.client.get_operation_url",
+            return_value="/api/v1/zaakcontactmomenten",
+        ), patch(
+            "vng_api_common.validators.obj_has_shape", return_value=True
+        ):
+            if not options["keep"]:
+                self.seed(**volumes, batch_size=options["batch_size"])
+            results = self.benchmark(options["requests"])
+
+        report = {
+            "created": timezone.now().isoformat(),
+            "volumes": volumes,
+            "remote_latency_ms": options["remote_latency"],
+            "results": results,
+        }
+        if options["output"]:
+            with open(options["output"], "w") as outfile:
+                json.dump(report, outfile, indent=2)
+
+        if baseline is not None:
+            regressions = self.check_regressions(
+                results, baseline, options["max_regression"]
+            )
+            if regressions:
+                raise CommandError(
+                    "Regressions compared to the baseline:\n" + "\n".join(regressions)
+                )
@@ -0,0 +1,118 @@
+import random
+import statistics
+import time
+
+from django.core.management import BaseCommand
+from django.db import transaction
+
+from kic.datamodel.constants import KlantType
+from kic.datamodel.models import (
+    Klant,
+    NatuurlijkPersoon,
+    NietNatuurlijkPersoon,
+    Vestiging,
+)
+from kic.utils.db import bulk_create
+
+from ...filters import KlantFilter
+
+# filter name, subject type, group model and the field holding the number
+LOOKUPS = [
+    (
+        "subject_natuurlijk_persoon__inp_bsn",
+        KlantType.natuurlijk_persoon,
+        NatuurlijkPersoon,
+        "inp_bsn",
+    ),
+    (
+        "subject_niet_natuurlijk_persoon__inn_nnp_id",
+        KlantType.niet_natuurlijk_persoon,
+        NietNatuurlijkPersoon,
+        "inn_nnp_id",
+    ),
+    (
+        "subject_vestiging__vestigings_nummer",
+        KlantType.vestiging,
+        Vestiging,
+        "vestigings_nummer",
+    ),
+]
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the latency of looking up KLANTen by BSN, KvK-nummer and "
+        "vestigingsnummer. The KLANTen are created in a transaction that is "
+        "rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--klanten",
+            type=int,
+            default=2_000_000,
+            help="Number of KLANTen to create, spread over the subject types.",
+        )
+        parser.add_argument(
+            "--lookups", type=int, default=1000, help="Number of lookups per filter.",
+        )
+        parser.add_argument("--batch-size", type=int, default=10_000)
+
+    def seed(self, count: int, batch_size: int) -> None:
+        for start in range(0, count, batch_size):
+            numbers = range(start, min(start + batch_size, count))
+            klanten = [
+                Klant(subject_type=LOOKUPS[number % len(LOOKUPS)][1])
+                for number in numbers
+            ]
+            bulk_create(Klant, klanten, key="uuid")
+
+            groups = {Model: [] for _, _, Model, _ in LOOKUPS}
+            for number, klant in zip(numbers, klanten):
+                _, _, Model, field = LOOKUPS[number % len(LOOKUPS)]
+                groups[Model].append(Model(klant=klant, **{field: f"{number:09d}"}))
+            for Model, objs in groups.items():
+                Model.objects.bulk_create(objs)
+
+            self.stdout.write(f"Created {numbers.stop} klanten", ending="\r")
+        self.stdout.write("")
+
+    def measure(self, name: str, values: list) -> list:
+        timings = []
+        for value in values:
+            start = time.perf_counter()
+            list(KlantFilter({name: value}, queryset=Klant.objects.all()).qs)
+            timings.append((time.perf_counter() - start) * 1000)
+        return timings
+
+    def handle(self, **options):
+        count = options["klanten"]
+        try:
+            with transaction.atomic():
+                self.seed(count, options["batch_size"])
+
+                for i, (name, _, _, _) in enumerate(LOOKUPS):
+                    numbers = range(i, count, len(LOOKUPS))
+                    values = [
+                        f"{number:09d}"
+                        for number in random.choices(numbers, k=options["lookups"])
+                    ]
+                    timings = sorted(self.measure(name, values))
+                    p95 = timings[int(len(timings) * 0.95) - 1]
+                    self.stdout.write(
+                        f"{name}: median {statistics.median(timings):.3f} ms, "
+                        f"p95 {p95:.3f} ms"
+                    )
+
+                    queryset = KlantFilter(
+                        {name: values[0]}, queryset=Klant.objects.all()
+                    ).qs
+                    self.stdout.write(queryset.explain())
+
+                raise Rollback
+        except Rollback:
+            pass
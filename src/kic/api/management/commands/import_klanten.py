@@ -0,0 +1,50 @@
+import json
+import sys
+
+from django.core.management import BaseCommand, CommandError
+
+from ...imports import KlantImporter
+
+
+class Command(BaseCommand):
+    help = (
+        "Import KLANTen from a newline delimited JSON file, with one KLANT per "
+        "line in the format of the API. Existing KLANTen (with the same subject "
+        "or BSN) are updated."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("file", help="Path to the NDJSON file, or - for stdin.")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Number of KLANTen validated and written per transaction.",
+        )
+
+    def read_records(self, lines, importer: KlantImporter):
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield line_number, json.loads(line)
+            except ValueError as exc:
+                importer.add_error(line_number, {"json": [str(exc)]})
+
+    def handle(self, **options):
+        importer = KlantImporter(chunk_size=options["chunk_size"])
+
+        if options["file"] == "-":
+            importer.run(self.read_records(sys.stdin, importer))
+        else:
+            with open(options["file"], "r") as ndjson_file:
+                importer.run(self.read_records(ndjson_file, importer))
+
+        for line_number, errors in importer.errors:
+            self.stderr.write(f"Line {line_number}: {json.dumps(errors)}")
+
+        self.stdout.write(
+            f"Created {importer.created} and updated {importer.updated} klanten"
+        )
+        if importer.errors:
+            raise CommandError(f"{len(importer.errors)} klanten could not be imported")
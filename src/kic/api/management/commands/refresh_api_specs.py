@@ -0,0 +1,19 @@
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+
+from ...specs import get_spec_path, refresh_spec
+
+
+class Command(BaseCommand):
+    help = "Download the OAS specs of the remote APIs into API_SPEC_DIR."
+
+    def handle(self, **options):
+        for alias, url in settings.API_SPECS.items():
+            try:
+                refresh_spec(alias, url)
+            except Exception as exc:
+                raise CommandError(
+                    f"Could not refresh the {alias} API spec from {url}: {exc}"
+                ) from exc
+
+            self.stdout.write(f"Stored the {alias} API spec in {get_spec_path(alias)}")
@@ -0,0 +1,228 @@
+import hashlib
+
+from django.http import StreamingHttpResponse
+from django.utils.http import parse_etags, quote_etag
+from django.utils.translation import ugettext_lazy as _
+
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import OrderingFilter
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from vng_api_common.caching.etags import calculate_etag
+from vng_api_common.filters import Backend
+from vng_api_common.utils import underscore_to_camel
+
+from kic.utils.performance import timed_serialization
+
+from .changes import ChangeFeedPagination, get_wijziging_serializer_class
+from .export import CSVRenderer, ExportContentNegotiation, NDJSONRenderer
+from .inspectors import ChangeFeedAutoSchema, ExportAutoSchema
+
+
+class CheckQueryParamsMixin:
+    """
+    Validate that the query params in the request are known.
+
+    Counterpart of :class:`vng_api_common.viewsets.CheckQueryParamsMixin`
+    which also knows about the parameters of other paginators.
+    """
+
+    def get_known_query_params(self) -> set:
+        # NOTE: only works with django_filters based filter backends
+        backend = Backend()
+        queryset = self.get_queryset()
+        filterset_class = backend.get_filterset_class(self, queryset)
+
+        known_params = set()
+        if filterset_class:
+            # build a list of known params from the filters
+            filters = filterset_class().get_filters().keys()
+            known_params = {underscore_to_camel(param) for param in filters}
+
+        # add the pagination params to the known params, DRF paginators
+        # declare them as ``*_query_param`` attributes (``None`` if disabled)
+        if self.paginator:
+            known_params.update(
+                getattr(self.paginator, attr)
+                for attr in dir(self.paginator)
+                if attr.endswith("_query_param") and getattr(self.paginator, attr)
+            )
+
+        return known_params
+
+    def _check_query_params(self, request) -> None:
+        # nothing to check if there are no query parameters
+        if not request.query_params:
+            return
+
+        known_params = self.get_known_query_params()
+        unknown_params = set(request.query_params.keys()) - known_params
+        if OrderingFilter in self.filter_backends:
+            unknown_params.discard(api_settings.ORDERING_PARAM)
+
+        if unknown_params:
+            msg = _("Onbekende query parameters: %s") % ", ".join(unknown_params)
+            raise ValidationError(
+                {api_settings.NON_FIELD_ERRORS_KEY: msg}, code="unknown-parameters"
+            )
+
+    def list(self, request, *args, **kwargs):
+        self._check_query_params(request)
+        return super().list(request, *args, **kwargs)
+
+
+class ConditionalListMixin:
+    """
+    Set an ETag on the pages of the list and honour ``If-None-Match``.
+
+    The ETag of a page is derived from the stored ETags of its objects and the
+    links to the other pages, so an unchanged page is answered with
+    ``304 Not Modified`` before the objects are serialized.
+    """
+
+    def get_list_etag(self, objects: list) -> str:
+        # a missing value is only calculated for the response, reads don't
+        # write to the database
+        etag = hashlib.md5()
+        for obj in objects:
+            etag.update((obj._etag or calculate_etag(obj)).encode("ascii"))
+
+        if self.paginator is not None:
+            for link in (
+                self.paginator.get_next_link(),
+                self.paginator.get_previous_link(),
+            ):
+                etag.update(f"|{link or ''}".encode("utf-8"))
+
+        return quote_etag(etag.hexdigest())
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        objects = page if page is not None else list(queryset)
+
+        etag = self.get_list_etag(objects)
+        if_none_match = parse_etags(request.META.get("HTTP_IF_NONE_MATCH", ""))
+        if etag in if_none_match or "*" in if_none_match:
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        serializer = self.get_serializer(objects, many=True)
+        if page is not None:
+            response = self.get_paginated_response(serializer.data)
+        else:
+            response = Response(serializer.data)
+        response["ETag"] = etag
+        return response
+
+
+class ChangeFeedMixin:
+    """
+    List the changes to the objects since a given moment.
+
+    Every created, modified or deleted object is listed once, with the moment
+    of its last change. Follow the ``next`` link to read the next changes.
+    """
+
+    def get_serializer_class(self):
+        serializer_class = super().get_serializer_class()
+        if self.action == "_wijzigingen":
+            return get_wijziging_serializer_class(serializer_class)
+        return serializer_class
+
+    @swagger_auto_schema(
+        auto_schema=ChangeFeedAutoSchema,
+        manual_parameters=[
+            openapi.Parameter(
+                ChangeFeedPagination.since_query_param,
+                openapi.IN_QUERY,
+                description=_(
+                    "Geef de wijzigingen na dit tijdstip. Verplicht als er geen "
+                    "`cursor` is opgegeven."
+                ),
+                type=openapi.TYPE_STRING,
+                format=openapi.FORMAT_DATETIME,
+            )
+        ],
+    )
+    @action(
+        detail=False,
+        methods=["get"],
+        filter_backends=(),
+        pagination_class=ChangeFeedPagination,
+    )
+    def _wijzigingen(self, request, *args, **kwargs):
+        """
+        Wijzigingen sinds een tijdstip opvragen.
+
+        Geef de aangemaakte, gewijzigde en verwijderde objecten sinds het
+        tijdstip in `gewijzigdSinds`, in de volgorde van wijziging. Volg de
+        `next` link om de volgende wijzigingen op te vragen; deze link wordt
+        ook gegeven als er (nog) geen nieuwe wijzigingen zijn. Wijzigingen
+        worden pas na een korte vertraging gegeven, zodat er geen wijzigingen
+        worden overgeslagen die nog niet waren vastgelegd.
+        """
+        page = self.paginate_queryset(self.get_queryset())
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+
+class ExportMixin:
+    """
+    Stream all objects in the list as NDJSON or CSV.
+
+    Unlike ``list``, the response is not paginated and the serialized objects
+    are not kept in memory. The format is selected with the ``Accept`` header
+    or the ``formaat`` query parameter.
+    """
+
+    @swagger_auto_schema(
+        auto_schema=ExportAutoSchema,
+        manual_parameters=[
+            openapi.Parameter(
+                ExportContentNegotiation.format_query_param,
+                openapi.IN_QUERY,
+                description=_("Het formaat van de export."),
+                type=openapi.TYPE_STRING,
+                enum=[NDJSONRenderer.format, CSVRenderer.format],
+            )
+        ],
+    )
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="_export",
+        pagination_class=None,
+        renderer_classes=(NDJSONRenderer, CSVRenderer),
+        content_negotiation_class=ExportContentNegotiation,
+    )
+    def export(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset()).order_by("pk")
+        # bind the fields once instead of once per object
+        serializer = self.get_serializer()
+
+        renderer = request.accepted_renderer
+        return StreamingHttpResponse(
+            renderer.stream(serializer, queryset),
+            content_type=f"{renderer.media_type}; charset={renderer.charset}",
+        )
+
+
+class TimedSerializationMixin:
+    """
+    Count the serialization of the objects in the timings of the request.
+    """
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        to_representation = serializer.to_representation
+
+        def timed_to_representation(instance):
+            with timed_serialization():
+                return to_representation(instance)
+
+        serializer.to_representation = timed_to_representation
+        return serializer
@@ -0,0 +1,50 @@
+from django.conf import settings
+from django.utils.translation import ugettext_lazy as _
+
+from rest_framework import pagination
+
+
+class CursorPagination(pagination.CursorPagination):
+    """
+    Keyset pagination on the primary key.
+
+    The opaque cursor encodes the last seen primary key, so fetching a page
+    is an index range scan regardless of the size of the table or the depth
+    of the page.
+    """
+
+    ordering = "-pk"
+    page_size_query_param = "pageSize"
+    cursor_query_description = _(
+        "De cursor van de op te vragen pagina, zoals opgenomen in `next` of "
+        "`previous` van de vorige pagina."
+    )
+
+    @property
+    def page_size(self) -> int:
+        return getattr(self, "_page_size", settings.PAGE_SIZE)
+
+    @page_size.setter
+    def page_size(self, value: int) -> None:
+        # DRF stores the page size of the request on the paginator
+        self._page_size = value
+
+    @property
+    def max_page_size(self) -> int:
+        return settings.MAX_PAGE_SIZE
+
+
+class PageNumberPagination(pagination.PageNumberPagination):
+    """
+    Pagination of results in another order than the primary key.
+    """
+
+    page_size_query_param = "pageSize"
+
+    @property
+    def page_size(self) -> int:
+        return settings.PAGE_SIZE
+
+    @property
+    def max_page_size(self) -> int:
+        return settings.MAX_PAGE_SIZE
@@ -40,6 +40,7 @@ from kic.datamodel.models import (
 )
 from kic.datamodel.models.core import ObjectVerzoek
 from kic.sync.signals import SyncError
+from kic.utils.db import bulk_create
 
 from .validators import ObjectContactMomentCreateValidator, ObjectVerzoekCreateValidator
 
@@ -369,15 +370,80 @@ class KlantSerializer(PolymorphicSerializer):
         return klant
 
 
+class KlantZoekSerializer(serializers.Serializer):
+    zoekterm = serializers.CharField(
+        min_length=3,
+        max_length=200,
+        help_text=_(
+            "(Een deel van) de naam of het adres van de KLANT. Kleine afwijkingen, "
+            "zoals tikfouten, zijn toegestaan."
+        ),
+    )
+
+
 class KlantInteractieSerializer(serializers.HyperlinkedModelSerializer):
     pass
 
 
+class ContactMomentListSerializer(serializers.ListSerializer):
+    """
+    Create the CONTACTMOMENTen with one INSERT per table.
+    """
+
+    def to_internal_value(self, data):
+        # checked before the items are validated, which costs queries per item
+        if isinstance(data, list) and len(data) > settings.BULK_CREATE_MAX_ITEMS:
+            message = _(
+                "Er kunnen maximaal {max} objecten tegelijk aangemaakt worden."
+            ).format(max=settings.BULK_CREATE_MAX_ITEMS)
+            raise serializers.ValidationError(
+                {
+                    api_settings.NON_FIELD_ERRORS_KEY: [
+                        serializers.ErrorDetail(message, code="max-items")
+                    ]
+                }
+            )
+        return super().to_internal_value(data)
+
+    def create(self, validated_data):
+        contactmomenten, medewerkers = [], []
+        for attrs in validated_data:
+            medewerker_identificatie_data = attrs.pop("medewerker_identificatie", None)
+            contactmoment = ContactMoment(**attrs)
+            # bulk_create skips ContactMoment.save
+            if contactmoment.onderwerp_links is None:
+                contactmoment.onderwerp_links = []
+            contactmomenten.append(contactmoment)
+
+            if medewerker_identificatie_data:
+                medewerkers.append(
+                    Medewerker(
+                        contactmoment=contactmoment, **medewerker_identificatie_data
+                    )
+                )
+            else:
+                # no need to query for it when rendering the response
+                ContactMoment.medewerker_identificatie.related.set_cached_value(
+                    contactmoment, None
+                )
+
+        with transaction.atomic():
+            bulk_create(ContactMoment, contactmomenten, key="uuid")
+
+            for medewerker in medewerkers:
+                # set the foreign key now the primary key is known
+                medewerker.contactmoment = medewerker.contactmoment
+            Medewerker.objects.bulk_create(medewerkers)
+
+        return contactmomenten
+
+
 class ContactMomentSerializer(KlantInteractieSerializer):
     medewerker_identificatie = MedewerkerSerializer(required=False, allow_null=True)
 
     class Meta:
         model = ContactMoment
+        list_serializer_class = ContactMomentListSerializer
         fields = (
             "url",
             "bronorganisatie",
@@ -489,7 +555,13 @@ class ObjectContactMomentSerializer(serializers.HyperlinkedModelSerializer):
             "object": {"validators": [IsImmutableValidator()],},
             "object_type": {"validators": [IsImmutableValidator()]},
         }
-        validators = [ObjectContactMomentCreateValidator()]
+        validators = [
+            UniqueTogetherValidator(
+                queryset=ObjectContactMoment.objects.all(),
+                fields=["contactmoment", "object"],
+            ),
+            ObjectContactMomentCreateValidator(),
+        ]
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -514,7 +586,12 @@ class ObjectVerzoekSerializer(serializers.HyperlinkedModelSerializer):
             "object": {"validators": [IsImmutableValidator()],},
             "object_type": {"validators": [IsImmutableValidator()]},
         }
-        validators = [ObjectVerzoekCreateValidator()]
+        validators = [
+            UniqueTogetherValidator(
+                queryset=ObjectVerzoek.objects.all(), fields=["verzoek", "object"]
+            ),
+            ObjectVerzoekCreateValidator(),
+        ]
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -552,6 +629,11 @@ class VerzoekInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
         }
 
     def save(self, **kwargs):
+        if settings.DRC_SYNC_ASYNC:
+            # the relation and its outbox entry are written together
+            with transaction.atomic():
+                return super().save(**kwargs)
+
         # can't slap a transaction atomic on this, since DRC/kic query for the
         # relation!
         try:
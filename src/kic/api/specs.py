@@ -0,0 +1,78 @@
+"""
+Local store of the OAS 3.0.x specs of the remote APIs.
+
+:class:`vng_api_common.validators.ResourceValidator` downloads and parses the
+spec of the remote API the first time it validates a URL. The specs in
+``API_SPECS`` are kept as YAML files in ``API_SPEC_DIR`` instead, and loaded
+into the schema cache of vng-api-common when the process starts, so that
+validation does not depend on the availability of the spec URL.
+"""
+import logging
+import os
+from typing import Union
+
+from django.conf import settings
+
+import requests
+import yaml
+from vng_api_common.oas import fetcher
+
+logger = logging.getLogger(__name__)
+
+SOURCE_PREFIX = "# source: "
+
+
+def get_spec_path(alias: str) -> str:
+    return os.path.join(settings.API_SPEC_DIR, f"{alias}.yaml")
+
+
+def parse_spec(content: Union[str, bytes]) -> dict:
+    spec = yaml.safe_load(content)
+    spec_version = spec.get("openapi", spec.get("swagger", ""))
+    if not spec_version.startswith("3.0"):
+        raise ValueError("Unsupported spec version: {}".format(spec_version))
+    return spec
+
+
+def load_spec(alias: str, url: str) -> Union[dict, None]:
+    """
+    Read the stored spec, provided that it was downloaded from ``url``.
+    """
+    path = get_spec_path(alias)
+    if not os.path.exists(path):
+        logger.warning("No local copy of the %s API spec at %s", alias, path)
+        return None
+
+    with open(path, "r") as spec_file:
+        source = spec_file.readline().strip()
+        if source != f"{SOURCE_PREFIX}{url}":
+            logger.warning(
+                "Local copy of the %s API spec is outdated, expected %s", alias, url
+            )
+            return None
+        return parse_spec(spec_file.read())
+
+
+def load_specs() -> None:
+    for alias, url in settings.API_SPECS.items():
+        spec = load_spec(alias, url)
+        if spec is not None:
+            fetcher.cache[url] = spec
+
+
+def refresh_spec(alias: str, url: str) -> None:
+    """
+    Download the spec from ``url`` and replace the local copy.
+    """
+    response = requests.get(url)
+    response.raise_for_status()
+    # refuse to store anything that can't be used for validation
+    spec = parse_spec(response.content)
+
+    os.makedirs(settings.API_SPEC_DIR, exist_ok=True)
+    path = get_spec_path(alias)
+    with open(path, "w") as spec_file:
+        spec_file.write(f"{SOURCE_PREFIX}{url}\n")
+        spec_file.write(response.text)
+
+    fetcher.cache[url] = spec
@@ -0,0 +1,87 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from kic.datamodel.models import ContactMoment, Klant, Verzoek
+
+
+class BenchmarkCommandTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.output = os.path.join(tmpdir.name, "benchmark.json")
+
+    def run_benchmark(self, **options):
+        call_command(
+            "benchmark_api",
+            klanten=5,
+            contactmomenten=10,
+            verzoeken=5,
+            requests=2,
+            remote_latency=0,
+            output=self.output,
+            stdout=StringIO(),
+            **options,
+        )
+        with open(self.output) as infile:
+            return json.load(infile)
+
+    def test_report(self):
+        report = self.run_benchmark()
+
+        self.assertEqual(
+            report["volumes"], {"klanten": 5, "contactmomenten": 10, "verzoeken": 5}
+        )
+        results = {result["endpoint"]: result for result in report["results"]}
+        self.assertEqual(
+            set(results),
+            {
+                f"{resource}-{action}"
+                for resource in ("klant", "contactmoment", "verzoek")
+                for action in ("list", "retrieve", "create", "partial-update")
+            }
+            | {"objectcontactmoment-create"},
+        )
+        klant_list = results["klant-list"]
+        self.assertEqual(klant_list["method"], "GET")
+        self.assertEqual(klant_list["statuses"], {"200": 2})
+        self.assertEqual(
+            set(klant_list["latency_ms"]), {"mean", "p50", "p90", "p95", "p99", "max"}
+        )
+        self.assertGreater(klant_list["queries"]["max"], 0)
+        self.assertEqual(results["verzoek-create"]["statuses"], {"201": 2})
+
+        # the objects are rolled back
+        self.assertFalse(Klant.objects.exists())
+        self.assertFalse(ContactMoment.objects.exists())
+        self.assertFalse(Verzoek.objects.exists())
+
+    def test_keep(self):
+        self.run_benchmark(keep=True)
+
+        self.assertEqual(Klant.objects.count(), 5)
+        self.assertEqual(ContactMoment.objects.count(), 10)
+        self.assertEqual(Verzoek.objects.count(), 5)
+
+    def test_regression(self):
+        report = self.run_benchmark()
+        for result in report["results"]:
+            if result["endpoint"] == "klant-list":
+                result["latency_ms"]["p95"] = 0.001
+                result["queries"]["max"] = 1
+        baseline = os.path.join(os.path.dirname(self.output), "baseline.json")
+        with open(baseline, "w") as outfile:
+            json.dump(report, outfile)
+
+        with self.assertRaises(CommandError) as context:
+            self.run_benchmark(baseline=baseline)
+
+        message = str(context.exception)
+        self.assertIn("klant-list: p95 0.0 ms", message)
+        self.assertIn("klant-list: 1 -> ", message)
@@ -0,0 +1,158 @@
+"""
+Test the ETags and conditional requests of the resources.
+"""
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, reverse
+
+from kic.datamodel.tests.factories import (
+    AdresFactory,
+    ContactMomentFactory,
+    KlantFactory,
+    MedewerkerFactory,
+    NatuurlijkPersoonFactory,
+    SubVerblijfBuitenlandFactory,
+    VerzoekFactory,
+)
+
+
+class KlantCacheTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_klant_get_cache_header(self):
+        klant = KlantFactory.create()
+
+        response = self.client.get(reverse(klant))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        klant.refresh_from_db()
+        self.assertTrue(klant._etag)
+        self.assertEqual(response["ETag"], f'"{klant._etag}"')
+
+    def test_klant_head_cache_header(self):
+        klant = KlantFactory.create()
+
+        response = self.client.head(reverse(klant))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("ETag", response)
+        self.assertEqual(response.content, b"")
+
+    def test_conditional_get_304(self):
+        klant = KlantFactory.create(with_etag=True)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                reverse(klant), HTTP_IF_NONE_MATCH=f'"{klant._etag}"'
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+        # besides the authorization, only the stored ETag is looked up
+        resource_queries = [query for query in queries if "datamodel_" in query["sql"]]
+        self.assertEqual(len(resource_queries), 1)
+
+    def test_conditional_get_stale(self):
+        klant = KlantFactory.create(with_etag=True)
+
+        response = self.client.get(reverse(klant), HTTP_IF_NONE_MATCH='"not-an-md5"')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_nested_changes_clear_etag(self):
+        natuurlijk_persoon = NatuurlijkPersoonFactory.create()
+        klant = natuurlijk_persoon.klant
+
+        for factory in (AdresFactory, SubVerblijfBuitenlandFactory):
+            with self.subTest(factory=factory):
+                klant.calculate_etag_value()
+
+                factory.create(natuurlijkpersoon=natuurlijk_persoon)
+
+                klant.refresh_from_db()
+                self.assertEqual(klant._etag, "")
+
+    def test_list_etag(self):
+        KlantFactory.create_batch(2)
+        url = reverse("klant-list")
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response["ETag"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+
+        KlantFactory.create()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 3)
+        self.assertNotEqual(response["ETag"], etag)
+
+
+class ContactMomentCacheTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_contactmoment_get_cache_header(self):
+        contactmoment = ContactMomentFactory.create()
+
+        response = self.client.get(reverse(contactmoment))
+
+        self.assertIn("ETag", response)
+
+    def test_medewerker_change_clears_etag(self):
+        medewerker = MedewerkerFactory.create()
+        contactmoment = medewerker.contactmoment
+        contactmoment.calculate_etag_value()
+
+        medewerker.achternaam = "Buurman"
+        medewerker.save()
+
+        contactmoment.refresh_from_db()
+        self.assertEqual(contactmoment._etag, "")
+
+        response = self.client.get(reverse(contactmoment))
+
+        self.assertEqual(
+            response.json()["medewerkerIdentificatie"]["achternaam"], "Buurman"
+        )
+        contactmoment.refresh_from_db()
+        self.assertEqual(response["ETag"], f'"{contactmoment._etag}"')
+
+
+class VerzoekCacheTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_verzoek_get_cache_header(self):
+        verzoek = VerzoekFactory.create()
+
+        response = self.client.get(reverse(verzoek))
+
+        self.assertIn("ETag", response)
+
+    def test_list_etag_calculates_missing_etags(self):
+        verzoek = VerzoekFactory.create()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("verzoek-list"))
+
+        self.assertIn("ETag", response)
+        # the missing value is not stored by a read
+        self.assertFalse(
+            any(query["sql"].startswith("UPDATE") for query in queries.captured_queries)
+        )
+        verzoek.refresh_from_db()
+        self.assertEqual(verzoek._etag, "")
+
+        # the same ETag as with the stored value
+        verzoek.calculate_etag_value()
+        response_stored = self.client.get(reverse("verzoek-list"))
+        self.assertEqual(response_stored["ETag"], response["ETag"])
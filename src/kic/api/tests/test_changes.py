@@ -0,0 +1,184 @@
+from django.test import override_settings
+
+from freezegun import freeze_time
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, get_validation_errors, reverse
+
+from kic.datamodel.models import ContactMoment, Verwijdering
+from kic.datamodel.tests.factories import (
+    AdresFactory,
+    ContactMomentFactory,
+    KlantFactory,
+    MedewerkerFactory,
+    NatuurlijkPersoonFactory,
+    VerzoekFactory,
+)
+
+
+class ChangeFeedTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_changes_since(self):
+        url = reverse("klant--wijzigingen")
+        with freeze_time("2020-01-01T12:00:00Z"):
+            KlantFactory.create()
+        with freeze_time("2020-01-02T12:00:00Z"):
+            klant = KlantFactory.create()
+
+        response = self.client.get(url, {"gewijzigdSinds": "2020-01-02T00:00:00Z"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.json()["results"]
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["url"], f"http://testserver{reverse(klant)}")
+        self.assertEqual(results[0]["gewijzigd"], "2020-01-02T12:00:00Z")
+        self.assertFalse(results[0]["verwijderd"])
+        self.assertEqual(results[0]["object"]["voornaam"], klant.voornaam)
+
+    def test_changes_include_deletions(self):
+        url = reverse("contactmoment--wijzigingen")
+        with freeze_time("2020-01-01T12:00:00Z"):
+            contactmoment = ContactMomentFactory.create()
+        with freeze_time("2020-01-02T12:00:00Z"):
+            response = self.client.delete(reverse(contactmoment))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        response = self.client.get(url, {"gewijzigdSinds": "2020-01-01T00:00:00Z"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json()["results"],
+            [
+                {
+                    "url": f"http://testserver{reverse(contactmoment)}",
+                    "gewijzigd": "2020-01-02T12:00:00Z",
+                    "verwijderd": True,
+                    "object": None,
+                }
+            ],
+        )
+
+    def test_klant_deletion_records_klantinteracties(self):
+        verzoek = VerzoekFactory.create()
+
+        verzoek.klant.delete()
+
+        self.assertTrue(
+            Verwijdering.objects.filter(resource="verzoek", uuid=verzoek.uuid).exists()
+        )
+
+    def test_nested_changes_modify_parent(self):
+        with freeze_time("2020-01-01T12:00:00Z"):
+            natuurlijk_persoon = NatuurlijkPersoonFactory.create()
+            medewerker = MedewerkerFactory.create()
+
+        with freeze_time("2020-01-02T12:00:00Z"):
+            AdresFactory.create(natuurlijkpersoon=natuurlijk_persoon)
+            medewerker.achternaam = "Buurman"
+            medewerker.save()
+
+        for url, obj in (
+            (reverse("klant--wijzigingen"), natuurlijk_persoon.klant),
+            (reverse("contactmoment--wijzigingen"), medewerker.contactmoment),
+        ):
+            with self.subTest(url=url):
+                response = self.client.get(
+                    url, {"gewijzigdSinds": "2020-01-02T00:00:00Z"}
+                )
+
+                results = response.json()["results"]
+                self.assertEqual(len(results), 1)
+                self.assertEqual(results[0]["url"], f"http://testserver{reverse(obj)}")
+
+    def test_follow_next_links(self):
+        url = reverse("verzoek--wijzigingen")
+        # changes at the same moment are ordered by primary key
+        with freeze_time("2020-01-01T12:00:00Z"):
+            verzoeken = VerzoekFactory.create_batch(3)
+            verzoeken[0].delete()
+
+        response = self.client.get(
+            url, {"gewijzigdSinds": "2020-01-01T00:00:00Z", "pageSize": 2}
+        )
+        data = response.json()
+        self.assertEqual(
+            [result["url"] for result in data["results"]],
+            [
+                f"http://testserver{reverse(verzoeken[1])}",
+                f"http://testserver{reverse(verzoeken[2])}",
+            ],
+        )
+
+        response = self.client.get(data["next"])
+        data = response.json()
+        self.assertEqual(len(data["results"]), 1)
+        self.assertTrue(data["results"][0]["verwijderd"])
+
+        # no more changes, but the link picks up later ones
+        response = self.client.get(data["next"])
+        self.assertEqual(response.json()["results"], [])
+        self.assertEqual(response.json()["next"], data["next"])
+
+        with freeze_time("2020-01-02T12:00:00Z"):
+            verzoek = VerzoekFactory.create()
+
+        response = self.client.get(data["next"])
+        self.assertEqual(
+            [result["url"] for result in response.json()["results"]],
+            [f"http://testserver{reverse(verzoek)}"],
+        )
+
+    @override_settings(CHANGE_FEED_DELAY=60)
+    def test_recent_changes_are_delayed(self):
+        url = reverse("klant--wijzigingen")
+        with freeze_time("2020-01-01T12:00:00Z"):
+            klant = KlantFactory.create()
+            deleted = KlantFactory.create()
+            deleted.delete()
+
+        # the transaction of the changes may not be committed yet
+        with freeze_time("2020-01-01T12:00:30Z"):
+            response = self.client.get(url, {"gewijzigdSinds": "2020-01-01T00:00:00Z"})
+
+        data = response.json()
+        self.assertEqual(data["results"], [])
+
+        with freeze_time("2020-01-01T12:01:01Z"):
+            response = self.client.get(data["next"])
+
+        self.assertEqual(
+            [
+                (result["url"], result["verwijderd"])
+                for result in response.json()["results"]
+            ],
+            [
+                (f"http://testserver{reverse(klant)}", False),
+                (f"http://testserver{reverse(deleted)}", True),
+            ],
+        )
+
+    def test_gewijzigd_sinds_required(self):
+        response = self.client.get(reverse("klant--wijzigingen"))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "gewijzigdSinds")
+        self.assertEqual(error["code"], "required")
+
+    def test_invalid_cursor(self):
+        response = self.client.get(reverse("klant--wijzigingen"), {"cursor": "x"})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_modified_on_update(self):
+        with freeze_time("2020-01-01T12:00:00Z"):
+            contactmoment = ContactMomentFactory.create()
+        with freeze_time("2020-01-02T12:00:00Z"):
+            response = self.client.patch(reverse(contactmoment), {"tekst": "andere"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        contactmoment = ContactMoment.objects.get()
+        self.assertEqual(contactmoment.created.isoformat(), "2020-01-01T12:00:00+00:00")
+        self.assertEqual(
+            contactmoment.modified.isoformat(), "2020-01-02T12:00:00+00:00"
+        )
@@ -0,0 +1,89 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from requests import Response
+from zds_client import ClientError
+
+from ..clients import PooledClient, fetch, sessions
+
+
+def get_response(status_code: int = 200, content: bytes = b"{}") -> Response:
+    response = Response()
+    response.status_code = status_code
+    response._content = content
+    return response
+
+
+@override_settings(ZDS_CLIENT_CONNECT_TIMEOUT=1, ZDS_CLIENT_READ_TIMEOUT=2)
+class PooledClientTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        sessions.clear()
+        self.addCleanup(sessions.clear)
+
+    def test_session_per_api(self):
+        session = sessions.get(
+            "https://drc.example.com/api/v1/objectinformatieobjecten"
+        )
+
+        self.assertIs(
+            sessions.get(
+                "https://drc.example.com/api/v1/enkelvoudiginformatieobjecten"
+            ),
+            session,
+        )
+        self.assertIsNot(sessions.get("https://zrc.example.com/api/v1/zaken"), session)
+
+    @override_settings(ZDS_CLIENT_POOL_SIZE=3)
+    def test_pool_size(self):
+        session = sessions.get("https://drc.example.com/api/v1/")
+
+        self.assertEqual(
+            session.get_adapter("https://drc.example.com")._pool_maxsize, 3
+        )
+
+    def test_fetch_uses_session(self):
+        url = "https://zrc.example.com/api/v1/zaken/1234"
+
+        with patch("requests.Session.get", return_value=get_response()) as m:
+            fetch(url, headers={"Accept-Crs": "EPSG:4326"})
+
+        m.assert_called_once_with(
+            url, headers={"Accept-Crs": "EPSG:4326"}, timeout=(1, 2)
+        )
+
+    @patch("kic.api.clients.PooledClient.fetch_schema")
+    def test_client_request_uses_session(self, *mocks):
+        client = PooledClient.from_url(
+            "https://drc.example.com/api/v1/objectinformatieobjecten/1234"
+        )
+        client._schema = {"paths": {}}
+
+        with patch("requests.Session.request", return_value=get_response()) as m:
+            client.retrieve(
+                "objectinformatieobject",
+                url="https://drc.example.com/api/v1/objectinformatieobjecten/1234",
+            )
+
+        m.assert_called_once()
+        self.assertEqual(m.call_args[0][0], "GET")
+        self.assertEqual(m.call_args[1]["timeout"], (1, 2))
+
+    @patch("kic.api.clients.PooledClient.fetch_schema")
+    def test_client_request_error(self, *mocks):
+        client = PooledClient.from_url(
+            "https://drc.example.com/api/v1/objectinformatieobjecten/1234"
+        )
+        client._schema = {"paths": {}}
+        response = get_response(status_code=404, content=b'{"code": "not_found"}')
+
+        with patch("requests.Session.request", return_value=response):
+            with self.assertRaises(ClientError) as context:
+                client.retrieve(
+                    "objectinformatieobject",
+                    url="https://drc.example.com/api/v1/objectinformatieobjecten/1234",
+                )
+
+        self.assertEqual(context.exception.args[0], {"code": "not_found"})
@@ -0,0 +1,100 @@
+import threading
+import time
+
+from django.test import SimpleTestCase, override_settings
+
+from ..concurrency import RemoteTimeout, call_concurrently, pool
+
+
+@override_settings(
+    REMOTE_VALIDATION_CONCURRENT=True,
+    REMOTE_VALIDATION_MAX_WORKERS=4,
+    REMOTE_VALIDATION_MAX_PER_HOST=4,
+    REMOTE_VALIDATION_DEADLINE=5,
+)
+class CallConcurrentlyTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        pool.clear()
+        self.addCleanup(pool.clear)
+
+    def test_calls_run_in_parallel(self):
+        # both calls must be running at the same time to pass the barrier
+        barrier = threading.Barrier(2, timeout=1)
+
+        def call(value):
+            barrier.wait()
+            return value
+
+        results = call_concurrently(
+            {
+                "object": ("https://zrc.nl/api/v1/zaken/1", lambda: call(1)),
+                "relations": ("https://drc.nl/api/v1/objecten", lambda: call(2)),
+            }
+        )
+
+        self.assertEqual(results["object"].result(), 1)
+        self.assertEqual(results["relations"].result(), 2)
+
+    @override_settings(REMOTE_VALIDATION_MAX_PER_HOST=1)
+    def test_calls_per_host_are_limited(self):
+        lock = threading.Lock()
+        active, max_active = 0, 0
+
+        def call():
+            nonlocal active, max_active
+            with lock:
+                active += 1
+                max_active = max(max_active, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+
+        call_concurrently(
+            {
+                "object": ("https://zrc.nl/api/v1/zaken/1", call),
+                "relations": ("https://zrc.nl/api/v1/zaakcontactmomenten", call),
+            }
+        )
+
+        self.assertEqual(max_active, 1)
+
+    @override_settings(REMOTE_VALIDATION_DEADLINE=0.1)
+    def test_deadline(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        with self.assertRaises(RemoteTimeout):
+            call_concurrently(
+                {
+                    "object": ("https://zrc.nl/api/v1/zaken/1", lambda: 1),
+                    "relations": ("https://zrc.nl/api/v1/objecten", release.wait),
+                }
+            )
+
+    def test_exception_is_raised_by_result(self):
+        def fail():
+            raise ValueError("unavailable")
+
+        results = call_concurrently(
+            {
+                "object": ("https://zrc.nl/api/v1/zaken/1", fail),
+                "relations": ("https://zrc.nl/api/v1/objecten", lambda: []),
+            }
+        )
+
+        with self.assertRaisesMessage(ValueError, "unavailable"):
+            results["object"].result()
+        self.assertEqual(results["relations"].result(), [])
+
+    @override_settings(REMOTE_VALIDATION_CONCURRENT=False)
+    def test_disabled(self):
+        results = call_concurrently(
+            {
+                "object": ("https://zrc.nl/api/v1/zaken/1", threading.get_ident),
+                "relations": ("https://zrc.nl/api/v1/objecten", threading.get_ident),
+            }
+        )
+
+        self.assertEqual(results["object"].result(), threading.get_ident())
+        self.assertEqual(results["relations"].result(), threading.get_ident())
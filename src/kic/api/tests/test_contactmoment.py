@@ -1,5 +1,9 @@
 from datetime import datetime
+from unittest.mock import patch
 
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils.timezone import make_aware
 
 from rest_framework import status
@@ -14,6 +18,8 @@ from kic.datamodel.tests.factories import (
     MedewerkerFactory,
 )
 
+from ..serializers import ContactMomentSerializer
+
 
 class ContactMomentTests(JWTAuthMixin, APITestCase):
     heeft_alle_autorisaties = True
@@ -26,9 +32,28 @@ class ContactMomentTests(JWTAuthMixin, APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        data = response.json()
+        data = response.json()["results"]
         self.assertEqual(len(data), 2)
 
+    def test_list_contactmomenten_constant_number_of_queries(self):
+        list_url = reverse(ContactMoment)
+        MedewerkerFactory.create_batch(2)
+
+        with CaptureQueriesContext(connection) as few_contactmomenten:
+            response = self.client.get(list_url, {"pageSize": 500})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["results"]), 2)
+
+        MedewerkerFactory.create_batch(498)
+
+        with CaptureQueriesContext(connection) as many_contactmomenten:
+            response = self.client.get(list_url, {"pageSize": 500})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["results"]), 500)
+        self.assertEqual(len(many_contactmomenten), len(few_contactmomenten))
+
     def test_read_contactmoment(self):
         klant = KlantFactory.create()
         klant_url = reverse(klant)
@@ -231,3 +256,191 @@ class ContactMomentTests(JWTAuthMixin, APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertEqual(ContactMoment.objects.count(), 0)
+
+    def test_filter_klant(self):
+        contactmoment = ContactMomentFactory.create()
+        ContactMomentFactory.create()
+        klant_url = f"http://testserver.com{reverse(contactmoment.klant)}"
+
+        response = self.client.get(
+            reverse(ContactMoment), {"klant": klant_url}, HTTP_HOST="testserver.com"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()["results"]
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["klant"], klant_url)
+
+    def test_filter_interactiedatum(self):
+        for day in (1, 2, 3):
+            ContactMomentFactory.create(
+                interactiedatum=make_aware(datetime(2019, 1, day, 12))
+            )
+
+        response = self.client.get(
+            reverse(ContactMoment),
+            {
+                "interactiedatum__gte": "2019-01-02T00:00:00Z",
+                "interactiedatum__lte": "2019-01-02T23:59:59Z",
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()["results"]
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["interactiedatum"], "2019-01-02T12:00:00Z")
+
+    def test_filter_onderwerp_links(self):
+        contactmoment = ContactMomentFactory.create(
+            onderwerp_links=["http://example.com/product/1", "http://example.com/2"]
+        )
+        ContactMomentFactory.create(onderwerp_links=["http://example.com/product/2"])
+        ContactMomentFactory.create(onderwerp_links=[])
+
+        response = self.client.get(
+            reverse(ContactMoment),
+            {"onderwerpLinks__contains": "http://example.com/product/1"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()["results"]
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["url"], f"http://testserver{reverse(contactmoment)}")
+
+    def test_filter_kanaal_bronorganisatie_medewerker(self):
+        contactmoment = ContactMomentFactory.create(
+            kanaal="telefoon",
+            bronorganisatie="423182687",
+            medewerker="http://example.com/medewerker/1",
+        )
+        ContactMomentFactory.create(
+            kanaal="email",
+            bronorganisatie="423182687",
+            medewerker="http://example.com/medewerker/1",
+        )
+        ContactMomentFactory.create(
+            kanaal="telefoon",
+            bronorganisatie="423182687",
+            medewerker="http://example.com/medewerker/2",
+        )
+
+        response = self.client.get(
+            reverse(ContactMoment),
+            {
+                "kanaal": "telefoon",
+                "bronorganisatie": "423182687",
+                "medewerker": "http://example.com/medewerker/1",
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()["results"]
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["url"], f"http://testserver{reverse(contactmoment)}")
+
+
+class ContactMomentBulkTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+
+        self.klant_url = reverse(KlantFactory.create())
+        self.bulk_url = reverse("contactmoment-bulk")
+
+    def get_data(self, **kwargs) -> dict:
+        data = {
+            "bronorganisatie": "423182687",
+            "klant": self.klant_url,
+            "kanaal": "telephone",
+            "tekst": "some text",
+            "onderwerpLinks": [],
+            "initiatiefnemer": InitiatiefNemer.gemeente,
+            "medewerker": "http://example.com/medewerker/1",
+        }
+        data.update(kwargs)
+        return data
+
+    def test_bulk_create_contactmomenten(self):
+        data = [
+            self.get_data(tekst="first"),
+            self.get_data(
+                tekst="second",
+                medewerker="",
+                medewerkerIdentificatie={
+                    "identificatie": "12345",
+                    "achternaam": "Buurman",
+                    "voorletters": "B B",
+                },
+            ),
+        ]
+
+        response = self.client.post(self.bulk_url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+
+        first, second = ContactMoment.objects.order_by("pk")
+        self.assertEqual(first.tekst, "first")
+        self.assertFalse(hasattr(first, "medewerker_identificatie"))
+        self.assertEqual(second.tekst, "second")
+        self.assertEqual(second.medewerker_identificatie.identificatie, "12345")
+
+        results = response.json()
+        self.assertEqual(
+            [result["url"] for result in results],
+            [
+                f"http://testserver{reverse(first)}",
+                f"http://testserver{reverse(second)}",
+            ],
+        )
+        self.assertIsNone(results[0]["medewerkerIdentificatie"])
+        self.assertEqual(results[1]["medewerkerIdentificatie"]["achternaam"], "Buurman")
+
+    def test_bulk_create_constant_number_of_queries(self):
+        data = [self.get_data()] * 2
+
+        with CaptureQueriesContext(connection) as few:
+            self.client.post(self.bulk_url, data)
+
+        data = [self.get_data()] * 20
+
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.post(self.bulk_url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(ContactMoment.objects.count(), 22)
+        # only resolving the klant URL is done per item
+        self.assertEqual(len(many), len(few) + 18)
+
+    def test_bulk_create_invalid_item(self):
+        data = [self.get_data(), self.get_data(medewerker="")]
+
+        response = self.client.post(self.bulk_url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "1.nonFieldErrors")
+        self.assertEqual(error["code"], "invalid-medewerker")
+        self.assertFalse(ContactMoment.objects.exists())
+
+    @override_settings(BULK_CREATE_MAX_ITEMS=2)
+    def test_bulk_create_max_items(self):
+        data = [self.get_data()] * 3
+
+        response = self.client.post(self.bulk_url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "nonFieldErrors")
+        self.assertEqual(error["code"], "max-items")
+        self.assertFalse(ContactMoment.objects.exists())
+
+    @override_settings(BULK_CREATE_MAX_ITEMS=2)
+    def test_bulk_create_max_items_before_validating_items(self):
+        data = [self.get_data()] * 3
+
+        with patch.object(
+            ContactMomentSerializer, "to_internal_value"
+        ) as to_internal_value:
+            response = self.client.post(self.bulk_url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        to_internal_value.assert_not_called()
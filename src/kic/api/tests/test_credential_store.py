@@ -0,0 +1,72 @@
+from django.test import TestCase, override_settings
+
+from freezegun import freeze_time
+from vng_api_common.models import APICredential
+
+from ..auth import credential_store, get_auth, get_client_auth
+
+
+class CredentialStoreTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        credential_store.clear()
+        self.addCleanup(credential_store.clear)
+
+        APICredential.objects.create(
+            api_root="https://drc.example.com/api/v1/",
+            client_id="kic",
+            secret="secret",
+            user_id="kic",
+        )
+
+    def test_no_credentials(self):
+        self.assertIsNone(get_client_auth("https://zrc.example.com/api/v1/zaken"))
+        self.assertEqual(get_auth("https://zrc.example.com/api/v1/zaken"), {})
+
+    def test_credentials_are_cached(self):
+        url = "https://drc.example.com/api/v1/enkelvoudiginformatieobjecten/1234"
+        get_auth(url)
+
+        with self.assertNumQueries(0):
+            auth = get_auth(url)
+
+        self.assertTrue(auth["Authorization"].startswith("Bearer "))
+
+    def test_most_specific_api_root_is_used(self):
+        APICredential.objects.create(
+            api_root="https://drc.example.com/api/v1/enkelvoudiginformatieobjecten/",
+            client_id="specific",
+            secret="secret",
+            user_id="kic",
+        )
+
+        auth = get_client_auth(
+            "https://drc.example.com/api/v1/enkelvoudiginformatieobjecten/1234"
+        )
+
+        self.assertEqual(auth.client_id, "specific")
+
+    def test_change_invalidates_cache(self):
+        url = "https://drc.example.com/api/v1/enkelvoudiginformatieobjecten/1234"
+        get_client_auth(url)
+
+        APICredential.objects.update_or_create(
+            api_root="https://drc.example.com/api/v1/",
+            defaults={"client_id": "changed"},
+        )
+
+        self.assertEqual(get_client_auth(url).client_id, "changed")
+
+    @override_settings(JWT_EXPIRY=5 * 60)
+    def test_token_is_renewed_before_expiry(self):
+        url = "https://drc.example.com/api/v1/enkelvoudiginformatieobjecten/1234"
+
+        with freeze_time("2020-01-01 12:00:00"):
+            token = get_auth(url)["Authorization"]
+
+        with freeze_time("2020-01-01 12:03:00"):
+            self.assertEqual(get_auth(url)["Authorization"], token)
+
+        with freeze_time("2020-01-01 12:04:30"):
+            self.assertNotEqual(get_auth(url)["Authorization"], token)
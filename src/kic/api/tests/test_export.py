@@ -0,0 +1,96 @@
+import csv
+import json
+
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, reverse
+
+from kic.datamodel.tests.factories import (
+    ContactMomentFactory,
+    MedewerkerFactory,
+    VerzoekFactory,
+)
+
+
+def read_streaming_content(response) -> str:
+    return b"".join(response.streaming_content).decode("utf-8")
+
+
+@override_settings(EXPORT_CHUNK_SIZE=2)
+class ExportTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_export_contactmomenten_ndjson(self):
+        contactmomenten = ContactMomentFactory.create_batch(3)
+        medewerker = MedewerkerFactory.create(
+            contactmoment=contactmomenten[0], achternaam="Buurman"
+        )
+
+        response = self.client.get(reverse("contactmoment-export"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(
+            response["Content-Type"], "application/x-ndjson; charset=utf-8"
+        )
+
+        rows = [
+            json.loads(line) for line in read_streaming_content(response).splitlines()
+        ]
+        self.assertEqual(
+            [row["url"] for row in rows],
+            [f"http://testserver{reverse(obj)}" for obj in contactmomenten],
+        )
+        self.assertEqual(
+            rows[0]["medewerkerIdentificatie"]["achternaam"], medewerker.achternaam
+        )
+        self.assertIn("onderwerpLinks", rows[0])
+
+    def test_export_contactmomenten_csv(self):
+        contactmoment = ContactMomentFactory.create(onderwerp_links=["http://a.nl"])
+
+        response = self.client.get(reverse("contactmoment-export"), {"formaat": "csv"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+
+        header, row = csv.reader(read_streaming_content(response).splitlines())
+        row = dict(zip(header, row))
+        self.assertEqual(row["url"], f"http://testserver{reverse(contactmoment)}")
+        self.assertEqual(row["kanaal"], contactmoment.kanaal)
+        self.assertEqual(json.loads(row["onderwerpLinks"]), ["http://a.nl"])
+
+    def test_export_verzoeken_accept_header(self):
+        verzoek = VerzoekFactory.create()
+
+        response = self.client.get(reverse("verzoek-export"), HTTP_ACCEPT="text/csv")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        header, row = csv.reader(read_streaming_content(response).splitlines())
+        self.assertEqual(dict(zip(header, row))["identificatie"], verzoek.identificatie)
+
+    def test_export_unknown_format(self):
+        response = self.client.get(reverse("verzoek-export"), {"formaat": "xml"})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_export_constant_number_of_queries(self):
+        url = reverse("contactmoment-export")
+        MedewerkerFactory.create_batch(2)
+
+        with CaptureQueriesContext(connection) as few_contactmomenten:
+            response = self.client.get(url)
+            read_streaming_content(response)
+
+        MedewerkerFactory.create_batch(2)
+
+        with CaptureQueriesContext(connection) as many_contactmomenten:
+            response = self.client.get(url)
+            content = read_streaming_content(response)
+
+        self.assertEqual(len(content.splitlines()), 4)
+        self.assertEqual(len(many_contactmomenten), len(few_contactmomenten))
@@ -0,0 +1,201 @@
+import json
+import tempfile
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from kic.datamodel.constants import KlantType
+from kic.datamodel.models import Klant
+from kic.datamodel.tests.factories import (
+    AdresFactory,
+    KlantFactory,
+    NatuurlijkPersoonFactory,
+)
+
+
+def get_natuurlijk_persoon(bsn: str, **kwargs) -> dict:
+    data = {
+        "voornaam": "Samuel",
+        "achternaam": "Jackson",
+        "subjectType": KlantType.natuurlijk_persoon,
+        "subjectIdentificatie": {
+            "inpBsn": bsn,
+            "geslachtsnaam": "Jackson",
+            "verblijfsadres": {
+                "aoaIdentificatie": "1234",
+                "wplWoonplaatsNaam": "East Meaganchester",
+                "gorOpenbareRuimteNaam": "New Amsterdam",
+                "aoaHuisnummer": 21,
+            },
+            "subVerblijfBuitenland": {
+                "lndLandcode": "ABCD",
+                "lndLandnaam": "Hollywood",
+            },
+        },
+    }
+    data.update(kwargs)
+    return data
+
+
+class ImportKlantenTests(TestCase):
+    def import_klanten(self, *klanten, **options):
+        with tempfile.NamedTemporaryFile("w", suffix=".ndjson") as ndjson_file:
+            for klant in klanten:
+                line = klant if isinstance(klant, str) else json.dumps(klant)
+                ndjson_file.write(f"{line}\n")
+            ndjson_file.flush()
+
+            stdout = StringIO()
+            options.setdefault("stderr", StringIO())
+            call_command(
+                "import_klanten", ndjson_file.name, stdout=stdout, **options,
+            )
+        return stdout.getvalue()
+
+    def test_import_new_klanten(self):
+        output = self.import_klanten(
+            get_natuurlijk_persoon("111222333"),
+            {
+                "voornaam": "Xavier",
+                "subject": "http://example.com/subject/1",
+                "subjectType": KlantType.vestiging,
+                "subjectIdentificatie": {
+                    "vestigingsNummer": "123",
+                    "handelsnaam": ["WB"],
+                },
+            },
+        )
+
+        self.assertEqual(output, "Created 2 and updated 0 klanten\n")
+
+        natuurlijk_persoon = Klant.objects.get(voornaam="Samuel").natuurlijk_persoon
+        self.assertEqual(natuurlijk_persoon.inp_bsn, "111222333")
+        self.assertEqual(natuurlijk_persoon.verblijfsadres.aoa_huisnummer, 21)
+        self.assertEqual(
+            natuurlijk_persoon.sub_verblijf_buitenland.lnd_landnaam, "Hollywood"
+        )
+
+        vestiging = Klant.objects.get(voornaam="Xavier").vestiging
+        self.assertEqual(vestiging.vestigings_nummer, "123")
+        self.assertEqual(vestiging.handelsnaam, ["WB"])
+
+    def test_upsert_on_bsn(self):
+        klant = KlantFactory.create(
+            subject="", subject_type=KlantType.natuurlijk_persoon
+        )
+        natuurlijk_persoon = NatuurlijkPersoonFactory.create(
+            klant=klant, inp_bsn="111222333"
+        )
+        AdresFactory.create(natuurlijkpersoon=natuurlijk_persoon, aoa_huisnummer=1)
+
+        output = self.import_klanten(
+            get_natuurlijk_persoon("111222333", voornaam="Updated")
+        )
+
+        self.assertEqual(output, "Created 0 and updated 1 klanten\n")
+        klant = Klant.objects.get()
+        self.assertEqual(klant.voornaam, "Updated")
+        self.assertEqual(klant.natuurlijk_persoon.verblijfsadres.aoa_huisnummer, 21)
+
+    def test_upsert_on_subject(self):
+        KlantFactory.create(subject="http://example.com/subject/1", voornaam="Old")
+
+        self.import_klanten(
+            {
+                "voornaam": "New",
+                "subject": "http://example.com/subject/1",
+                "subjectType": KlantType.natuurlijk_persoon,
+            }
+        )
+
+        self.assertEqual(Klant.objects.get().voornaam, "New")
+
+    def test_upsert_without_subject_identificatie_keeps_it(self):
+        klant = KlantFactory.create(
+            subject="http://example.com/subject/1",
+            subject_type=KlantType.natuurlijk_persoon,
+        )
+        natuurlijk_persoon = NatuurlijkPersoonFactory.create(
+            klant=klant, inp_bsn="111222333"
+        )
+        AdresFactory.create(natuurlijkpersoon=natuurlijk_persoon, aoa_huisnummer=1)
+
+        self.import_klanten(
+            {
+                "voornaam": "New",
+                "subject": "http://example.com/subject/1",
+                "subjectType": KlantType.natuurlijk_persoon,
+            }
+        )
+
+        klant = Klant.objects.get()
+        self.assertEqual(klant.voornaam, "New")
+        self.assertEqual(klant.natuurlijk_persoon.inp_bsn, "111222333")
+        self.assertEqual(klant.natuurlijk_persoon.verblijfsadres.aoa_huisnummer, 1)
+
+    def test_lines_matching_same_klant_on_subject_and_bsn(self):
+        klant = KlantFactory.create(
+            subject="http://example.com/subject/1",
+            subject_type=KlantType.natuurlijk_persoon,
+        )
+        NatuurlijkPersoonFactory.create(klant=klant, inp_bsn="111222333")
+
+        stderr = StringIO()
+        with self.assertRaisesMessage(CommandError, "1 klanten could not be imported"):
+            self.import_klanten(
+                get_natuurlijk_persoon(
+                    "123456782",
+                    voornaam="By subject",
+                    subject="http://example.com/subject/1",
+                ),
+                get_natuurlijk_persoon("111222333", voornaam="By BSN"),
+                stderr=stderr,
+            )
+
+        self.assertIn("Line 2: ", stderr.getvalue())
+        self.assertIn("Matches the same klant as line 1.", stderr.getvalue())
+        klant = Klant.objects.get()
+        self.assertEqual(klant.voornaam, "By subject")
+        self.assertEqual(klant.natuurlijk_persoon.inp_bsn, "123456782")
+
+    def test_last_duplicate_wins(self):
+        self.import_klanten(
+            get_natuurlijk_persoon("111222333", voornaam="First"),
+            get_natuurlijk_persoon("111222333", voornaam="Second"),
+        )
+
+        self.assertEqual(Klant.objects.get().voornaam, "Second")
+
+    def test_invalid_lines_are_reported(self):
+        with self.assertRaisesMessage(CommandError, "2 klanten could not be imported"):
+            self.import_klanten(
+                get_natuurlijk_persoon("123456789"),
+                "{not json",
+                get_natuurlijk_persoon("111222333"),
+            )
+
+        self.assertEqual(Klant.objects.get().natuurlijk_persoon.inp_bsn, "111222333")
+
+    def test_queries_per_chunk(self):
+        vestiging = {
+            "voornaam": "Xavier",
+            "subjectType": KlantType.vestiging,
+            "subjectIdentificatie": {"vestigingsNummer": "123"},
+        }
+
+        with CaptureQueriesContext(connection) as single:
+            self.import_klanten(get_natuurlijk_persoon("111222333"), vestiging)
+
+        with CaptureQueriesContext(connection) as many:
+            self.import_klanten(
+                get_natuurlijk_persoon("123456782"),
+                get_natuurlijk_persoon("999999990"),
+                *[vestiging] * 8,
+                chunk_size=10,
+            )
+
+        self.assertEqual(Klant.objects.count(), 12)
+        self.assertEqual(len(many), len(single))
@@ -1,3 +1,10 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
 from rest_framework import status
 from rest_framework.test import APITestCase
 from vng_api_common.tests import JWTAuthMixin, get_validation_errors, reverse
@@ -28,7 +35,7 @@ class KlantTests(JWTAuthMixin, APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        data = response.json()
+        data = response.json()["results"]
         self.assertEqual(len(data), 2)
 
     def test_read_klant_url(self):
@@ -671,3 +678,223 @@ class KlantTests(JWTAuthMixin, APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertEqual(Klant.objects.count(), 0)
+
+    def test_filter_subject(self):
+        klant = KlantFactory.create(subject=SUBJECT)
+        KlantFactory.create(subject="http://example.com/subject/2")
+
+        response = self.client.get(reverse(Klant), {"subject": SUBJECT})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()["results"]
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["url"], f"http://testserver{reverse(klant)}")
+
+    def test_filter_subject_type(self):
+        KlantFactory.create(subject_type=KlantType.natuurlijk_persoon)
+        KlantFactory.create(subject_type=KlantType.vestiging)
+
+        response = self.client.get(reverse(Klant), {"subjectType": KlantType.vestiging})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()["results"]
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["subjectType"], KlantType.vestiging)
+
+    def test_filter_bsn(self):
+        klant = KlantFactory.create(subject_type=KlantType.natuurlijk_persoon)
+        NatuurlijkPersoonFactory.create(klant=klant, inp_bsn="111222333")
+        NatuurlijkPersoonFactory.create(inp_bsn="123456782")
+
+        response = self.client.get(
+            reverse(Klant), {"subjectNatuurlijkPersoon__inpBsn": "111222333"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()["results"]
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["subjectIdentificatie"]["inpBsn"], "111222333")
+
+    def test_filter_kvk_nummer(self):
+        klant = KlantFactory.create(subject_type=KlantType.niet_natuurlijk_persoon)
+        NietNatuurlijkPersoonFactory.create(klant=klant, inn_nnp_id="111222333")
+        NietNatuurlijkPersoonFactory.create(inn_nnp_id="123456782")
+
+        response = self.client.get(
+            reverse(Klant), {"subjectNietNatuurlijkPersoon__innNnpId": "111222333"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()["results"]
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["subjectIdentificatie"]["innNnpId"], "111222333")
+
+    def test_filter_vestigingsnummer(self):
+        klant = KlantFactory.create(subject_type=KlantType.vestiging)
+        VestigingFactory.create(klant=klant, vestigings_nummer="123")
+        VestigingFactory.create(vestigings_nummer="456")
+
+        response = self.client.get(
+            reverse(Klant), {"subjectVestiging__vestigingsNummer": "123"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()["results"]
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["subjectIdentificatie"]["vestigingsNummer"], "123")
+
+    def test_filter_contactgegevens(self):
+        klant = KlantFactory.create(
+            emailadres="klant@example.com", telefoonnummer="0612345678"
+        )
+        KlantFactory.create(emailadres="klant@example.com", telefoonnummer="")
+        KlantFactory.create(emailadres="", telefoonnummer="0612345678")
+
+        response = self.client.get(
+            reverse(Klant),
+            {"emailadres": "klant@example.com", "telefoonnummer": "0612345678"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()["results"]
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["url"], f"http://testserver{reverse(klant)}")
+
+    def test_filter_unknown_query_param(self):
+        response = self.client.get(reverse(Klant), {"bsn": "111222333"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class KlantQueryCountTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    @staticmethod
+    def _create_klanten(amount: int):
+        subject_types = [
+            KlantType.natuurlijk_persoon,
+            KlantType.niet_natuurlijk_persoon,
+            KlantType.vestiging,
+        ]
+        for i in range(amount):
+            subject_type = subject_types[i % len(subject_types)]
+            klant = KlantFactory.create(subject_type=subject_type)
+
+            if subject_type == KlantType.natuurlijk_persoon:
+                natuurlijkpersoon = NatuurlijkPersoonFactory.create(klant=klant)
+                AdresFactory.create(natuurlijkpersoon=natuurlijkpersoon)
+                SubVerblijfBuitenlandFactory.create(natuurlijkpersoon=natuurlijkpersoon)
+            elif subject_type == KlantType.niet_natuurlijk_persoon:
+                NietNatuurlijkPersoonFactory.create(klant=klant)
+            else:
+                vestiging = VestigingFactory.create(klant=klant)
+                AdresFactory.create(natuurlijkpersoon=None, vestiging=vestiging)
+
+    def test_list_klanten_constant_number_of_queries(self):
+        list_url = reverse(Klant)
+        self._create_klanten(3)
+
+        with CaptureQueriesContext(connection) as few_klanten:
+            response = self.client.get(list_url, {"pageSize": 500})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["results"]), 3)
+
+        self._create_klanten(497)
+
+        with CaptureQueriesContext(connection) as many_klanten:
+            response = self.client.get(list_url, {"pageSize": 500})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["results"]), 500)
+        self.assertEqual(len(many_klanten), len(few_klanten))
+
+
+class KlantZoekTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+
+        self.zoek_url = reverse("klant--zoek")
+
+    def test_zoek_natuurlijk_persoon(self):
+        klant = KlantFactory.create(
+            voornaam="", achternaam="", subject_type=KlantType.natuurlijk_persoon
+        )
+        natuurlijk_persoon = NatuurlijkPersoonFactory.create(
+            klant=klant, geslachtsnaam="Jansen"
+        )
+        AdresFactory.create(
+            natuurlijkpersoon=natuurlijk_persoon,
+            gor_openbare_ruimte_naam="Keizersgracht",
+            aoa_postcode="1015CJ",
+        )
+        KlantFactory.create(voornaam="Piet", achternaam="Pietersen")
+
+        for zoekterm in ("jansen", "Janssen", "keizersgracht", "1015cj"):
+            with self.subTest(zoekterm=zoekterm):
+                response = self.client.post(self.zoek_url, {"zoekterm": zoekterm})
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                data = response.json()
+                self.assertEqual(data["count"], 1)
+                self.assertEqual(
+                    data["results"][0]["url"], f"http://testserver{reverse(klant)}"
+                )
+
+    def test_zoek_handelsnaam(self):
+        klant = KlantFactory.create(subject_type=KlantType.vestiging)
+        VestigingFactory.create(klant=klant, handelsnaam=["Bakkerij de Korenbloem"])
+
+        response = self.client.post(self.zoek_url, {"zoekterm": "korenbloem"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 1)
+
+    def test_zoek_ranking(self):
+        close = KlantFactory.create(voornaam="Jan", achternaam="Jansens")
+        exact = KlantFactory.create(voornaam="Jan", achternaam="Jansen")
+
+        response = self.client.post(self.zoek_url, {"zoekterm": "jansen"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [klant["url"] for klant in response.json()["results"]],
+            [
+                f"http://testserver{reverse(exact)}",
+                f"http://testserver{reverse(close)}",
+            ],
+        )
+
+    def test_zoektekst_updated(self):
+        klant = KlantFactory.create(voornaam="Jan", achternaam="Jansen", adres="")
+        klant.voornaam = "Klaas"
+        klant.achternaam = "Pietersen"
+        klant.save()
+
+        response = self.client.post(self.zoek_url, {"zoekterm": "jansen"})
+
+        self.assertEqual(response.json()["count"], 0)
+        klant.refresh_from_db()
+        self.assertEqual(klant.zoektekst, "klaas pietersen")
+
+    def test_zoek_zoekterm_too_short(self):
+        response = self.client.post(self.zoek_url, {"zoekterm": "ja"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "zoekterm")
+        self.assertEqual(error["code"], "min_length")
+
+
+class BenchmarkKlantLookupsTests(TestCase):
+    def test_command(self):
+        stdout = StringIO()
+
+        call_command("benchmark_klant_lookups", klanten=30, lookups=5, stdout=stdout)
+
+        output = stdout.getvalue()
+        self.assertIn("subject_natuurlijk_persoon__inp_bsn: median", output)
+        self.assertIn("subject_vestiging__vestigings_nummer: median", output)
+        # the KLANTen are removed again
+        self.assertFalse(Klant.objects.exists())
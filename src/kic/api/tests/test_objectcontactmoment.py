@@ -15,12 +15,20 @@ from kic.datamodel.tests.factories import (
     ObjectContactMomentFactory,
 )
 
+from ..validators import remote_relation_cache
+
 ZAAK = "http://example.com/api/v1/zaken/1"
 
 
 class ObjectContactMomentTests(JWTAuthMixin, APITestCase):
     heeft_alle_autorisaties = True
 
+    def setUp(self):
+        super().setUp()
+
+        remote_relation_cache.clear()
+        self.addCleanup(remote_relation_cache.clear)
+
     def test_list_objectcontactmomenten(self):
         list_url = reverse(ObjectContactMoment)
         ObjectContactMomentFactory.create_batch(2)
@@ -29,7 +37,7 @@ class ObjectContactMomentTests(JWTAuthMixin, APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        data = response.json()
+        data = response.json()["results"]
         self.assertEqual(len(data), 2)
 
     def test_read_objectcontactmoment(self):
@@ -181,9 +189,9 @@ class ObjectContactMomentFilterTests(JWTAuthMixin, APITestCase):
         )
 
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data["results"]), 1)
         self.assertEqual(
-            response.data[0]["contactmoment"],
+            response.data["results"][0]["contactmoment"],
             f"http://testserver.com{contactmoment_url}",
         )
 
@@ -193,5 +201,5 @@ class ObjectContactMomentFilterTests(JWTAuthMixin, APITestCase):
         response = self.client.get(self.list_url, {"object": oio.object})
 
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]["object"], oio.object)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["results"][0]["object"], oio.object)
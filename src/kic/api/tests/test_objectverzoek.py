@@ -12,12 +12,20 @@ from kic.datamodel.constants import ObjectTypes
 from kic.datamodel.models import ObjectVerzoek
 from kic.datamodel.tests.factories import ObjectVerzoekFactory, VerzoekFactory
 
+from ..validators import remote_relation_cache
+
 ZAAK = "http://example.com/api/v1/zaken/1"
 
 
 class ObjectVerzoekTests(JWTAuthMixin, APITestCase):
     heeft_alle_autorisaties = True
 
+    def setUp(self):
+        super().setUp()
+
+        remote_relation_cache.clear()
+        self.addCleanup(remote_relation_cache.clear)
+
     def test_list_objectverzoeken(self):
         list_url = reverse(ObjectVerzoek)
         ObjectVerzoekFactory.create_batch(2)
@@ -26,7 +34,7 @@ class ObjectVerzoekTests(JWTAuthMixin, APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        data = response.json()
+        data = response.json()["results"]
         self.assertEqual(len(data), 2)
 
     def test_read_objectverzoek(self):
@@ -172,9 +180,10 @@ class ObjectVerzoekFilterTests(JWTAuthMixin, APITestCase):
         )
 
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data["results"]), 1)
         self.assertEqual(
-            response.data[0]["verzoek"], f"http://testserver.com{verzoek_url}"
+            response.data["results"][0]["verzoek"],
+            f"http://testserver.com{verzoek_url}",
         ),
 
     def test_filter_object(self):
@@ -183,5 +192,5 @@ class ObjectVerzoekFilterTests(JWTAuthMixin, APITestCase):
         response = self.client.get(self.list_url, {"object": oio.object})
 
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]["object"], oio.object)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["results"][0]["object"], oio.object)
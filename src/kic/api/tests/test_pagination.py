@@ -0,0 +1,94 @@
+from django.test import SimpleTestCase, override_settings
+
+from rest_framework import status
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, reverse
+
+from kic.datamodel.models import Klant, ObjectContactMoment
+from kic.datamodel.tests.factories import KlantFactory, ObjectContactMomentFactory
+
+from ..pagination import PageNumberPagination
+from ..viewsets import KlantViewSet
+
+
+class CursorPaginationTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_pagination_follow_next_and_previous(self):
+        klanten = KlantFactory.create_batch(3)
+        list_url = reverse(Klant)
+
+        response = self.client.get(list_url, {"pageSize": 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertIsNone(data["previous"])
+        self.assertIsNotNone(data["next"])
+        # newest first
+        self.assertEqual(
+            [klant["url"] for klant in data["results"]],
+            [f"http://testserver{reverse(klant)}" for klant in klanten[:0:-1]],
+        )
+
+        response = self.client.get(data["next"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertIsNone(data["next"])
+        self.assertIsNotNone(data["previous"])
+        self.assertEqual(len(data["results"]), 1)
+        self.assertEqual(
+            data["results"][0]["url"], f"http://testserver{reverse(klanten[0])}"
+        )
+
+    @override_settings(MAX_PAGE_SIZE=2)
+    def test_page_size_is_capped(self):
+        KlantFactory.create_batch(3)
+        list_url = reverse(Klant)
+
+        response = self.client.get(list_url, {"pageSize": 100})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["results"]), 2)
+
+    @override_settings(PAGE_SIZE=2)
+    def test_page_size_setting(self):
+        KlantFactory.create_batch(3)
+
+        response = self.client.get(reverse(Klant))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["results"]), 2)
+
+    def test_pagination_params_are_known_query_params(self):
+        ObjectContactMomentFactory.create_batch(2)
+        list_url = reverse(ObjectContactMoment)
+
+        response = self.client.get(list_url, {"pageSize": 1})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(len(data["results"]), 1)
+
+        response = self.client.get(data["next"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["results"]), 1)
+
+
+class KnownQueryParamsTests(SimpleTestCase):
+    def get_known_query_params(self, pagination_class) -> set:
+        viewset = KlantViewSet(action="list", request=None, format_kwarg=None)
+        viewset.pagination_class = pagination_class
+        return viewset.get_known_query_params()
+
+    def test_page_number_params(self):
+        known_params = self.get_known_query_params(PageNumberPagination)
+
+        self.assertLessEqual({"page", "pageSize"}, known_params)
+
+    def test_params_of_other_paginators(self):
+        known_params = self.get_known_query_params(LimitOffsetPagination)
+
+        self.assertLessEqual({"limit", "offset"}, known_params)
@@ -0,0 +1,145 @@
+"""
+Guard the number of queries of the list and retrieve actions.
+
+For every resource of the router the objects are created twice, ``N`` and
+``10 * N`` of them. The number of queries must be the same both times, and
+within the budget in ``query_budgets.yaml``.
+"""
+import os
+from itertools import cycle
+
+from django.contrib.sites.models import Site
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+import yaml
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, reverse
+
+from kic.datamodel.constants import KlantType
+from kic.datamodel.tests.factories import (
+    AdresFactory,
+    KlantFactory,
+    MedewerkerFactory,
+    NatuurlijkPersoonFactory,
+    NietNatuurlijkPersoonFactory,
+    ObjectContactMomentFactory,
+    ObjectVerzoekFactory,
+    SubVerblijfBuitenlandFactory,
+    VerzoekContactMomentFactory,
+    VerzoekFactory,
+    VerzoekInformatieObjectFactory,
+    VerzoekProductFactory,
+    VestigingFactory,
+)
+
+from ..urls import router
+
+BUDGETS_FILE = os.path.join(os.path.dirname(__file__), "query_budgets.yaml")
+
+N = 3
+
+
+def create_klanten(count: int) -> list:
+    klanten = []
+    for subject_type, _ in zip(cycle(KlantType.values), range(count)):
+        klant = KlantFactory.create(subject_type=subject_type)
+        if subject_type == KlantType.natuurlijk_persoon:
+            natuurlijk_persoon = NatuurlijkPersoonFactory.create(klant=klant)
+            AdresFactory.create(natuurlijkpersoon=natuurlijk_persoon)
+            SubVerblijfBuitenlandFactory.create(natuurlijkpersoon=natuurlijk_persoon)
+        elif subject_type == KlantType.niet_natuurlijk_persoon:
+            NietNatuurlijkPersoonFactory.create(klant=klant)
+        else:
+            vestiging = VestigingFactory.create(klant=klant)
+            AdresFactory.create(natuurlijkpersoon=None, vestiging=vestiging)
+        klanten.append(klant)
+    return klanten
+
+
+def create_contactmomenten(count: int) -> list:
+    return [
+        medewerker.contactmoment for medewerker in MedewerkerFactory.create_batch(count)
+    ]
+
+
+# create the objects of the resources of the router
+FACTORIES = {
+    "klanten": create_klanten,
+    "contactmomenten": create_contactmomenten,
+    "objectcontactmomenten": ObjectContactMomentFactory.create_batch,
+    "verzoeken": VerzoekFactory.create_batch,
+    "objectverzoeken": ObjectVerzoekFactory.create_batch,
+    "verzoekinformatieobjecten": VerzoekInformatieObjectFactory.create_batch,
+    "verzoekcontactmomenten": VerzoekContactMomentFactory.create_batch,
+    "verzoekproducten": VerzoekProductFactory.create_batch,
+}
+
+
+class QueryBudgetTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        with open(BUDGETS_FILE) as infile:
+            cls.budgets = yaml.safe_load(infile)
+
+    def setUp(self):
+        super().setUp()
+
+        # the configuration of the authorization and the current site (to
+        # calculate the ETags) are cached by the first request
+        response = self.client.get(reverse("klant-list"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        Site.objects.get_current()
+
+    def count_queries(self, url: str, **params) -> int:
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(queries)
+
+    def assertWithinBudget(self, prefix: str, action: str, counts: list):
+        budget = self.budgets[prefix][action]
+        self.assertEqual(
+            counts[0],
+            counts[1],
+            f"The number of queries of {prefix} {action} depends on the number "
+            f"of objects: {counts[0]} with {N}, {counts[1]} with {10 * N}.",
+        )
+        self.assertLessEqual(
+            counts[0],
+            budget,
+            f"{prefix} {action} does {counts[0]} queries, the budget is {budget}.",
+        )
+
+    def test_all_resources_have_a_budget(self):
+        prefixes = {prefix for prefix, viewset, basename in router.registry}
+
+        self.assertEqual(prefixes, set(self.budgets))
+        self.assertEqual(prefixes, set(FACTORIES))
+
+    def test_list(self):
+        for prefix, viewset, basename in router.registry:
+            with self.subTest(prefix=prefix):
+                list_url = reverse(f"{basename}-list")
+                counts = []
+                for count in (N, 10 * N):
+                    FACTORIES[prefix](count)
+                    counts.append(self.count_queries(list_url, pageSize=500))
+
+                self.assertWithinBudget(prefix, "list", counts)
+
+    def test_retrieve(self):
+        for prefix, viewset, basename in router.registry:
+            with self.subTest(prefix=prefix):
+                counts = []
+                for count in (N, 10 * N):
+                    obj = FACTORIES[prefix](count)[-1]
+                    counts.append(self.count_queries(reverse(obj)))
+
+                self.assertWithinBudget(prefix, "retrieve", counts)
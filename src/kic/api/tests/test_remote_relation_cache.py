@@ -0,0 +1,144 @@
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase, override_settings
+
+from freezegun import freeze_time
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, get_validation_errors, reverse
+
+from kic.datamodel.constants import ObjectTypes
+from kic.datamodel.models import ObjectContactMoment, ObjectVerzoek
+from kic.datamodel.tests.factories import (
+    ContactMomentFactory,
+    ObjectContactMomentFactory,
+    VerzoekFactory,
+)
+
+from ..validators import RemoteRelationCache, remote_relation_cache
+
+ZAAK = "http://example.com/api/v1/zaken/1"
+
+
+@override_settings(REMOTE_RELATION_CACHE_TIMEOUT=60)
+class RemoteRelationCacheTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.cache = RemoteRelationCache()
+        self.cache.clear()
+        self.addCleanup(self.cache.clear)
+
+    def test_expires(self):
+        with freeze_time("2020-01-01T12:00:00Z"):
+            self.cache.add((ZAAK, "zaak"))
+
+        with freeze_time("2020-01-01T12:00:59Z"):
+            self.assertIn((ZAAK, "zaak"), self.cache)
+
+        with freeze_time("2020-01-01T12:01:00Z"):
+            self.assertNotIn((ZAAK, "zaak"), self.cache)
+
+    def test_shared_between_instances(self):
+        RemoteRelationCache().add((ZAAK, "contactmoment", "1"))
+
+        self.assertIn((ZAAK, "contactmoment", "1"), self.cache)
+
+    def test_forget(self):
+        self.cache.add((ZAAK, "zaak"))
+        self.cache.add((ZAAK, "contactmoment", "1"))
+        self.cache.add(("http://example.com/api/v1/zaken/2", "zaak"))
+
+        self.cache.forget((ZAAK, "zaak"), (ZAAK, "contactmoment", "1"))
+
+        self.assertNotIn((ZAAK, "zaak"), self.cache)
+        self.assertNotIn((ZAAK, "contactmoment", "1"), self.cache)
+        self.assertIn(("http://example.com/api/v1/zaken/2", "zaak"), self.cache)
+
+
+class CreateValidatorCacheTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+
+        remote_relation_cache.clear()
+        self.addCleanup(remote_relation_cache.clear)
+
+        patcher = patch("kic.api.validators.ResourceValidator")
+        self.resource_validator = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.client_class = MagicMock()
+        self.list_relations = self.client_class.from_url.return_value.list
+        self.list_relations.return_value = [{"zaak": ZAAK}]
+        patcher = patch(
+            "kic.api.validators.import_string", return_value=self.client_class
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def create(self, list_url: str, data: dict) -> None:
+        response = self.client.post(list_url, data)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+
+    def test_retried_create_skips_remote_calls(self):
+        contactmoment_url = reverse(ContactMomentFactory.create())
+        data = {
+            "contactmoment": contactmoment_url,
+            "objectType": ObjectTypes.zaak,
+            "object": ZAAK,
+        }
+
+        self.create(reverse(ObjectContactMoment), data)
+        response = self.client.post(reverse(ObjectContactMoment), data)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "nonFieldErrors")
+        self.assertEqual(error["code"], "unique")
+        self.resource_validator.return_value.assert_called_once_with(ZAAK)
+        self.list_relations.assert_called_once()
+
+    def test_missing_relation_is_not_cached(self):
+        data = {
+            "verzoek": reverse(VerzoekFactory.create()),
+            "objectType": ObjectTypes.zaak,
+            "object": ZAAK,
+        }
+        self.list_relations.return_value = []
+
+        response = self.client.post(reverse(ObjectVerzoek), data)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.list_relations.return_value = [{"zaak": ZAAK}]
+        self.create(reverse(ObjectVerzoek), data)
+
+        self.assertEqual(self.list_relations.call_count, 2)
+        # the ZAAK itself was found the first time
+        self.resource_validator.return_value.assert_called_once_with(ZAAK)
+
+    def test_destroy_forgets_relation(self):
+        objectcontactmoment = ObjectContactMomentFactory.create(
+            object=ZAAK, object_type=ObjectTypes.zaak
+        )
+        contactmoment_url = reverse(objectcontactmoment.contactmoment)
+        data = {
+            "contactmoment": contactmoment_url,
+            "objectType": ObjectTypes.zaak,
+            "object": ZAAK,
+        }
+        remote_relation_cache.add((ZAAK, ObjectTypes.zaak))
+        remote_relation_cache.add(
+            (ZAAK, "contactmoment", str(objectcontactmoment.contactmoment.uuid))
+        )
+        self.list_relations.return_value = []
+
+        response = self.client.delete(reverse(objectcontactmoment))
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        response = self.client.post(reverse(ObjectContactMoment), data)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.resource_validator.return_value.assert_called_once_with(ZAAK)
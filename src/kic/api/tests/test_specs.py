@@ -0,0 +1,82 @@
+import os
+import tempfile
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, override_settings
+
+from requests import Response
+from vng_api_common.oas import fetcher
+
+from ..specs import load_specs
+
+SPEC_URL = "https://zrc.example.com/api/v1/schema/openapi.yaml"
+SPEC = "openapi: 3.0.0\ncomponents:\n  schemas:\n    Zaak:\n      properties: {}\n"
+
+
+def get_response(status_code: int, content: str) -> Response:
+    response = Response()
+    response.status_code = status_code
+    response._content = content.encode("utf-8")
+    response.encoding = "utf-8"
+    return response
+
+
+class SpecStoreTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        spec_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(spec_dir.cleanup)
+        self.spec_dir = spec_dir.name
+
+        overrides = override_settings(
+            API_SPEC_DIR=self.spec_dir, API_SPECS={"zrc": SPEC_URL}
+        )
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+
+        self.addCleanup(fetcher.cache.pop, SPEC_URL, None)
+
+    def write_spec(self, source: str):
+        with open(os.path.join(self.spec_dir, "zrc.yaml"), "w") as spec_file:
+            spec_file.write(f"# source: {source}\n{SPEC}")
+
+    def test_load_specs(self):
+        self.write_spec(SPEC_URL)
+
+        load_specs()
+
+        self.assertIn("Zaak", fetcher.cache[SPEC_URL]["components"]["schemas"])
+
+    def test_outdated_spec_is_ignored(self):
+        self.write_spec("https://zrc.example.com/api/v0/schema/openapi.yaml")
+
+        load_specs()
+
+        self.assertNotIn(SPEC_URL, fetcher.cache)
+
+    def test_missing_spec_is_ignored(self):
+        load_specs()
+
+        self.assertNotIn(SPEC_URL, fetcher.cache)
+
+    @patch("requests.get", return_value=get_response(200, SPEC))
+    def test_refresh_command(self, m):
+        call_command("refresh_api_specs", stdout=StringIO())
+
+        m.assert_called_once_with(SPEC_URL)
+        self.assertIn(SPEC_URL, fetcher.cache)
+
+        del fetcher.cache[SPEC_URL]
+        load_specs()
+
+        self.assertIn("Zaak", fetcher.cache[SPEC_URL]["components"]["schemas"])
+
+    @patch("requests.get", return_value=get_response(200, "swagger: '2.0'\n"))
+    def test_refresh_command_unsupported_spec(self, m):
+        with self.assertRaises(CommandError):
+            call_command("refresh_api_specs", stdout=StringIO())
+
+        self.assertFalse(os.path.exists(os.path.join(self.spec_dir, "zrc.yaml")))
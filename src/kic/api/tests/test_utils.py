@@ -0,0 +1,74 @@
+import time
+import uuid
+from unittest.mock import patch
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.test import TestCase, override_settings
+
+from ..utils import clear_base_url_cache, get_absolute_url
+
+
+@override_settings(IS_HTTPS=True)
+class GetAbsoluteUrlTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        site = Site.objects.get_current()
+        site.domain = "kic.example.com"
+        site.save()
+
+        self.addCleanup(clear_base_url_cache)
+        self.addCleanup(Site.objects.clear_cache)
+
+    def test_build_detail_url(self):
+        _uuid = uuid.uuid4()
+
+        url = get_absolute_url("verzoek-detail", uuid=_uuid)
+
+        self.assertEqual(url, f"https://kic.example.com/api/v1/verzoeken/{_uuid}")
+
+    def test_no_queries_once_resolved(self):
+        get_absolute_url("verzoek-detail", uuid=uuid.uuid4())
+
+        with self.assertNumQueries(0):
+            get_absolute_url("contactmoment-detail", uuid=uuid.uuid4())
+
+    def test_site_change_invalidates_domain(self):
+        _uuid = uuid.uuid4()
+        get_absolute_url("verzoek-detail", uuid=_uuid)
+
+        site = Site.objects.get_current()
+        site.domain = "other.example.com"
+        site.save()
+
+        url = get_absolute_url("verzoek-detail", uuid=_uuid)
+
+        self.assertEqual(url, f"https://other.example.com/api/v1/verzoeken/{_uuid}")
+
+    def test_setting_change_invalidates_protocol(self):
+        _uuid = uuid.uuid4()
+        get_absolute_url("verzoek-detail", uuid=_uuid)
+
+        with override_settings(IS_HTTPS=False):
+            url = get_absolute_url("verzoek-detail", uuid=_uuid)
+
+        self.assertEqual(url, f"http://kic.example.com/api/v1/verzoeken/{_uuid}")
+
+    def test_domain_changed_by_other_process(self):
+        _uuid = uuid.uuid4()
+        get_absolute_url("verzoek-detail", uuid=_uuid)
+
+        # no signals, like a save in another process
+        Site.objects.update(domain="other.example.com")
+
+        with self.subTest("cached"):
+            url = get_absolute_url("verzoek-detail", uuid=_uuid)
+
+            self.assertEqual(url, f"https://kic.example.com/api/v1/verzoeken/{_uuid}")
+
+        expired = time.monotonic() + settings.SITE_URL_CACHE_TIMEOUT + 1
+        with self.subTest("expired"), patch("time.monotonic", return_value=expired):
+            url = get_absolute_url("verzoek-detail", uuid=_uuid)
+
+            self.assertEqual(url, f"https://other.example.com/api/v1/verzoeken/{_uuid}")
@@ -1,5 +1,7 @@
 from datetime import datetime
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils.timezone import make_aware
 
 from rest_framework import status
@@ -7,7 +9,7 @@ from rest_framework.test import APITestCase
 from vng_api_common.tests import JWTAuthMixin, reverse
 
 from kic.datamodel.constants import VerzoekStatus
-from kic.datamodel.models import Verzoek
+from kic.datamodel.models import Verzoek, Volgnummer
 from kic.datamodel.tests.factories import KlantFactory, VerzoekFactory
 
 
@@ -22,9 +24,28 @@ class VerzoekTests(JWTAuthMixin, APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        data = response.json()
+        data = response.json()["results"]
         self.assertEqual(len(data), 2)
 
+    def test_list_verzoeken_constant_number_of_queries(self):
+        list_url = reverse(Verzoek)
+        VerzoekFactory.create_batch(2)
+
+        with CaptureQueriesContext(connection) as few_verzoeken:
+            response = self.client.get(list_url, {"pageSize": 500})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["results"]), 2)
+
+        VerzoekFactory.create_batch(498)
+
+        with CaptureQueriesContext(connection) as many_verzoeken:
+            response = self.client.get(list_url, {"pageSize": 500})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["results"]), 500)
+        self.assertEqual(len(many_verzoeken), len(few_verzoeken))
+
     def test_read_verzoek(self):
         klant = KlantFactory.create()
         klant_url = reverse(klant)
@@ -97,3 +118,99 @@ class VerzoekTests(JWTAuthMixin, APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertEqual(Verzoek.objects.count(), 0)
+
+    def test_filter_identificatie_status(self):
+        verzoek = VerzoekFactory.create(
+            identificatie="VERZOEK-1", status=VerzoekStatus.ontvangen
+        )
+        VerzoekFactory.create(
+            identificatie="VERZOEK-1", status=VerzoekStatus.afgehandeld
+        )
+        VerzoekFactory.create(identificatie="VERZOEK-2", status=VerzoekStatus.ontvangen)
+
+        response = self.client.get(
+            reverse(Verzoek),
+            {"identificatie": "VERZOEK-1", "status": VerzoekStatus.ontvangen},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()["results"]
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["url"], f"http://testserver{reverse(verzoek)}")
+
+    def test_filter_klant(self):
+        verzoek = VerzoekFactory.create()
+        VerzoekFactory.create()
+        klant_url = f"http://testserver.com{reverse(verzoek.klant)}"
+
+        response = self.client.get(
+            reverse(Verzoek), {"klant": klant_url}, HTTP_HOST="testserver.com"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()["results"]
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["klant"], klant_url)
+
+
+class VerzoekIdentificatieTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def create_verzoek(self, bronorganisatie="423182687", year=2020) -> str:
+        response = self.client.post(
+            reverse(Verzoek),
+            {
+                "bronorganisatie": bronorganisatie,
+                "klant": reverse(KlantFactory.create()),
+                "interactiedatum": f"{year}-06-01T12:00:00Z",
+                "status": VerzoekStatus.ontvangen,
+            },
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.json()["identificatie"]
+
+    def test_numbered_per_bronorganisatie_and_year(self):
+        identificaties = [
+            self.create_verzoek(),
+            self.create_verzoek(),
+            self.create_verzoek(year=2021),
+            self.create_verzoek(bronorganisatie="111222333"),
+        ]
+
+        self.assertEqual(
+            identificaties,
+            [
+                "VERZOEK-2020-0000000001",
+                "VERZOEK-2020-0000000002",
+                "VERZOEK-2021-0000000001",
+                "VERZOEK-2020-0000000001",
+            ],
+        )
+        self.assertEqual(
+            Volgnummer.objects.get(bronorganisatie="423182687", jaar=2020).nummer, 2
+        )
+
+    def test_continue_from_existing_identificaties(self):
+        VerzoekFactory.create(
+            bronorganisatie="423182687", identificatie="VERZOEK-2020-0000000041"
+        )
+        VerzoekFactory.create(
+            bronorganisatie="423182687", identificatie="VERZOEK-2020-EXTERN"
+        )
+
+        self.assertEqual(self.create_verzoek(), "VERZOEK-2020-0000000042")
+
+        # the existing identificaties are only looked up once
+        with CaptureQueriesContext(connection) as queries:
+            identificatie = self.create_verzoek()
+
+        self.assertEqual(identificatie, "VERZOEK-2020-0000000043")
+        self.assertFalse(any("MAX(" in query["sql"] for query in queries))
+
+    def test_skip_given_identificatie(self):
+        self.create_verzoek()
+        VerzoekFactory.create(
+            bronorganisatie="423182687", identificatie="VERZOEK-2020-0000000002"
+        )
+
+        self.assertEqual(self.create_verzoek(), "VERZOEK-2020-0000000003")
@@ -21,7 +21,7 @@ class VerzoekContactMomentTests(JWTAuthMixin, APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        data = response.json()
+        data = response.json()["results"]
         self.assertEqual(len(data), 2)
 
     def test_list_filter_verzoekcontactmoment(self):
@@ -37,7 +37,7 @@ class VerzoekContactMomentTests(JWTAuthMixin, APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        data = response.json()
+        data = response.json()["results"]
         self.assertEqual(len(data), 1)
 
         response = self.client.get(
@@ -47,7 +47,7 @@ class VerzoekContactMomentTests(JWTAuthMixin, APITestCase):
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        data = response.json()
+        data = response.json()["results"]
         self.assertEqual(len(data), 1)
 
     def test_read_verzoekcontactmoment(self):
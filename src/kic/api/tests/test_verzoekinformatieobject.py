@@ -0,0 +1,83 @@
+from unittest.mock import patch
+
+from django.test import override_settings
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, reverse
+
+from kic.datamodel.models import VerzoekInformatieObject
+from kic.datamodel.tests.factories import VerzoekInformatieObjectFactory
+from kic.sync.cache import mark_for_delete, unmark_for_delete
+
+
+@override_settings(DRC_SYNC_ASYNC=False)
+@patch("kic.sync.signals.get_drc_client")
+class VerzoekInformatieObjectMarkedForDeleteTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_list_hides_marked_relations(self, *mocks):
+        marked, other = VerzoekInformatieObjectFactory.create_batch(2)
+        mark_for_delete(marked.uuid)
+        self.addCleanup(unmark_for_delete, marked.uuid)
+
+        response = self.client.get(reverse(VerzoekInformatieObject))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [relation["url"] for relation in response.json()["results"]],
+            [f"http://testserver{reverse(other)}"],
+        )
+
+    def test_marked_relations_keep_pages_full(self, *mocks):
+        relations = VerzoekInformatieObjectFactory.create_batch(4)
+        # the first page is ordered on descending primary key
+        for relation in relations[2:]:
+            mark_for_delete(relation.uuid)
+            self.addCleanup(unmark_for_delete, relation.uuid)
+
+        response = self.client.get(reverse(VerzoekInformatieObject), {"pageSize": 2})
+
+        data = response.json()
+        self.assertEqual(
+            [relation["url"] for relation in data["results"]],
+            [
+                f"http://testserver{reverse(relations[1])}",
+                f"http://testserver{reverse(relations[0])}",
+            ],
+        )
+        self.assertIsNone(data["next"])
+
+    def test_retrieve_marked_relation(self, *mocks):
+        relation = VerzoekInformatieObjectFactory.create()
+        mark_for_delete(relation.uuid)
+
+        response = self.client.get(reverse(relation))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        unmark_for_delete(relation.uuid)
+
+        response = self.client.get(reverse(relation))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_relation_is_hidden_during_remote_delete(self, m):
+        relations = VerzoekInformatieObjectFactory.create_batch(2)
+        visible = []
+
+        def remote_delete(*args, **kwargs):
+            response = self.client.get(reverse(VerzoekInformatieObject))
+            visible.extend(relation["url"] for relation in response.json()["results"])
+
+        m.return_value.list.return_value = [{"url": "https://drc.example.com/oio/1"}]
+        m.return_value.delete.side_effect = remote_delete
+
+        response = self.client.delete(reverse(relations[0]))
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(visible, [f"http://testserver{reverse(relations[1])}"])
+        # the mark is removed again
+        self.assertEqual(
+            len(self.client.get(reverse(VerzoekInformatieObject)).json()["results"]), 1,
+        )
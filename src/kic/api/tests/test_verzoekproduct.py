@@ -17,7 +17,7 @@ class VerzoekProductTests(JWTAuthMixin, APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        data = response.json()
+        data = response.json()["results"]
         self.assertEqual(len(data), 2)
 
     def test_list_filter_verzoekproduct(self):
@@ -30,13 +30,13 @@ class VerzoekProductTests(JWTAuthMixin, APITestCase):
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        data = response.json()
+        data = response.json()["results"]
         self.assertEqual(len(data), 1)
 
         response = self.client.get(list_url, {"product": vp2.product})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        data = response.json()
+        data = response.json()["results"]
         self.assertEqual(len(data), 1)
 
     def test_read_verzoekproduct_with_product_url(self):
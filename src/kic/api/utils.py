@@ -1,14 +1,75 @@
+import time
+from functools import lru_cache
+
 from django.conf import settings
 from django.contrib.sites.models import Site
+from django.core.signals import setting_changed
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 from rest_framework.reverse import reverse
 
+UUID_PLACEHOLDER = "00000000-0000-0000-0000-000000000000"
 
-def get_absolute_url(url_name: str, uuid: str) -> str:
+
+# the base URL and the time it was read, see :func:`get_base_url`
+_base_url = {}
+
+
+def get_base_url() -> str:
+    """
+    Return the protocol and domain of the current :class:`Site`.
+
+    The base URL is cached in-process for ``SITE_URL_CACHE_TIMEOUT`` seconds.
+    Saving the :class:`Site` only clears the cache of the process that saved
+    it, the other processes pick up the new domain when their value expires.
+    """
+    url, loaded_at = _base_url.get("value", (None, 0))
+    now = time.monotonic()
+    if url is None or now - loaded_at > settings.SITE_URL_CACHE_TIMEOUT:
+        # bypass the cache of the sites framework, which is per process too
+        domain = Site.objects.get(pk=settings.SITE_ID).domain
+        protocol = "https" if settings.IS_HTTPS else "http"
+        url = f"{protocol}://{domain}"
+        _base_url["value"] = (url, now)
+    return url
+
+
+def clear_base_url_cache() -> None:
+    _base_url.clear()
+
+
+@lru_cache()
+def get_detail_url_template(url_name: str) -> str:
+    """
+    Reverse the detail URL once, leaving a ``{uuid}`` placeholder to format.
+
+    The template only depends on the URL conf and the settings, so the
+    in-process cache can't go stale while the process is running.
+    """
     path = reverse(
         url_name,
-        kwargs={"version": settings.REST_FRAMEWORK["DEFAULT_VERSION"], "uuid": uuid},
+        kwargs={
+            "version": settings.REST_FRAMEWORK["DEFAULT_VERSION"],
+            "uuid": UUID_PLACEHOLDER,
+        },
     )
-    domain = Site.objects.get_current().domain
-    protocol = "https" if settings.IS_HTTPS else "http"
-    return f"{protocol}://{domain}{path}"
+    return path.replace(UUID_PLACEHOLDER, "{uuid}")
+
+
+def get_absolute_url(url_name: str, uuid: str) -> str:
+    path = get_detail_url_template(url_name).format(uuid=uuid)
+    return f"{get_base_url()}{path}"
+
+
+@receiver([post_save, post_delete], sender=Site, dispatch_uid="api.clear_site_base_url")
+def clear_site_base_url(sender, **kwargs):
+    clear_base_url_cache()
+
+
+@receiver(setting_changed, dispatch_uid="api.clear_url_caches")
+def clear_url_caches(sender, setting, **kwargs):
+    if setting in ("IS_HTTPS", "SITE_ID", "SITE_URL_CACHE_TIMEOUT"):
+        clear_base_url_cache()
+    elif setting in ("REST_FRAMEWORK", "ROOT_URLCONF"):
+        get_detail_url_template.cache_clear()
@@ -1,22 +1,72 @@
+import hashlib
 from collections import OrderedDict
+from typing import Tuple
 
 from django.conf import settings
+from django.core.cache import caches
 from django.core.exceptions import ImproperlyConfigured
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
 from django.utils.module_loading import import_string
 from django.utils.translation import ugettext_lazy as _
 
 from rest_framework import exceptions, serializers
-from vng_api_common.models import APICredential
 from vng_api_common.validators import ResourceValidator
 from zds_client import ClientError
 
-from kic.datamodel.models import ObjectContactMoment
+from kic.datamodel.models import ObjectContactMoment, ObjectVerzoek
 from kic.datamodel.models.core import ObjectKlantInteractie
 
-from .auth import get_auth
+from .auth import get_auth, get_client_auth
+from .concurrency import call_concurrently
 from .utils import get_absolute_url
 
 
+class RemoteRelationCache:
+    """
+    Cache of the remote objects and relations that were found.
+
+    The remote component creates the relation just before it is registered
+    here, and a retried registration looks the same object and relation up
+    again. Only the found objects and relations are kept, for at most
+    ``REMOTE_RELATION_CACHE_TIMEOUT`` seconds, in the ``remote_relations``
+    cache, which is shared by the processes so that a destroy is seen by all
+    of them.
+    """
+
+    cache_alias = "remote_relations"
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    @staticmethod
+    def get_cache_key(key: Tuple[str, ...]) -> str:
+        # the URLs can be too long or contain characters a cache key can't
+        digest = hashlib.sha256("|".join(key).encode("utf-8")).hexdigest()
+        return f"remote_relation:{digest}"
+
+    def clear(self) -> None:
+        # for the tests, this clears the whole cache backend
+        self.cache.clear()
+
+    def __contains__(self, key: Tuple[str, ...]) -> bool:
+        return self.cache.get(self.get_cache_key(key)) is not None
+
+    def add(self, key: Tuple[str, ...]) -> None:
+        self.cache.set(
+            self.get_cache_key(key),
+            True,
+            timeout=settings.REMOTE_RELATION_CACHE_TIMEOUT,
+        )
+
+    def forget(self, *keys: Tuple[str, ...]) -> None:
+        self.cache.delete_many([self.get_cache_key(key) for key in keys])
+
+
+remote_relation_cache = RemoteRelationCache()
+
+
 class ObjectKlantInteractieDestroyValidator:
     message = _(
         "The canonical remote relation still exists, this relation cannot be deleted."
@@ -39,7 +89,7 @@ class ObjectKlantInteractieDestroyValidator:
 
         Client = import_string(settings.ZDS_CLIENT_CLASS)
         client = Client.from_url(object_url)
-        client.auth = APICredential.get_auth(object_url)
+        client.auth = get_client_auth(object_url)
 
         resource = f"{objectklantinteractie.object_type}{self.resource_name}"
 
@@ -86,39 +136,61 @@ class ObjectKlantInteractieCreateValidator:
     def __call__(self, attrs: OrderedDict):
         object_url = attrs["object"]
         object_type = attrs["object_type"]
-        klantinteractie_url = get_absolute_url(
-            f"{self.resource_name}-detail", uuid=attrs[self.resource_name].uuid
-        )
+        klantinteractie_uuid = str(attrs[self.resource_name].uuid)
 
-        # dynamic so that it can be mocked in tests easily
-        Client = import_string(settings.ZDS_CLIENT_CLASS)
-        client = Client.from_url(object_url)
-        client.auth = APICredential.get_auth(object_url)
+        # the remote calls are done concurrently, outside this thread, so
+        # everything that needs the database is looked up first
+        auth_headers = get_auth(object_url)
+        client_auth = get_client_auth(object_url)
+        calls = {}
 
-        resource = f"{object_type}{self.resource_name}"
-        oas_schema = settings.ZRC_API_SPEC
-
-        try:
-            ResourceValidator(
+        object_key = (object_url, object_type)
+        if object_key not in remote_relation_cache:
+            validate_object = ResourceValidator(
                 object_type.capitalize(),
-                oas_schema,
-                get_auth=get_auth,
+                settings.ZRC_API_SPEC,
+                get_auth=lambda url: auth_headers,
                 headers={"Accept-Crs": "EPSG:4326"},
-            )(object_url)
-        except exceptions.ValidationError as exc:
-            raise serializers.ValidationError(
-                {"object": exc.detail}, code=ResourceValidator.code
             )
+            calls["object"] = (object_url, lambda: validate_object(object_url))
 
-        try:
-            relations = client.list(
-                resource,
-                query_params={
-                    object_type: object_url,
-                    f"{self.resource_name}": klantinteractie_url,
-                },
+        relation_key = (object_url, self.resource_name, klantinteractie_uuid)
+        if relation_key not in remote_relation_cache:
+            klantinteractie_url = get_absolute_url(
+                f"{self.resource_name}-detail", uuid=klantinteractie_uuid
             )
+            # dynamic so that it can be mocked in tests easily
+            Client = import_string(settings.ZDS_CLIENT_CLASS)
+
+            def list_relations():
+                client = Client.from_url(object_url)
+                client.auth = client_auth
+                return client.list(
+                    f"{object_type}{self.resource_name}",
+                    query_params={
+                        object_type: object_url,
+                        f"{self.resource_name}": klantinteractie_url,
+                    },
+                )
+
+            calls["relations"] = (object_url, list_relations)
+
+        results = call_concurrently(calls)
+
+        if "object" in results:
+            try:
+                results["object"].result()
+            except exceptions.ValidationError as exc:
+                raise serializers.ValidationError(
+                    {"object": exc.detail}, code=ResourceValidator.code
+                )
+            remote_relation_cache.add(object_key)
+
+        if "relations" not in results:
+            return
 
+        try:
+            relations = results["relations"].result()
         except ClientError as exc:
             raise serializers.ValidationError(
                 exc.args[0], code="relation-validation-error"
@@ -128,6 +200,7 @@ class ObjectKlantInteractieCreateValidator:
             raise serializers.ValidationError(
                 self.message.format(object=object_type), code=self.code
             )
+        remote_relation_cache.add(relation_key)
 
 
 class ObjectContactMomentCreateValidator(ObjectKlantInteractieCreateValidator):
@@ -146,3 +219,20 @@ class ObjectVerzoekCreateValidator(ObjectKlantInteractieCreateValidator):
 
     message = _("The verzoek has no relations to {object}")
     resource_name = "verzoek"
+
+
+@receiver(
+    post_delete,
+    sender=ObjectContactMoment,
+    dispatch_uid="api.forget_objectcontactmoment_relation",
+)
+@receiver(
+    post_delete, sender=ObjectVerzoek, dispatch_uid="api.forget_objectverzoek_relation"
+)
+def forget_remote_relation(sender, instance, **kwargs):
+    resource_name = "contactmoment" if sender is ObjectContactMoment else "verzoek"
+    klantinteractie = getattr(instance, resource_name)
+    remote_relation_cache.forget(
+        (instance.object, instance.object_type),
+        (instance.object, resource_name, str(klantinteractie.uuid)),
+    )
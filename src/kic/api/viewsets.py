@@ -1,12 +1,22 @@
 import logging
 
-from django.core.cache import caches
+from django.conf import settings
+from django.http import Http404
 
-from rest_framework import mixins, viewsets
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import mixins, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
 from rest_framework.serializers import ValidationError
 from rest_framework.settings import api_settings
+from vng_api_common.caching import conditional_retrieve
+from vng_api_common.notifications.viewsets import (
+    NotificationCreateMixin,
+    NotificationDestroyMixin,
+    NotificationViewSetMixin,
+)
 from vng_api_common.permissions import AuthScopesRequired
-from vng_api_common.viewsets import CheckQueryParamsMixin
+from vng_api_common.search import SearchMixin
 
 from kic.datamodel.models import (
     ContactMoment,
@@ -17,14 +27,30 @@ from kic.datamodel.models import (
     VerzoekProduct,
 )
 from kic.datamodel.models.core import ObjectVerzoek, Verzoek
+from kic.datamodel.search import search
+from kic.notifications.viewsets import QueuedNotificationMixin
+from kic.sync.cache import get_marked_for_delete
 
 from .filters import (
+    ContactMomentFilter,
+    KlantFilter,
     ObjectContactMomentFilter,
     ObjectVerzoekFilter,
     VerzoekContactMomentFilter,
+    VerzoekFilter,
     VerzoekInformatieObjectFilter,
     VerzoekProductFilter,
 )
+from .inspectors import BulkCreateAutoSchema
+from .kanalen import KANAAL_CONTACTMOMENTEN, KANAAL_KLANTEN, KANAAL_VERZOEKEN
+from .mixins import (
+    ChangeFeedMixin,
+    CheckQueryParamsMixin,
+    ConditionalListMixin,
+    ExportMixin,
+    TimedSerializationMixin,
+)
+from .pagination import CursorPagination, PageNumberPagination
 from .scopes import (
     SCOPE_KLANTEN_AANMAKEN,
     SCOPE_KLANTEN_ALLES_LEZEN,
@@ -34,6 +60,7 @@ from .scopes import (
 from .serializers import (
     ContactMomentSerializer,
     KlantSerializer,
+    KlantZoekSerializer,
     ObjectContactMomentSerializer,
     ObjectVerzoekSerializer,
     VerzoekContactMomentSerializer,
@@ -49,7 +76,31 @@ from .validators import (
 logger = logging.getLogger(__name__)
 
 
-class KlantViewSet(viewsets.ModelViewSet):
+def select_klant_uuid(queryset):
+    """
+    Join the KLANT of a klantinteractie, only loading its UUID.
+
+    The UUID is all that is needed to build the `klant` URL.
+    """
+    deferred_fields = [
+        f"klant__{field.name}"
+        for field in Klant._meta.concrete_fields
+        if field.name not in ("id", "uuid")
+    ]
+    return queryset.select_related("klant").defer(*deferred_fields)
+
+
+@conditional_retrieve()
+class KlantViewSet(
+    CheckQueryParamsMixin,
+    ConditionalListMixin,
+    TimedSerializationMixin,
+    QueuedNotificationMixin,
+    NotificationViewSetMixin,
+    ChangeFeedMixin,
+    SearchMixin,
+    viewsets.ModelViewSet,
+):
     """
     Opvragen en bewerken van KLANTen.
 
@@ -93,9 +144,18 @@ class KlantViewSet(viewsets.ModelViewSet):
     Verwijder een KLANT.
     """
 
-    queryset = Klant.objects.all()
+    queryset = Klant.objects.select_related(
+        "natuurlijk_persoon__verblijfsadres",
+        "natuurlijk_persoon__sub_verblijf_buitenland",
+        "niet_natuurlijk_persoon__sub_verblijf_buitenland",
+        "vestiging__verblijfsadres",
+        "vestiging__sub_verblijf_buitenland",
+    )
     serializer_class = KlantSerializer
+    filterset_class = KlantFilter
+    pagination_class = CursorPagination
     lookup_field = "uuid"
+    notifications_kanaal = KANAAL_KLANTEN
     permission_classes = (AuthScopesRequired,)
     required_scopes = {
         "list": SCOPE_KLANTEN_ALLES_LEZEN,
@@ -104,10 +164,44 @@ class KlantViewSet(viewsets.ModelViewSet):
         "update": SCOPE_KLANTEN_BIJWERKEN,
         "partial_update": SCOPE_KLANTEN_BIJWERKEN,
         "destroy": SCOPE_KLANTEN_ALLES_VERWIJDEREN,
+        "_zoek": SCOPE_KLANTEN_ALLES_LEZEN,
+        "_wijzigingen": SCOPE_KLANTEN_ALLES_LEZEN,
     }
-
-
-class ContactMomentViewSet(viewsets.ModelViewSet):
+    search_input_serializer_class = KlantZoekSerializer
+
+    @swagger_auto_schema(request_body=KlantZoekSerializer)
+    @action(
+        methods=["post"],
+        detail=False,
+        filter_backends=(),
+        pagination_class=PageNumberPagination,
+    )
+    def _zoek(self, request, *args, **kwargs):
+        """
+        Zoek KLANTen op naam of adres.
+
+        Zoek KLANTen op (een deel van) de voornaam, achternaam, geslachtsnaam,
+        statutaire naam, handelsnaam, straatnaam, postcode of het adres. De
+        KLANTen die het best overeenkomen met de zoekterm staan bovenaan.
+        """
+        search_input = self.get_search_input()
+        queryset = search(self.get_queryset(), search_input["zoekterm"])
+        return self.get_search_output(queryset)
+
+    _zoek.is_search_action = True
+
+
+@conditional_retrieve()
+class ContactMomentViewSet(
+    CheckQueryParamsMixin,
+    ConditionalListMixin,
+    TimedSerializationMixin,
+    QueuedNotificationMixin,
+    NotificationViewSetMixin,
+    ChangeFeedMixin,
+    ExportMixin,
+    viewsets.ModelViewSet,
+):
     """
     Opvragen en bewerken van CONTACTMOMENTen.
 
@@ -140,11 +234,33 @@ class ContactMomentViewSet(viewsets.ModelViewSet):
     Verwijder een CONTACTMOMENT.
 
     Verwijder een CONTACTMOMENT.
+
+    bulk:
+    Maak meerdere CONTACTMOMENTen in een keer aan.
+
+    Alle CONTACTMOMENTen worden op dezelfde manier gevalideerd als bij het
+    aanmaken van een enkel CONTACTMOMENT. Als een van de CONTACTMOMENTen niet
+    geldig is, wordt er niets aangemaakt en bevat de foutmelding de
+    validatiefouten per positie in de lijst (bijvoorbeeld `1.kanaal`). Anders
+    worden alle CONTACTMOMENTen aangemaakt en in dezelfde volgorde
+    teruggegeven.
+
+    export:
+    Alle CONTACTMOMENTen exporteren.
+
+    Alle CONTACTMOMENTen worden zonder paginering teruggegeven, als NDJSON
+    (een CONTACTMOMENT per regel) of als CSV. Kies het formaat met de
+    `Accept` header of de `formaat` query parameter.
     """
 
-    queryset = ContactMoment.objects.all()
+    queryset = select_klant_uuid(
+        ContactMoment.objects.select_related("medewerker_identificatie")
+    )
     serializer_class = ContactMomentSerializer
+    filterset_class = ContactMomentFilter
+    pagination_class = CursorPagination
     lookup_field = "uuid"
+    notifications_kanaal = KANAAL_CONTACTMOMENTEN
     permission_classes = (AuthScopesRequired,)
     required_scopes = {
         "list": SCOPE_KLANTEN_ALLES_LEZEN,
@@ -153,10 +269,45 @@ class ContactMomentViewSet(viewsets.ModelViewSet):
         "update": SCOPE_KLANTEN_BIJWERKEN,
         "partial_update": SCOPE_KLANTEN_BIJWERKEN,
         "destroy": SCOPE_KLANTEN_ALLES_VERWIJDEREN,
+        "bulk": SCOPE_KLANTEN_AANMAKEN,
+        "export": SCOPE_KLANTEN_ALLES_LEZEN,
+        "_wijzigingen": SCOPE_KLANTEN_ALLES_LEZEN,
     }
 
-
-class VerzoekViewSet(viewsets.ModelViewSet):
+    @swagger_auto_schema(
+        auto_schema=BulkCreateAutoSchema,
+        request_body=ContactMomentSerializer(many=True),
+    )
+    @action(detail=False, methods=["post"], url_path="_bulk")
+    def bulk(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data, many=True)
+        if not serializer.is_valid():
+            errors = serializer.errors
+            # key the errors of the items by their index
+            if isinstance(errors, list):
+                errors = {
+                    str(i): item_errors
+                    for i, item_errors in enumerate(errors)
+                    if item_errors
+                }
+            raise ValidationError(errors)
+        serializer.save()
+        response = Response(serializer.data, status=status.HTTP_201_CREATED)
+        self.notify(response.status_code, response.data, instance=serializer.instance)
+        return response
+
+
+@conditional_retrieve()
+class VerzoekViewSet(
+    CheckQueryParamsMixin,
+    ConditionalListMixin,
+    TimedSerializationMixin,
+    QueuedNotificationMixin,
+    NotificationViewSetMixin,
+    ChangeFeedMixin,
+    ExportMixin,
+    viewsets.ModelViewSet,
+):
     """
     Opvragen en bewerken van VERZOEKen.
 
@@ -189,11 +340,21 @@ class VerzoekViewSet(viewsets.ModelViewSet):
     Verwijder een VERZOEK.
 
     Verwijder een VERZOEK.
+
+    export:
+    Alle VERZOEKen exporteren.
+
+    Alle VERZOEKen worden zonder paginering teruggegeven, als NDJSON (een
+    VERZOEK per regel) of als CSV. Kies het formaat met de `Accept` header of
+    de `formaat` query parameter.
     """
 
-    queryset = Verzoek.objects.all()
+    queryset = select_klant_uuid(Verzoek.objects.all())
     serializer_class = VerzoekSerializer
+    filterset_class = VerzoekFilter
+    pagination_class = CursorPagination
     lookup_field = "uuid"
+    notifications_kanaal = KANAAL_VERZOEKEN
     permission_classes = (AuthScopesRequired,)
     required_scopes = {
         "list": SCOPE_KLANTEN_ALLES_LEZEN,
@@ -202,11 +363,19 @@ class VerzoekViewSet(viewsets.ModelViewSet):
         "update": SCOPE_KLANTEN_BIJWERKEN,
         "partial_update": SCOPE_KLANTEN_BIJWERKEN,
         "destroy": SCOPE_KLANTEN_ALLES_VERWIJDEREN,
+        "export": SCOPE_KLANTEN_ALLES_LEZEN,
+        "_wijzigingen": SCOPE_KLANTEN_ALLES_LEZEN,
     }
 
 
+@conditional_retrieve()
 class ObjectContactMomentViewSet(
     CheckQueryParamsMixin,
+    ConditionalListMixin,
+    TimedSerializationMixin,
+    QueuedNotificationMixin,
+    NotificationCreateMixin,
+    NotificationDestroyMixin,
     mixins.CreateModelMixin,
     mixins.DestroyModelMixin,
     viewsets.ReadOnlyModelViewSet,
@@ -248,10 +417,12 @@ class ObjectContactMomentViewSet(
     endpoint bij het synchroniseren van relaties.
     """
 
-    queryset = ObjectContactMoment.objects.all()
+    queryset = ObjectContactMoment.objects.select_related("contactmoment")
     serializer_class = ObjectContactMomentSerializer
     filterset_class = ObjectContactMomentFilter
+    pagination_class = CursorPagination
     lookup_field = "uuid"
+    notifications_kanaal = KANAAL_CONTACTMOMENTEN
     permission_classes = (AuthScopesRequired,)
     required_scopes = {
         "list": SCOPE_KLANTEN_ALLES_LEZEN,
@@ -274,8 +445,14 @@ class ObjectContactMomentViewSet(
             super().perform_destroy(instance)
 
 
+@conditional_retrieve()
 class ObjectVerzoekViewSet(
     CheckQueryParamsMixin,
+    ConditionalListMixin,
+    TimedSerializationMixin,
+    QueuedNotificationMixin,
+    NotificationCreateMixin,
+    NotificationDestroyMixin,
     mixins.CreateModelMixin,
     mixins.DestroyModelMixin,
     viewsets.ReadOnlyModelViewSet,
@@ -317,10 +494,12 @@ class ObjectVerzoekViewSet(
     endpoint bij het synchroniseren van relaties.
     """
 
-    queryset = ObjectVerzoek.objects.all()
+    queryset = ObjectVerzoek.objects.select_related("verzoek")
     serializer_class = ObjectVerzoekSerializer
     filterset_class = ObjectVerzoekFilter
+    pagination_class = CursorPagination
     lookup_field = "uuid"
+    notifications_kanaal = KANAAL_VERZOEKEN
     permission_classes = (AuthScopesRequired,)
     required_scopes = {
         "list": SCOPE_KLANTEN_ALLES_LEZEN,
@@ -343,8 +522,14 @@ class ObjectVerzoekViewSet(
             super().perform_destroy(instance)
 
 
+@conditional_retrieve()
 class VerzoekInformatieObjectViewSet(
     CheckQueryParamsMixin,
+    ConditionalListMixin,
+    TimedSerializationMixin,
+    QueuedNotificationMixin,
+    NotificationCreateMixin,
+    NotificationDestroyMixin,
     mixins.CreateModelMixin,
     mixins.DestroyModelMixin,
     viewsets.ReadOnlyModelViewSet,
@@ -401,10 +586,12 @@ class VerzoekInformatieObjectViewSet(
     Verwijder een VERZOEK-INFORMATIEOBJECT relatie.
     """
 
-    queryset = VerzoekInformatieObject.objects.all()
+    queryset = VerzoekInformatieObject.objects.select_related("verzoek")
     serializer_class = VerzoekInformatieObjectSerializer
     filterset_class = VerzoekInformatieObjectFilter
+    pagination_class = CursorPagination
     lookup_field = "uuid"
+    notifications_kanaal = KANAAL_VERZOEKEN
     permission_classes = (AuthScopesRequired,)
     required_scopes = {
         "list": SCOPE_KLANTEN_ALLES_LEZEN,
@@ -415,21 +602,37 @@ class VerzoekInformatieObjectViewSet(
         "partial_update": SCOPE_KLANTEN_BIJWERKEN,
     }
 
-    def get_queryset(self):
-        qs = super().get_queryset()
-
-        # Do not display BesluitInformatieObjecten that are marked to be deleted
-        cache = caches["drc_sync"]
-
-        # TODO: Store cachekeys somewhere central.
-        marked_vios = cache.get("vios_marked_for_delete")
-        if marked_vios:
-            return qs.exclude(uuid__in=marked_vios)
-        return qs
-
-
+    def paginate_queryset(self, queryset):
+        # Do not display VerzoekInformatieObjecten that are marked to be
+        # deleted. Only the relations on the page are looked up, and the
+        # marked ones are excluded from the queryset and the page is fetched
+        # again, so that pages stay full and the cursor stays correct. Marks
+        # are rare and short-lived, so this is hardly ever repeated.
+        marked = set()
+        while True:
+            page = super().paginate_queryset(queryset.exclude(uuid__in=marked))
+            if settings.DRC_SYNC_ASYNC or page is None:
+                return page
+            newly_marked = get_marked_for_delete(relation.uuid for relation in page)
+            if not newly_marked:
+                return page
+            marked |= newly_marked
+
+    def get_object(self):
+        relation = super().get_object()
+        if not settings.DRC_SYNC_ASYNC and get_marked_for_delete([relation.uuid]):
+            raise Http404
+        return relation
+
+
+@conditional_retrieve()
 class VerzoekContactMomentViewSet(
     CheckQueryParamsMixin,
+    ConditionalListMixin,
+    TimedSerializationMixin,
+    QueuedNotificationMixin,
+    NotificationCreateMixin,
+    NotificationDestroyMixin,
     mixins.CreateModelMixin,
     mixins.DestroyModelMixin,
     viewsets.ReadOnlyModelViewSet,
@@ -482,10 +685,12 @@ class VerzoekContactMomentViewSet(
     Verwijder een VERZOEK-CONTACTMOMENT relatie.
     """
 
-    queryset = VerzoekContactMoment.objects.all()
+    queryset = VerzoekContactMoment.objects.select_related("verzoek", "contactmoment")
     serializer_class = VerzoekContactMomentSerializer
     filterset_class = VerzoekContactMomentFilter
+    pagination_class = CursorPagination
     lookup_field = "uuid"
+    notifications_kanaal = KANAAL_VERZOEKEN
     permission_classes = (AuthScopesRequired,)
     required_scopes = {
         "list": SCOPE_KLANTEN_ALLES_LEZEN,
@@ -497,8 +702,14 @@ class VerzoekContactMomentViewSet(
     }
 
 
+@conditional_retrieve()
 class VerzoekProductViewSet(
     CheckQueryParamsMixin,
+    ConditionalListMixin,
+    TimedSerializationMixin,
+    QueuedNotificationMixin,
+    NotificationCreateMixin,
+    NotificationDestroyMixin,
     mixins.CreateModelMixin,
     mixins.DestroyModelMixin,
     viewsets.ReadOnlyModelViewSet,
@@ -532,10 +743,12 @@ class VerzoekProductViewSet(
     Verwijder een VERZOEK-PRODUCT relatie.
     """
 
-    queryset = VerzoekProduct.objects.all()
+    queryset = VerzoekProduct.objects.select_related("verzoek")
     serializer_class = VerzoekProductSerializer
     filterset_class = VerzoekProductFilter
+    pagination_class = CursorPagination
     lookup_field = "uuid"
+    notifications_kanaal = KANAAL_VERZOEKEN
     permission_classes = (AuthScopesRequired,)
     required_scopes = {
         "list": SCOPE_KLANTEN_ALLES_LEZEN,
@@ -28,6 +28,10 @@ SWAGGER_SETTINGS.update(
 
 GEMMA_URL_INFORMATIEMODEL_VERSIE = "1.0"
 
+# re-use connections to the remote APIs
+ZDS_CLIENT_CLASS = "kic.api.clients.PooledClient"
+LINK_FETCHER = "kic.api.clients.fetch"
+
 
 drc_repo = "vng-realisatie/gemma-documentregistratiecomponent"
 drc_commit = "a1602ccf397527add6bc2b4b12e997accf287339"
@@ -36,3 +40,7 @@ DRC_API_SPEC = f"https://raw.githubusercontent.com/{drc_repo}/{drc_commit}/src/o
 zrc_repo = "vng-realisatie/gemma-zaakregistratiecomponent"
 zrc_commit = "8ea1950fe4ec2ad99504d345eba60a175eea3edf"
 ZRC_API_SPEC = f"https://raw.githubusercontent.com/{zrc_repo}/{zrc_commit}/src/openapi.yaml"  # noqa
+
+# local copies of these specs are stored in API_SPEC_DIR, refresh them with
+# `manage.py refresh_api_specs`
+API_SPECS = {"drc": DRC_API_SPEC, "zrc": ZRC_API_SPEC}
@@ -63,11 +63,13 @@ INSTALLED_APPS = [
     "kic.accounts",
     "kic.api",
     "kic.datamodel",
+    "kic.notifications",
     "kic.sync",
     "kic.utils",
 ]
 
 MIDDLEWARE = [
+    "kic.utils.performance.PerformanceMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     # 'django.middleware.locale.LocaleMiddleware',
@@ -227,6 +229,11 @@ LOGGING = {
     },
     "loggers": {
         "kic": {"handlers": ["project"], "level": "INFO", "propagate": True},
+        "performance": {
+            "handlers": ["performance"],
+            "level": "INFO",
+            "propagate": False,
+        },
         "django.request": {"handlers": ["django"], "level": "ERROR", "propagate": True},
         "django.template": {
             "handlers": ["console"],
@@ -260,6 +267,80 @@ SITE_TITLE = "Klantinteractiecomponent (KIC)"
 ENVIRONMENT = None
 SHOW_ALERT = True
 
+# Pagination of the list endpoints
+PAGE_SIZE = int(os.getenv("PAGE_SIZE", 100))
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", 500))
+
+# Maximum number of objects created in one request to a bulk endpoint
+BULK_CREATE_MAX_ITEMS = int(os.getenv("BULK_CREATE_MAX_ITEMS", 500))
+
+# Number of rows fetched at a time by the server-side cursor of an export
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", 2000))
+
+# Number of seconds the external API credentials are cached in-process, and
+# the lifetime of the JWT's signed for external APIs
+API_CREDENTIALS_CACHE_TIMEOUT = int(os.getenv("API_CREDENTIALS_CACHE_TIMEOUT", 5 * 60))
+JWT_EXPIRY = int(os.getenv("JWT_EXPIRY", 60 * 60))
+
+# Number of seconds the domain of the Site is cached in-process for building
+# absolute URLs; other processes see a changed domain after at most this long
+SITE_URL_CACHE_TIMEOUT = int(os.getenv("SITE_URL_CACHE_TIMEOUT", 5 * 60))
+
+# Connection pool and timeouts (in seconds) of the calls to remote APIs
+ZDS_CLIENT_POOL_SIZE = int(os.getenv("ZDS_CLIENT_POOL_SIZE", 10))
+ZDS_CLIENT_CONNECT_TIMEOUT = float(os.getenv("ZDS_CLIENT_CONNECT_TIMEOUT", 3.05))
+ZDS_CLIENT_READ_TIMEOUT = float(os.getenv("ZDS_CLIENT_READ_TIMEOUT", 10))
+
+# Number of seconds the remote objects and relations found when registering an
+# OBJECT-CONTACTMOMENT or OBJECT-VERZOEK are kept in the "remote_relations"
+# cache
+REMOTE_RELATION_CACHE_TIMEOUT = int(os.getenv("REMOTE_RELATION_CACHE_TIMEOUT", 60))
+
+# Independent remote lookups of a write are done in parallel, with at most
+# REMOTE_VALIDATION_MAX_PER_HOST calls to a host at a time, and at most
+# REMOTE_VALIDATION_DEADLINE seconds for all of them
+REMOTE_VALIDATION_CONCURRENT = os.getenv(
+    "REMOTE_VALIDATION_CONCURRENT", "1"
+).lower() in ["true", "1", "yes"]
+REMOTE_VALIDATION_MAX_WORKERS = int(os.getenv("REMOTE_VALIDATION_MAX_WORKERS", 10))
+REMOTE_VALIDATION_MAX_PER_HOST = int(os.getenv("REMOTE_VALIDATION_MAX_PER_HOST", 4))
+REMOTE_VALIDATION_DEADLINE = float(os.getenv("REMOTE_VALIDATION_DEADLINE", 15))
+
+# Directory with the local copies of the OAS specs of the remote APIs
+API_SPEC_DIR = os.getenv(
+    "API_SPEC_DIR", os.path.join(DJANGO_PROJECT_DIR, "api", "specs")
+)
+
+# Mirror the VERZOEK-INFORMATIEOBJECT relations in the DRC through the outbox
+# (`manage.py process_sync_operations`) instead of during the request
+DRC_SYNC_ASYNC = os.getenv("DRC_SYNC_ASYNC", "1").lower() in ["true", "1", "yes"]
+DRC_SYNC_MAX_ATTEMPTS = int(os.getenv("DRC_SYNC_MAX_ATTEMPTS", 10))
+# base and maximum number of seconds between retries of a failed operation
+DRC_SYNC_RETRY_BACKOFF = int(os.getenv("DRC_SYNC_RETRY_BACKOFF", 30))
+DRC_SYNC_MAX_BACKOFF = int(os.getenv("DRC_SYNC_MAX_BACKOFF", 60 * 60))
+# seconds a relation stays hidden while it is deleted in the DRC synchronously
+DRC_SYNC_MARK_TIMEOUT = int(os.getenv("DRC_SYNC_MARK_TIMEOUT", 60))
+
+# The notifications are sent to the NRC through the outbox
+# (`manage.py process_notifications`) instead of during the request
+NOTIFICATIONS_MAX_ATTEMPTS = int(os.getenv("NOTIFICATIONS_MAX_ATTEMPTS", 10))
+# base and maximum number of seconds between retries of a failed notification
+NOTIFICATIONS_RETRY_BACKOFF = int(os.getenv("NOTIFICATIONS_RETRY_BACKOFF", 30))
+NOTIFICATIONS_MAX_BACKOFF = int(os.getenv("NOTIFICATIONS_MAX_BACKOFF", 60 * 60))
+
+# The feed of changes only gives the changes older than this number of seconds,
+# which should be longer than the longest transaction. A change that is
+# committed later than this is missed by the clients that read past it.
+CHANGE_FEED_DELAY = int(os.getenv("CHANGE_FEED_DELAY", 60))
+
+# Expose the totals of the request timings of the process on /metrics, in the
+# Prometheus text format. The timings per request are in the performance log.
+PERFORMANCE_METRICS_ENABLED = os.getenv("PERFORMANCE_METRICS_ENABLED", "0").lower() in [
+    "true",
+    "1",
+    "yes",
+]
+
 #
 # Library settings
 #
@@ -40,6 +40,15 @@ CACHES = {
             "IGNORE_EXCEPTIONS": True,
         },
     },
+    "remote_relations": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": f"redis://{getenv('REDIS_CACHE')}",
+        "KEY_PREFIX": "remote_relations",
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            "IGNORE_EXCEPTIONS": True,
+        },
+    },
 }
 
 # Hosts/domain names that are valid for this site; required if DEBUG is False
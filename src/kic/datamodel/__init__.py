@@ -0,0 +1 @@
+default_app_config = "kic.datamodel.apps.DatamodelConfig"
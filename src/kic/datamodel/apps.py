@@ -0,0 +1,13 @@
+from django.apps import AppConfig
+from django.db import models
+
+from kic.utils.db import TrigramWordSimilar
+
+
+class DatamodelConfig(AppConfig):
+    name = "kic.datamodel"
+
+    def ready(self):
+        from . import signals  # noqa
+
+        models.TextField.register_lookup(TrigramWordSimilar)
@@ -107,3 +107,9 @@ class SoortRechtsvorm(DjangoChoices):
     kapitaalvennootschap_buiten_eer = ChoiceItem(
         "kapitaalvennootschap_buiten_eer", "Kapitaalvennootschap buiten EER"
     )
+
+
+class Resource(DjangoChoices):
+    klant = ChoiceItem("klant", _("Klant"))
+    contactmoment = ChoiceItem("contactmoment", _("Contactmoment"))
+    verzoek = ChoiceItem("verzoek", _("Verzoek"))
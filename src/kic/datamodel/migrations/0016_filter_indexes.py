@@ -0,0 +1,155 @@
+# Generated by Django 2.2.11 on 2026-10-18 10:49
+
+from django.db import migrations, models
+import django.utils.timezone
+import vng_api_common.fields
+import vng_api_common.validators
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0015_auto_20200320_1626"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="contactmoment",
+            name="bronorganisatie",
+            field=vng_api_common.fields.RSINField(
+                db_index=True,
+                help_text="Het RSIN van de Niet-natuurlijk persoon zijnde de organisatie die de klantinteractie heeft gecreeerd. Dit moet een geldig RSIN zijn van 9 nummers en voldoen aan https://nl.wikipedia.org/wiki/Burgerservicenummer#11-proef",
+                max_length=9,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="contactmoment",
+            name="interactiedatum",
+            field=models.DateTimeField(
+                db_index=True,
+                default=django.utils.timezone.now,
+                help_text="De datum en het tijdstip waarop de klantinteractie heeft plaatsgevonden.",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="contactmoment",
+            name="kanaal",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                help_text="Het communicatiekanaal waarlangs het CONTACTMOMENT gevoerd wordt",
+                max_length=50,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="contactmoment",
+            name="medewerker",
+            field=models.URLField(
+                blank=True,
+                db_index=True,
+                help_text="URL-referentie naar een medewerker",
+                max_length=1000,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="klant",
+            name="emailadres",
+            field=models.EmailField(
+                blank=True,
+                db_index=True,
+                help_text="Het e-mail adres van de klant.",
+                max_length=254,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="klant",
+            name="subject",
+            field=models.URLField(
+                blank=True,
+                db_index=True,
+                help_text="URL-referentie naar een subject",
+                max_length=1000,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="klant",
+            name="subject_type",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("natuurlijk_persoon", "Natuurlijk persoon"),
+                    ("niet_natuurlijk_persoon", "Niet-natuurlijk persoon"),
+                    ("vestiging", "Vestiging"),
+                ],
+                db_index=True,
+                help_text="Type van de `subject`.",
+                max_length=100,
+                null=True,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="klant",
+            name="telefoonnummer",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                help_text="Het mobiele of vaste telefoonnummer van de klant.",
+                max_length=20,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="natuurlijkpersoon",
+            name="inp_bsn",
+            field=vng_api_common.fields.BSNField(
+                blank=True,
+                db_index=True,
+                help_text="Het burgerservicenummer, bedoeld in artikel 1.1 van de Wet algemene bepalingen burgerservicenummer.",
+                max_length=9,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="verzoek",
+            name="bronorganisatie",
+            field=vng_api_common.fields.RSINField(
+                db_index=True,
+                help_text="Het RSIN van de Niet-natuurlijk persoon zijnde de organisatie die de klantinteractie heeft gecreeerd. Dit moet een geldig RSIN zijn van 9 nummers en voldoen aan https://nl.wikipedia.org/wiki/Burgerservicenummer#11-proef",
+                max_length=9,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="verzoek",
+            name="identificatie",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                help_text="De unieke identificatie van het VERZOEK binnen de organisatie die verantwoordelijk is voor de behandeling van het VERZOEK.",
+                max_length=40,
+                validators=[vng_api_common.validators.AlphanumericExcludingDiacritic()],
+            ),
+        ),
+        migrations.AlterField(
+            model_name="verzoek",
+            name="interactiedatum",
+            field=models.DateTimeField(
+                db_index=True,
+                default=django.utils.timezone.now,
+                help_text="De datum en het tijdstip waarop de klantinteractie heeft plaatsgevonden.",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="verzoek",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("ontvangen", "Ontvangen"),
+                    ("in_behandeling", "In behandeling"),
+                    ("afgehandeld", "Afgehandeld"),
+                    ("afgewezen", "Afgewezen"),
+                    ("ingetrokken", "Ingetrokken"),
+                ],
+                db_index=True,
+                help_text="De waarden van de typering van de voortgang van afhandeling van een VERZOEK.",
+                max_length=20,
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 2.2.11 on 2026-10-18 10:51
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0016_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="contactmoment",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["onderwerp_links"], name="datamodel_c_onderwe_028c56_gin"
+            ),
+        ),
+    ]
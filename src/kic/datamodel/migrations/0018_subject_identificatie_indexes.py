@@ -0,0 +1,34 @@
+# Generated by Django 2.2.11 on 2026-10-18 10:52
+
+from django.db import migrations, models
+import vng_api_common.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0017_contactmoment_onderwerp_links_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="nietnatuurlijkpersoon",
+            name="inn_nnp_id",
+            field=vng_api_common.fields.RSINField(
+                blank=True,
+                db_index=True,
+                help_text="Het door een kamer toegekend uniek nummer voor de INGESCHREVEN NIET-NATUURLIJK PERSOON",
+                max_length=9,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="vestiging",
+            name="vestigings_nummer",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                help_text="Een korte unieke aanduiding van de Vestiging.",
+                max_length=24,
+            ),
+        ),
+    ]
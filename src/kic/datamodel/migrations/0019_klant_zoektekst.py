@@ -0,0 +1,85 @@
+# Generated by Django 2.2.11 on 2026-10-18 10:54
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import migrations, models
+
+
+def get_related(obj, name):
+    try:
+        return getattr(obj, name)
+    except ObjectDoesNotExist:
+        return None
+
+
+# frozen copy of kic.datamodel.search.get_zoektekst at the time of this migration
+def get_zoektekst(klant):
+    values = [klant.voornaam, klant.achternaam, klant.adres]
+
+    natuurlijk_persoon = get_related(klant, "natuurlijk_persoon")
+    niet_natuurlijk_persoon = get_related(klant, "niet_natuurlijk_persoon")
+    vestiging = get_related(klant, "vestiging")
+
+    verblijfsadres = None
+    if natuurlijk_persoon is not None:
+        values.append(natuurlijk_persoon.geslachtsnaam)
+        verblijfsadres = get_related(natuurlijk_persoon, "verblijfsadres")
+    if niet_natuurlijk_persoon is not None:
+        values.append(niet_natuurlijk_persoon.statutaire_naam)
+    if vestiging is not None:
+        values += vestiging.handelsnaam
+        verblijfsadres = get_related(vestiging, "verblijfsadres")
+
+    if verblijfsadres is not None:
+        values += [verblijfsadres.gor_openbare_ruimte_naam, verblijfsadres.aoa_postcode]
+
+    return " ".join(" ".join(value for value in values if value).lower().split())
+
+
+def fill_zoektekst(apps, _):
+    Klant = apps.get_model("datamodel", "Klant")
+
+    klanten = Klant.objects.select_related(
+        "natuurlijk_persoon__verblijfsadres",
+        "niet_natuurlijk_persoon",
+        "vestiging__verblijfsadres",
+    ).order_by("pk")
+
+    batch = []
+    for klant in klanten.iterator(chunk_size=1000):
+        klant.zoektekst = get_zoektekst(klant)
+        batch.append(klant)
+        if len(batch) >= 1000:
+            Klant.objects.bulk_update(batch, fields=["zoektekst"])
+            batch = []
+    Klant.objects.bulk_update(batch, fields=["zoektekst"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0018_subject_identificatie_indexes"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="klant",
+            name="zoektekst",
+            field=models.TextField(
+                blank=True,
+                editable=False,
+                help_text="De namen en adressen van de klant, om op te zoeken.",
+            ),
+        ),
+        migrations.RunPython(fill_zoektekst, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="klant",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["zoektekst"],
+                name="klant_zoektekst_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,109 @@
+# Generated by Django 2.2.11 on 2026-10-18 10:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0019_klant_zoektekst"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="contactmoment",
+            name="_etag",
+            field=models.CharField(
+                default="",
+                editable=False,
+                help_text="MD5 hash of the resource representation in its current version.",
+                max_length=32,
+                verbose_name="etag value",
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="klant",
+            name="_etag",
+            field=models.CharField(
+                default="",
+                editable=False,
+                help_text="MD5 hash of the resource representation in its current version.",
+                max_length=32,
+                verbose_name="etag value",
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="objectcontactmoment",
+            name="_etag",
+            field=models.CharField(
+                default="",
+                editable=False,
+                help_text="MD5 hash of the resource representation in its current version.",
+                max_length=32,
+                verbose_name="etag value",
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="objectverzoek",
+            name="_etag",
+            field=models.CharField(
+                default="",
+                editable=False,
+                help_text="MD5 hash of the resource representation in its current version.",
+                max_length=32,
+                verbose_name="etag value",
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="verzoek",
+            name="_etag",
+            field=models.CharField(
+                default="",
+                editable=False,
+                help_text="MD5 hash of the resource representation in its current version.",
+                max_length=32,
+                verbose_name="etag value",
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="verzoekcontactmoment",
+            name="_etag",
+            field=models.CharField(
+                default="",
+                editable=False,
+                help_text="MD5 hash of the resource representation in its current version.",
+                max_length=32,
+                verbose_name="etag value",
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="verzoekinformatieobject",
+            name="_etag",
+            field=models.CharField(
+                default="",
+                editable=False,
+                help_text="MD5 hash of the resource representation in its current version.",
+                max_length=32,
+                verbose_name="etag value",
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="verzoekproduct",
+            name="_etag",
+            field=models.CharField(
+                default="",
+                editable=False,
+                help_text="MD5 hash of the resource representation in its current version.",
+                max_length=32,
+                verbose_name="etag value",
+            ),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,118 @@
+# Generated by Django 2.2.11 on 2026-10-18 11:04
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0020_etag"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Verwijdering",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "resource",
+                    models.CharField(
+                        choices=[
+                            ("klant", "Klant"),
+                            ("contactmoment", "Contactmoment"),
+                            ("verzoek", "Verzoek"),
+                        ],
+                        help_text="Het soort resource dat is verwijderd.",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "uuid",
+                    models.UUIDField(help_text="De UUID van de verwijderde resource."),
+                ),
+                (
+                    "verwijderd",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        help_text="Het tijdstip waarop de resource is verwijderd.",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "verwijdering",
+                "verbose_name_plural": "verwijderingen",
+            },
+        ),
+        migrations.AddField(
+            model_name="contactmoment",
+            name="created",
+            field=models.DateTimeField(
+                auto_now_add=True,
+                default=django.utils.timezone.now,
+                help_text="Het tijdstip waarop de klantinteractie is aangemaakt.",
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="contactmoment",
+            name="modified",
+            field=models.DateTimeField(
+                auto_now=True,
+                db_index=True,
+                help_text="Het tijdstip waarop de klantinteractie voor het laatst is gewijzigd.",
+            ),
+        ),
+        migrations.AddField(
+            model_name="klant",
+            name="created",
+            field=models.DateTimeField(
+                auto_now_add=True,
+                default=django.utils.timezone.now,
+                help_text="Het tijdstip waarop de klant is aangemaakt.",
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="klant",
+            name="modified",
+            field=models.DateTimeField(
+                auto_now=True,
+                db_index=True,
+                help_text="Het tijdstip waarop de klant voor het laatst is gewijzigd.",
+            ),
+        ),
+        migrations.AddField(
+            model_name="verzoek",
+            name="created",
+            field=models.DateTimeField(
+                auto_now_add=True,
+                default=django.utils.timezone.now,
+                help_text="Het tijdstip waarop de klantinteractie is aangemaakt.",
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="verzoek",
+            name="modified",
+            field=models.DateTimeField(
+                auto_now=True,
+                db_index=True,
+                help_text="Het tijdstip waarop de klantinteractie voor het laatst is gewijzigd.",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="verwijdering",
+            index=models.Index(
+                fields=["resource", "verwijderd"], name="datamodel_v_resourc_492cc1_idx"
+            ),
+        ),
+    ]
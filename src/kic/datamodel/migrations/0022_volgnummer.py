@@ -0,0 +1,64 @@
+# Generated by Django 2.2.11 on 2026-10-18 11:21
+
+from django.db import migrations, models
+import vng_api_common.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0021_change_feed"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Volgnummer",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "resource",
+                    models.CharField(
+                        choices=[
+                            ("klant", "Klant"),
+                            ("contactmoment", "Contactmoment"),
+                            ("verzoek", "Verzoek"),
+                        ],
+                        help_text="Het soort resource waarvan de nummers worden geteld.",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "bronorganisatie",
+                    vng_api_common.fields.RSINField(
+                        help_text="De bronorganisatie waarvan de nummers worden geteld.",
+                        max_length=9,
+                    ),
+                ),
+                (
+                    "jaar",
+                    models.PositiveSmallIntegerField(
+                        help_text="Het jaar waarin de nummers worden geteld."
+                    ),
+                ),
+                (
+                    "nummer",
+                    models.PositiveIntegerField(
+                        help_text="Het laatst uitgegeven nummer."
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "volgnummer",
+                "verbose_name_plural": "volgnummers",
+                "unique_together": {("resource", "bronorganisatie", "jaar")},
+            },
+        ),
+    ]
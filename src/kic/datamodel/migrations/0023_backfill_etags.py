@@ -0,0 +1,39 @@
+from django.apps import apps as global_apps
+from django.db import migrations
+
+BATCH_SIZE = 1000
+
+
+def backfill_etags(apps, _):
+    # The ETag is the hash of the representation in the API, which only the
+    # current serializers can produce, so the current models are used for the
+    # rows that need one. On a new database there are none, and the current
+    # models are never queried.
+    from vng_api_common.caching.etags import calculate_etag
+
+    for model in apps.get_app_config("datamodel").get_models():
+        if "_etag" not in {field.name for field in model._meta.fields}:
+            continue
+
+        pks = list(
+            model.objects.filter(_etag="").order_by("pk").values_list("pk", flat=True)
+        )
+        if not pks:
+            continue
+
+        Model = global_apps.get_model("datamodel", model.__name__)
+        for start in range(0, len(pks), BATCH_SIZE):
+            objs = list(Model.objects.filter(pk__in=pks[start : start + BATCH_SIZE]))
+            for obj in objs:
+                obj._etag = calculate_etag(obj)
+            Model.objects.bulk_update(objs, fields=["_etag"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0022_volgnummer"),
+        ("sites", "0002_alter_domain_unique"),
+    ]
+
+    operations = [migrations.RunPython(backfill_etags, migrations.RunPython.noop)]
@@ -3,6 +3,8 @@ import uuid as _uuid
 
 from django.db import models
 
+from vng_api_common.caching import ETagMixin
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,7 +45,7 @@ class Medewerker(models.Model):
         verbose_name = "medewerker"
 
 
-class VerzoekInformatieObject(models.Model):
+class VerzoekInformatieObject(ETagMixin, models.Model):
     uuid = models.UUIDField(
         unique=True, default=_uuid.uuid4, help_text="Unieke resource identifier (UUID4)"
     )
@@ -79,7 +81,7 @@ class VerzoekInformatieObject(models.Model):
     #     return self._unique_representation
 
 
-class VerzoekContactMoment(models.Model):
+class VerzoekContactMoment(ETagMixin, models.Model):
     uuid = models.UUIDField(
         unique=True, default=_uuid.uuid4, help_text="Unieke resource identifier (UUID4)"
     )
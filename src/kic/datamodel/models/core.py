@@ -1,17 +1,18 @@
 import uuid
 
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
 
 from django_better_admin_arrayfield.models.fields import ArrayField
+from vng_api_common.caching import ETagMixin
 from vng_api_common.fields import RSINField
 from vng_api_common.models import APIMixin
-from vng_api_common.utils import generate_unique_identification
 from vng_api_common.validators import alphanumeric_excluding_diacritic
 
-from ..constants import InitiatiefNemer, KlantType, ObjectTypes, VerzoekStatus
+from ..constants import InitiatiefNemer, KlantType, ObjectTypes, Resource, VerzoekStatus
 
 __all__ = [
     "Klant",
@@ -20,10 +21,12 @@ __all__ = [
     "Verzoek",
     "ObjectVerzoek",
     "VerzoekProduct",
+    "Verwijdering",
+    "Volgnummer",
 ]
 
 
-class Klant(APIMixin, models.Model):
+class Klant(ETagMixin, APIMixin, models.Model):
     uuid = models.UUIDField(
         unique=True, default=uuid.uuid4, help_text="Unieke resource identifier (UUID4)"
     )
@@ -44,25 +47,50 @@ class Klant(APIMixin, models.Model):
     telefoonnummer = models.CharField(
         max_length=20,
         blank=True,
+        db_index=True,
         help_text="Het mobiele of vaste telefoonnummer van de klant.",
     )
     emailadres = models.EmailField(
-        blank=True, help_text="Het e-mail adres van de klant."
+        blank=True, db_index=True, help_text="Het e-mail adres van de klant."
     )
     subject = models.URLField(
-        help_text="URL-referentie naar een subject", max_length=1000, blank=True
+        help_text="URL-referentie naar een subject",
+        max_length=1000,
+        blank=True,
+        db_index=True,
     )
     subject_type = models.CharField(
         max_length=100,
         null=True,
         blank=True,
+        db_index=True,
         choices=KlantType.choices,
         help_text="Type van de `subject`.",
     )
+    zoektekst = models.TextField(
+        blank=True,
+        editable=False,
+        help_text="De namen en adressen van de klant, om op te zoeken.",
+    )
+    created = models.DateTimeField(
+        auto_now_add=True, help_text=_("Het tijdstip waarop de klant is aangemaakt.")
+    )
+    modified = models.DateTimeField(
+        auto_now=True,
+        db_index=True,
+        help_text=_("Het tijdstip waarop de klant voor het laatst is gewijzigd."),
+    )
 
     class Meta:
         verbose_name = "klant"
         verbose_name_plural = "klanten"
+        indexes = [
+            GinIndex(
+                fields=["zoektekst"],
+                name="klant_zoektekst_trgm",
+                opclasses=["gin_trgm_ops"],
+            )
+        ]
 
     @property
     def subject_identificatie(self):
@@ -76,10 +104,11 @@ class KlantInteractie(models.Model):
         unique=True, default=uuid.uuid4, help_text="Unieke resource identifier (UUID4)"
     )
     bronorganisatie = RSINField(
+        db_index=True,
         help_text="Het RSIN van de Niet-natuurlijk persoon zijnde de "
         "organisatie die de klantinteractie heeft gecreeerd. Dit moet een "
         "geldig RSIN zijn van 9 nummers en voldoen aan "
-        "https://nl.wikipedia.org/wiki/Burgerservicenummer#11-proef"
+        "https://nl.wikipedia.org/wiki/Burgerservicenummer#11-proef",
     )
     klant = models.ForeignKey(
         Klant,
@@ -92,6 +121,7 @@ class KlantInteractie(models.Model):
     )
     interactiedatum = models.DateTimeField(
         default=timezone.now,
+        db_index=True,
         help_text=_(
             "De datum en het tijdstip waarop de klantinteractie heeft plaatsgevonden."
         ),
@@ -109,15 +139,27 @@ class KlantInteractie(models.Model):
             "Het communicatiekanaal dat voor opvolging van de klantinteractie de voorkeur heeft van de KLANT."
         ),
     )
+    created = models.DateTimeField(
+        auto_now_add=True,
+        help_text=_("Het tijdstip waarop de klantinteractie is aangemaakt."),
+    )
+    modified = models.DateTimeField(
+        auto_now=True,
+        db_index=True,
+        help_text=_(
+            "Het tijdstip waarop de klantinteractie voor het laatst is gewijzigd."
+        ),
+    )
 
     class Meta:
         abstract = True
 
 
-class ContactMoment(APIMixin, KlantInteractie):
+class ContactMoment(ETagMixin, APIMixin, KlantInteractie):
     kanaal = models.CharField(
         blank=True,
         max_length=50,
+        db_index=True,
         help_text=_("Het communicatiekanaal waarlangs het CONTACTMOMENT gevoerd wordt"),
     )
     initiatiefnemer = models.CharField(
@@ -127,7 +169,10 @@ class ContactMoment(APIMixin, KlantInteractie):
         help_text=_("De partij die het contact heeft geïnitieerd."),
     )
     medewerker = models.URLField(
-        help_text="URL-referentie naar een medewerker", max_length=1000, blank=True
+        help_text="URL-referentie naar een medewerker",
+        max_length=1000,
+        blank=True,
+        db_index=True,
     )
     onderwerp_links = ArrayField(
         models.URLField(
@@ -148,6 +193,7 @@ class ContactMoment(APIMixin, KlantInteractie):
     class Meta:
         verbose_name = "contactmoment"
         verbose_name_plural = "contactmomenten"
+        indexes = [GinIndex(fields=["onderwerp_links"])]
 
     def save(self, *args, **kwargs):
         # workaround for https://github.com/gradam/django-better-admin-arrayfield/issues/17
@@ -156,7 +202,7 @@ class ContactMoment(APIMixin, KlantInteractie):
         super().save(*args, **kwargs)
 
 
-class Verzoek(APIMixin, KlantInteractie):
+class Verzoek(ETagMixin, APIMixin, KlantInteractie):
     """
     Verzoek is een speciaal contactmoment.
     """
@@ -164,6 +210,7 @@ class Verzoek(APIMixin, KlantInteractie):
     identificatie = models.CharField(
         max_length=40,
         blank=True,
+        db_index=True,
         help_text="De unieke identificatie van het VERZOEK binnen de "
         "organisatie die verantwoordelijk is voor de behandeling van "
         "het VERZOEK.",
@@ -178,6 +225,7 @@ class Verzoek(APIMixin, KlantInteractie):
     status = models.CharField(
         max_length=20,
         choices=VerzoekStatus,
+        db_index=True,
         help_text="De waarden van de typering van de voortgang van afhandeling van een VERZOEK.",
     )
 
@@ -188,10 +236,40 @@ class Verzoek(APIMixin, KlantInteractie):
 
     def save(self, *args, **kwargs):
         if not self.identificatie:
-            self.identificatie = generate_unique_identification(self, "interactiedatum")
+            self.identificatie = self.generate_identificatie()
 
         super().save(*args, **kwargs)
 
+    def generate_identificatie(self) -> str:
+        """
+        Generate the identificatie from the next volgnummer of the
+        bronorganisatie in the year of the interactiedatum.
+
+        Skips the numbers of identificaties that were given by a client.
+        """
+        year = self.interactiedatum.year
+        prefix = f"VERZOEK-{year}-"
+
+        def get_highest_number() -> int:
+            identificaties = Verzoek.objects.filter(
+                bronorganisatie=self.bronorganisatie,
+                identificatie__regex=rf"^{prefix}\d{{10}}$",
+            )
+            identificatie = identificaties.aggregate(
+                highest=models.Max("identificatie")
+            )["highest"]
+            return int(identificatie[len(prefix) :]) if identificatie else 0
+
+        while True:
+            number = Volgnummer.objects.next(
+                Resource.verzoek, self.bronorganisatie, year, get_highest_number
+            )
+            identificatie = f"{prefix}{number:010d}"
+            if not Verzoek.objects.filter(
+                bronorganisatie=self.bronorganisatie, identificatie=identificatie
+            ).exists():
+                return identificatie
+
 
 class ObjectKlantInteractie(models.Model):
     uuid = models.UUIDField(
@@ -211,7 +289,7 @@ class ObjectKlantInteractie(models.Model):
         abstract = True
 
 
-class ObjectContactMoment(APIMixin, ObjectKlantInteractie):
+class ObjectContactMoment(ETagMixin, APIMixin, ObjectKlantInteractie):
     """
     Modelleer een CONTACTMOMENT horend bij een OBJECT.
     """
@@ -228,7 +306,7 @@ class ObjectContactMoment(APIMixin, ObjectKlantInteractie):
         unique_together = ("contactmoment", "object")
 
 
-class ObjectVerzoek(APIMixin, ObjectKlantInteractie):
+class ObjectVerzoek(ETagMixin, APIMixin, ObjectKlantInteractie):
     verzoek = models.ForeignKey(
         "datamodel.Verzoek",
         on_delete=models.CASCADE,
@@ -241,7 +319,7 @@ class ObjectVerzoek(APIMixin, ObjectKlantInteractie):
         unique_together = ("verzoek", "object")
 
 
-class VerzoekProduct(APIMixin, models.Model):
+class VerzoekProduct(ETagMixin, APIMixin, models.Model):
     uuid = models.UUIDField(
         unique=True, default=uuid.uuid4, help_text="Unieke resource identifier (UUID4)"
     )
@@ -264,3 +342,72 @@ class VerzoekProduct(APIMixin, models.Model):
                 _("product or productIdentificatie must be provided"),
                 code="invalid-product",
             )
+
+
+class Verwijdering(models.Model):
+    """
+    Record the deletion of a resource, for the feed of changes.
+    """
+
+    resource = models.CharField(
+        max_length=20,
+        choices=Resource.choices,
+        help_text=_("Het soort resource dat is verwijderd."),
+    )
+    uuid = models.UUIDField(help_text=_("De UUID van de verwijderde resource."))
+    verwijderd = models.DateTimeField(
+        auto_now_add=True, help_text=_("Het tijdstip waarop de resource is verwijderd.")
+    )
+
+    class Meta:
+        verbose_name = "verwijdering"
+        verbose_name_plural = "verwijderingen"
+        indexes = [models.Index(fields=["resource", "verwijderd"])]
+
+
+class VolgnummerManager(models.Manager):
+    def next(self, resource: str, bronorganisatie: str, jaar: int, get_start) -> int:
+        """
+        Issue the next number of the resource for the bronorganisatie and year.
+
+        The row of the counter is locked until the number is saved, so that
+        concurrent requests get different numbers. ``get_start`` returns the
+        number to continue from, it is only called when the counter is
+        created.
+        """
+        with transaction.atomic():
+            volgnummer, _ = self.select_for_update().get_or_create(
+                resource=resource,
+                bronorganisatie=bronorganisatie,
+                jaar=jaar,
+                defaults={"nummer": get_start},
+            )
+            volgnummer.nummer += 1
+            volgnummer.save(update_fields=["nummer"])
+        return volgnummer.nummer
+
+
+class Volgnummer(models.Model):
+    """
+    Counter of the numbers in the identificaties of a resource.
+    """
+
+    resource = models.CharField(
+        max_length=20,
+        choices=Resource.choices,
+        help_text=_("Het soort resource waarvan de nummers worden geteld."),
+    )
+    bronorganisatie = RSINField(
+        help_text=_("De bronorganisatie waarvan de nummers worden geteld.")
+    )
+    jaar = models.PositiveSmallIntegerField(
+        help_text=_("Het jaar waarin de nummers worden geteld.")
+    )
+    nummer = models.PositiveIntegerField(help_text=_("Het laatst uitgegeven nummer."))
+
+    objects = VolgnummerManager()
+
+    class Meta:
+        verbose_name = "volgnummer"
+        verbose_name_plural = "volgnummers"
+        unique_together = ("resource", "bronorganisatie", "jaar")
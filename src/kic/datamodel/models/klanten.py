@@ -24,6 +24,7 @@ class NatuurlijkPersoon(models.Model):
 
     inp_bsn = BSNField(
         blank=True,
+        db_index=True,
         help_text="Het burgerservicenummer, bedoeld in artikel 1.1 van de Wet algemene bepalingen burgerservicenummer.",
     )
     anp_identificatie = models.CharField(
@@ -80,6 +81,7 @@ class NietNatuurlijkPersoon(models.Model):
 
     inn_nnp_id = RSINField(
         blank=True,
+        db_index=True,
         help_text="Het door een kamer toegekend uniek nummer voor de INGESCHREVEN NIET-NATUURLIJK PERSOON",
     )
 
@@ -124,6 +126,7 @@ class Vestiging(models.Model):
     vestigings_nummer = models.CharField(
         max_length=24,
         blank=True,
+        db_index=True,
         help_text="Een korte unieke aanduiding van de Vestiging.",
     )
     handelsnaam = ArrayField(
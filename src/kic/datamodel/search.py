@@ -0,0 +1,98 @@
+"""
+Search text of the KLANTen.
+
+The names and addresses of a KLANT are spread over the KLANT, its subject
+identificatie and its verblijfsadres. They're copied into ``Klant.zoektekst``
+whenever one of these changes, so that a single trigram index covers them.
+"""
+import threading
+from contextlib import contextmanager
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import QuerySet, Value
+
+from kic.utils.db import WordSimilarity
+
+from .models import Klant
+
+_state = threading.local()
+
+
+def normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def get_related(obj, name: str):
+    try:
+        return getattr(obj, name)
+    except ObjectDoesNotExist:
+        return None
+
+
+def get_zoektekst(klant: Klant) -> str:
+    values = [klant.voornaam, klant.achternaam, klant.adres]
+
+    natuurlijk_persoon = get_related(klant, "natuurlijk_persoon")
+    niet_natuurlijk_persoon = get_related(klant, "niet_natuurlijk_persoon")
+    vestiging = get_related(klant, "vestiging")
+
+    verblijfsadres = None
+    if natuurlijk_persoon is not None:
+        values.append(natuurlijk_persoon.geslachtsnaam)
+        verblijfsadres = get_related(natuurlijk_persoon, "verblijfsadres")
+    if niet_natuurlijk_persoon is not None:
+        values.append(niet_natuurlijk_persoon.statutaire_naam)
+    if vestiging is not None:
+        values += vestiging.handelsnaam
+        verblijfsadres = get_related(vestiging, "verblijfsadres")
+
+    if verblijfsadres is not None:
+        values += [verblijfsadres.gor_openbare_ruimte_naam, verblijfsadres.aoa_postcode]
+
+    return normalize(" ".join(value for value in values if value))
+
+
+def update_zoektekst(klanten: QuerySet) -> None:
+    if getattr(_state, "deferred", False):
+        return
+
+    klanten = klanten.select_related(
+        "natuurlijk_persoon__verblijfsadres",
+        "niet_natuurlijk_persoon",
+        "vestiging__verblijfsadres",
+    )
+    changed = []
+    for klant in klanten:
+        zoektekst = get_zoektekst(klant)
+        if klant.zoektekst != zoektekst:
+            klant.zoektekst = zoektekst
+            changed.append(klant)
+
+    if changed:
+        Klant.objects.bulk_update(changed, fields=["zoektekst"])
+
+
+@contextmanager
+def defer_zoektekst_updates():
+    """
+    Skip the updates of the search text on save, for bulk writes.
+
+    The caller is responsible for calling :func:`update_zoektekst` afterwards.
+    """
+    _state.deferred = True
+    try:
+        yield
+    finally:
+        _state.deferred = False
+
+
+def search(queryset: QuerySet, zoekterm: str) -> QuerySet:
+    """
+    Filter the KLANTen on the search term, best matches first.
+    """
+    zoekterm = normalize(zoekterm)
+    return (
+        queryset.filter(zoektekst__trigram_word_similar=zoekterm)
+        .annotate(rank=WordSimilarity(Value(zoekterm), "zoektekst"))
+        .order_by("-rank", "-pk")
+    )
@@ -0,0 +1,147 @@
+import threading
+from contextlib import contextmanager
+
+from django.db.models import Q, QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import (
+    Adres,
+    ContactMoment,
+    Klant,
+    Medewerker,
+    NatuurlijkPersoon,
+    NietNatuurlijkPersoon,
+    SubVerblijfBuitenland,
+    Verwijdering,
+    Verzoek,
+    Vestiging,
+)
+from .search import update_zoektekst
+
+_state = threading.local()
+
+
+def get_klanten(instance) -> QuerySet:
+    """
+    Return the KLANT of a subject identificatie or of one of its nested groups.
+    """
+    if hasattr(instance, "klant_id"):
+        return Klant.objects.filter(pk=instance.klant_id)
+
+    query = Q()
+    if instance.natuurlijkpersoon_id:
+        query |= Q(natuurlijk_persoon__pk=instance.natuurlijkpersoon_id)
+    if getattr(instance, "nietnatuurlijkpersoon_id", None):
+        query |= Q(niet_natuurlijk_persoon__pk=instance.nietnatuurlijkpersoon_id)
+    if instance.vestiging_id:
+        query |= Q(vestiging__pk=instance.vestiging_id)
+
+    if not query:
+        return Klant.objects.none()
+    return Klant.objects.filter(query)
+
+
+@contextmanager
+def skip_klant_change_marks():
+    """
+    Don't mark the KLANT as changed for every saved or deleted group, for bulk
+    writes.
+
+    The caller is responsible for marking the KLANTen as changed.
+    """
+    _state.skip_klant_change_marks = True
+    try:
+        yield
+    finally:
+        _state.skip_klant_change_marks = False
+
+
+@receiver(post_save, sender=Klant, dispatch_uid="datamodel.update_klant_zoektekst")
+def update_klant_zoektekst(sender, instance, update_fields=None, **kwargs):
+    # storing the (re)calculated ETag doesn't change the search text
+    if update_fields == {"_etag"}:
+        return
+    update_zoektekst(Klant.objects.filter(pk=instance.pk))
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=NatuurlijkPersoon,
+    dispatch_uid="datamodel.update_natuurlijk_persoon_zoektekst",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=NietNatuurlijkPersoon,
+    dispatch_uid="datamodel.update_niet_natuurlijk_persoon_zoektekst",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=Vestiging,
+    dispatch_uid="datamodel.update_vestiging_zoektekst",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=Adres,
+    dispatch_uid="datamodel.update_adres_zoektekst",
+)
+def update_subject_identificatie_zoektekst(sender, instance, **kwargs):
+    update_zoektekst(get_klanten(instance))
+
+
+# The nested groups are part of the representation of the KLANT and the
+# CONTACTMOMENT, but aren't ETag models themselves. Clear the stored ETag of the
+# resource they belong to, so that it is calculated again on the next read, and
+# mark the resource as modified for the feed of changes.
+@receiver(
+    [post_save, post_delete],
+    sender=NatuurlijkPersoon,
+    dispatch_uid="datamodel.mark_natuurlijk_persoon_klant_changed",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=NietNatuurlijkPersoon,
+    dispatch_uid="datamodel.mark_niet_natuurlijk_persoon_klant_changed",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=Vestiging,
+    dispatch_uid="datamodel.mark_vestiging_klant_changed",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=Adres,
+    dispatch_uid="datamodel.mark_adres_klant_changed",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=SubVerblijfBuitenland,
+    dispatch_uid="datamodel.mark_sub_verblijf_buitenland_klant_changed",
+)
+def mark_klant_changed(sender, instance, **kwargs):
+    if getattr(_state, "skip_klant_change_marks", False):
+        return
+    get_klanten(instance).update(_etag="", modified=timezone.now())
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=Medewerker,
+    dispatch_uid="datamodel.mark_medewerker_contactmoment_changed",
+)
+def mark_contactmoment_changed(sender, instance, **kwargs):
+    ContactMoment.objects.filter(pk=instance.contactmoment_id).update(
+        _etag="", modified=timezone.now()
+    )
+
+
+@receiver(post_delete, sender=Klant, dispatch_uid="datamodel.record_klant_deletion")
+@receiver(
+    post_delete,
+    sender=ContactMoment,
+    dispatch_uid="datamodel.record_contactmoment_deletion",
+)
+@receiver(post_delete, sender=Verzoek, dispatch_uid="datamodel.record_verzoek_deletion")
+def record_deletion(sender, instance, **kwargs):
+    Verwijdering.objects.create(resource=sender._meta.model_name, uuid=instance.uuid)
@@ -21,6 +21,11 @@ class KlantFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = "datamodel.Klant"
 
+    class Params:
+        with_etag = factory.Trait(
+            _etag=factory.PostGenerationMethodCall("calculate_etag_value")
+        )
+
 
 class ContactMomentFactory(factory.django.DjangoModelFactory):
     bronorganisatie = factory.Faker("ssn", locale="nl_NL")
@@ -101,6 +106,14 @@ class VerzoekProductFactory(factory.django.DjangoModelFactory):
         model = "datamodel.VerzoekProduct"
 
 
+class VerzoekInformatieObjectFactory(factory.django.DjangoModelFactory):
+    verzoek = factory.SubFactory(VerzoekFactory)
+    informatieobject = factory.Faker("url")
+
+    class Meta:
+        model = "datamodel.VerzoekInformatieObject"
+
+
 class VerzoekContactMomentFactory(factory.django.DjangoModelFactory):
     verzoek = factory.SubFactory(VerzoekFactory)
     contactmoment = factory.SubFactory(ContactMomentFactory)
@@ -0,0 +1,4 @@
+"""
+Deliver the notifications of the KIC to the Notificaties API (NRC).
+"""
+default_app_config = "kic.notifications.apps.NotificationsAppConfig"
@@ -0,0 +1,10 @@
+from django.contrib import admin
+
+from .models import QueuedNotification
+
+
+@admin.register(QueuedNotification)
+class QueuedNotificationAdmin(admin.ModelAdmin):
+    list_display = ["kanaal", "hoofd_object", "status", "attempts", "next_attempt"]
+    list_filter = ["status", "kanaal"]
+    search_fields = ["hoofd_object"]
@@ -0,0 +1,7 @@
+from django.apps import AppConfig
+
+
+class NotificationsAppConfig(AppConfig):
+    name = "kic.notifications"
+    # ``notifications`` is taken by vng_api_common.notifications
+    label = "kic_notifications"
@@ -0,0 +1,9 @@
+from django.utils.translation import ugettext_lazy as _
+
+from djchoices import ChoiceItem, DjangoChoices
+
+
+class NotificationStatus(DjangoChoices):
+    pending = ChoiceItem("pending", _("Pending"))
+    done = ChoiceItem("done", _("Done"))
+    failed = ChoiceItem("failed", _("Failed"))
@@ -0,0 +1,41 @@
+import time
+
+from django.core.management import BaseCommand
+
+from ...outbox import process_pending
+
+
+class Command(BaseCommand):
+    help = "Send the queued notifications to the Notificaties API."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Maximum number of notifications to send per run.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling for new notifications instead of exiting.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=1,
+            help="Seconds to wait when there are no due notifications (with --loop).",
+        )
+
+    def handle(self, **options):
+        while True:
+            processed = process_pending(batch_size=options["batch_size"])
+            if processed:
+                self.stdout.write(f"Sent {processed} notification(s)")
+
+            if not options["loop"]:
+                break
+
+            # keep going while there is a backlog
+            if processed < options["batch_size"]:
+                time.sleep(options["interval"])
@@ -0,0 +1,80 @@
+# Generated by Django 2.2.11 on 2026-10-18 11:09
+
+import django.contrib.postgres.fields.jsonb
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="QueuedNotification",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("kanaal", models.CharField(max_length=50, verbose_name="kanaal")),
+                (
+                    "hoofd_object",
+                    models.URLField(max_length=1000, verbose_name="hoofd object"),
+                ),
+                (
+                    "message",
+                    django.contrib.postgres.fields.jsonb.JSONField(
+                        verbose_name="message"
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("done", "Done"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=20,
+                        verbose_name="status",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveSmallIntegerField(
+                        default=0, verbose_name="attempts"
+                    ),
+                ),
+                (
+                    "next_attempt",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="next attempt"
+                    ),
+                ),
+                ("last_error", models.TextField(blank=True, verbose_name="last error")),
+                (
+                    "created",
+                    models.DateTimeField(auto_now_add=True, verbose_name="created"),
+                ),
+            ],
+            options={
+                "verbose_name": "queued notification",
+                "verbose_name_plural": "queued notifications",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="queuednotification",
+            index=models.Index(
+                fields=["status", "next_attempt"], name="kic_notific_status_f98b77_idx"
+            ),
+        ),
+    ]
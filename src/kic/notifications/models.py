@@ -0,0 +1,37 @@
+from django.contrib.postgres.fields import JSONField
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import ugettext_lazy as _
+
+from .constants import NotificationStatus
+
+
+class QueuedNotification(models.Model):
+    """
+    Outbox entry for a notification that still has to be sent to the NRC.
+
+    The entry is written while handling the request, and sent by
+    ``manage.py process_notifications``.
+    """
+
+    kanaal = models.CharField(_("kanaal"), max_length=50)
+    hoofd_object = models.URLField(_("hoofd object"), max_length=1000)
+    message = JSONField(_("message"))
+    status = models.CharField(
+        _("status"),
+        max_length=20,
+        choices=NotificationStatus.choices,
+        default=NotificationStatus.pending,
+    )
+    attempts = models.PositiveSmallIntegerField(_("attempts"), default=0)
+    next_attempt = models.DateTimeField(_("next attempt"), default=timezone.now)
+    last_error = models.TextField(_("last error"), blank=True)
+    created = models.DateTimeField(_("created"), auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("queued notification")
+        verbose_name_plural = _("queued notifications")
+        indexes = [models.Index(fields=["status", "next_attempt"])]
+
+    def __str__(self):
+        return f"{self.kanaal} {self.hoofd_object}"
@@ -0,0 +1,126 @@
+"""
+Outbox for the notifications to the Notificaties API (NRC).
+
+Instead of sending the notification while handling the request, it is written
+as a :class:`QueuedNotification` and sent by a worker
+(``manage.py process_notifications``). The worker sends the due notifications
+in batches over a single (kept-alive) connection, and retries the failed ones
+with an exponential backoff.
+"""
+import logging
+from datetime import timedelta
+from typing import Iterable
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from vng_api_common.notifications.models import NotificationsConfig
+from zds_client import Client, ClientError
+
+from .constants import NotificationStatus
+from .models import QueuedNotification
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue(messages: Iterable[dict]) -> None:
+    QueuedNotification.objects.bulk_create(
+        [
+            QueuedNotification(
+                kanaal=message["kanaal"],
+                hoofd_object=message["hoofdObject"],
+                message=message,
+            )
+            for message in messages
+        ]
+    )
+
+
+def get_backoff(attempts: int) -> timedelta:
+    seconds = settings.NOTIFICATIONS_RETRY_BACKOFF * 2 ** (attempts - 1)
+    return timedelta(seconds=min(seconds, settings.NOTIFICATIONS_MAX_BACKOFF))
+
+
+def claim_notification(notification: QueuedNotification) -> None:
+    """
+    Count the attempt before the notification is sent.
+
+    The next attempt is scheduled already, so that a notification that
+    crashes the worker is retried after the backoff and eventually given up
+    on, like any other failure.
+    """
+    notification.attempts += 1
+    notification.next_attempt = timezone.now() + get_backoff(notification.attempts)
+    notification.save(update_fields=["attempts", "next_attempt"])
+
+
+def record_failure(notification: QueuedNotification, exc: Exception) -> None:
+    logger.warning("Could not deliver notification %s", notification.pk, exc_info=exc)
+    notification.last_error = str(exc)
+    if notification.attempts >= settings.NOTIFICATIONS_MAX_ATTEMPTS:
+        logger.error("Giving up on notification %s", notification.pk)
+        notification.status = NotificationStatus.failed
+    notification.save(update_fields=["status", "last_error"])
+
+
+def send_notification(notification: QueuedNotification, client: Client) -> None:
+    try:
+        client.create("notificaties", notification.message)
+    except Exception as exc:
+        record_failure(notification, exc)
+    else:
+        notification.status = NotificationStatus.done
+        notification.last_error = ""
+        notification.save(update_fields=["status", "last_error"])
+
+
+def process_pending(batch_size: int = 100) -> int:
+    """
+    Send the notifications that are due, returning how many were attempted.
+
+    Every notification is claimed in its own transaction, which is committed
+    before it is sent, so that no locks are held while sending and a failure
+    only affects that notification. The claim moves the next attempt forward,
+    so that other workers skip the notification in the meantime. The
+    notifications about a main object are sent in order, so a retried
+    notification is never overtaken by a later one about the same object.
+    """
+    client = None
+    processed = 0
+    skipped = []
+    while processed < batch_size:
+        with transaction.atomic():
+            notification = (
+                QueuedNotification.objects.select_for_update(skip_locked=True)
+                .filter(
+                    status=NotificationStatus.pending, next_attempt__lte=timezone.now()
+                )
+                .exclude(pk__in=skipped)
+                .order_by("pk")
+                .first()
+            )
+            if notification is None:
+                break
+
+            blocked = QueuedNotification.objects.filter(
+                status=NotificationStatus.pending,
+                hoofd_object=notification.hoofd_object,
+                pk__lt=notification.pk,
+            ).exists()
+            if blocked:
+                skipped.append(notification.pk)
+                continue
+
+            claim_notification(notification)
+
+        processed += 1
+        if client is None:
+            try:
+                client = NotificationsConfig.get_client()
+            except Exception as exc:
+                record_failure(notification, exc)
+                continue
+        send_notification(notification, client)
+
+    return processed
@@ -0,0 +1,264 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+
+from freezegun import freeze_time
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, reverse
+from zds_client import ClientError
+
+from kic.datamodel.constants import KlantType
+from kic.datamodel.models import ContactMoment, Klant
+from kic.datamodel.tests.factories import KlantFactory
+
+from ..constants import NotificationStatus
+from ..models import QueuedNotification
+from ..outbox import process_pending
+
+
+class WorkerCrash(BaseException):
+    pass
+
+
+@override_settings(
+    NOTIFICATIONS_DISABLED=False,
+    NOTIFICATIONS_MAX_ATTEMPTS=3,
+    NOTIFICATIONS_RETRY_BACKOFF=10,
+    NOTIFICATIONS_MAX_BACKOFF=15,
+)
+class OutboxTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+
+        self.client_mock = MagicMock()
+        patcher = patch(
+            "kic.notifications.outbox.NotificationsConfig.get_client",
+            return_value=self.client_mock,
+        )
+        self.get_client = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def create_klant(self) -> str:
+        response = self.client.post(
+            reverse("klant-list"),
+            {
+                "voornaam": "Klaas",
+                "subject": "https://brp.nl/ingeschrevenpersonen/1",
+                "subjectType": KlantType.natuurlijk_persoon,
+            },
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.data["url"]
+
+    @freeze_time("2020-01-01 12:00:00")
+    def test_write_enqueues_notification(self):
+        klant_url = self.create_klant()
+
+        notification = QueuedNotification.objects.get()
+        self.assertEqual(notification.kanaal, "klanten")
+        self.assertEqual(notification.hoofd_object, klant_url)
+        self.assertEqual(
+            notification.message,
+            {
+                "kanaal": "klanten",
+                "hoofdObject": klant_url,
+                "resource": "klant",
+                "resourceUrl": klant_url,
+                "actie": "create",
+                "aanmaakdatum": "2020-01-01T12:00:00Z",
+                "kenmerken": {"subjectType": KlantType.natuurlijk_persoon},
+            },
+        )
+        self.get_client.assert_not_called()
+
+    def test_destroy_enqueues_notification(self):
+        klant = KlantFactory.create()
+
+        response = self.client.delete(reverse(klant))
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(QueuedNotification.objects.get().message["actie"], "destroy")
+
+    def test_bulk_create_enqueues_creates(self):
+        klant = KlantFactory.create()
+        data = {
+            "bronorganisatie": "423182687",
+            "klant": f"http://testserver{reverse(klant)}",
+            "kanaal": "telefoon",
+            "medewerker": "http://example.com/medewerker/1",
+        }
+
+        response = self.client.post(reverse("contactmoment-bulk"), [data, data])
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        notifications = QueuedNotification.objects.order_by("pk")
+        self.assertEqual(
+            [notification.hoofd_object for notification in notifications],
+            [item["url"] for item in response.data],
+        )
+        for notification in notifications:
+            self.assertEqual(notification.kanaal, "contactmomenten")
+            self.assertEqual(notification.message["actie"], "create")
+            self.assertEqual(notification.message["kenmerken"]["kanaal"], "telefoon")
+        self.assertEqual(ContactMoment.objects.count(), 2)
+
+    def test_write_is_rolled_back_if_enqueue_fails(self):
+        with patch(
+            "kic.notifications.viewsets.enqueue", side_effect=ValueError("outbox")
+        ):
+            response = self.client.post(
+                reverse("klant-list"),
+                {
+                    "voornaam": "Klaas",
+                    "subject": "https://brp.nl/ingeschrevenpersonen/1",
+                    "subjectType": KlantType.natuurlijk_persoon,
+                },
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.assertFalse(Klant.objects.exists())
+
+    def test_bulk_create_is_rolled_back_if_enqueue_fails(self):
+        klant = KlantFactory.create()
+        data = {
+            "bronorganisatie": "423182687",
+            "klant": f"http://testserver{reverse(klant)}",
+            "kanaal": "telefoon",
+            "medewerker": "http://example.com/medewerker/1",
+        }
+
+        with patch(
+            "kic.notifications.viewsets.enqueue", side_effect=ValueError("outbox")
+        ):
+            response = self.client.post(reverse("contactmoment-bulk"), [data, data])
+
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.assertFalse(ContactMoment.objects.exists())
+
+    @override_settings(NOTIFICATIONS_DISABLED=True)
+    def test_notifications_disabled(self):
+        self.create_klant()
+
+        self.assertFalse(QueuedNotification.objects.exists())
+
+    def test_process_pending(self):
+        self.create_klant()
+        self.create_klant()
+
+        processed = process_pending()
+
+        self.assertEqual(processed, 2)
+        # one client, and thus one connection pool, for the batch
+        self.get_client.assert_called_once()
+        self.assertEqual(self.client_mock.create.call_count, 2)
+        notification = QueuedNotification.objects.first()
+        self.client_mock.create.assert_any_call("notificaties", notification.message)
+        self.assertEqual(
+            set(QueuedNotification.objects.values_list("status", flat=True)),
+            {NotificationStatus.done},
+        )
+
+    @freeze_time("2020-01-01 12:00:00")
+    def test_failed_notification_is_retried(self):
+        self.create_klant()
+        notification = QueuedNotification.objects.get()
+        self.client_mock.create.side_effect = ClientError({"detail": "unavailable"})
+
+        process_pending()
+
+        notification.refresh_from_db()
+        self.assertEqual(notification.status, NotificationStatus.pending)
+        self.assertEqual(notification.attempts, 1)
+        self.assertEqual(
+            notification.next_attempt, timezone.now() + timedelta(seconds=10)
+        )
+        self.assertIn("unavailable", notification.last_error)
+
+        # not due yet
+        self.assertEqual(process_pending(), 0)
+
+        with freeze_time("2020-01-01 12:00:10"):
+            process_pending()
+
+        notification.refresh_from_db()
+        self.assertEqual(notification.attempts, 2)
+        # capped by NOTIFICATIONS_MAX_BACKOFF
+        self.assertEqual(
+            notification.next_attempt, timezone.now() + timedelta(seconds=10 + 15)
+        )
+
+        with freeze_time("2020-01-01 12:00:25"):
+            process_pending()
+
+        notification.refresh_from_db()
+        self.assertEqual(notification.status, NotificationStatus.failed)
+        self.assertEqual(notification.attempts, 3)
+
+    def test_unexpected_error_is_recorded(self):
+        self.create_klant()
+        self.create_klant()
+        self.client_mock.create.side_effect = [ValueError("bad response"), None]
+
+        processed = process_pending()
+
+        self.assertEqual(processed, 2)
+        first, second = QueuedNotification.objects.order_by("pk")
+        self.assertEqual(first.status, NotificationStatus.pending)
+        self.assertEqual(first.attempts, 1)
+        self.assertEqual(first.last_error, "bad response")
+        self.assertEqual(second.status, NotificationStatus.done)
+
+    def test_client_error_is_recorded(self):
+        self.create_klant()
+        self.get_client.side_effect = ImproperlyConfigured("no NRC")
+
+        process_pending()
+
+        notification = QueuedNotification.objects.get()
+        self.assertEqual(notification.status, NotificationStatus.pending)
+        self.assertEqual(notification.attempts, 1)
+        self.assertEqual(notification.last_error, "no NRC")
+
+    def test_attempt_is_recorded_before_sending(self):
+        self.create_klant()
+        self.client_mock.create.side_effect = WorkerCrash
+
+        with self.assertRaises(WorkerCrash):
+            process_pending()
+
+        notification = QueuedNotification.objects.get()
+        self.assertEqual(notification.status, NotificationStatus.pending)
+        self.assertEqual(notification.attempts, 1)
+        self.assertGreater(notification.next_attempt, timezone.now())
+
+    def test_notifications_about_object_are_ordered(self):
+        klant_url = self.create_klant()
+        response = self.client.patch(klant_url, {"voornaam": "Piet"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # the create is waiting for a retry
+        create = QueuedNotification.objects.order_by("pk").first()
+        QueuedNotification.objects.filter(pk=create.pk).update(
+            attempts=1, next_attempt=timezone.now() + timedelta(minutes=1)
+        )
+
+        processed = process_pending()
+
+        self.assertEqual(processed, 0)
+        self.client_mock.create.assert_not_called()
+
+    def test_command(self):
+        self.create_klant()
+        stdout = StringIO()
+
+        call_command("process_notifications", stdout=stdout)
+
+        self.assertEqual(stdout.getvalue(), "Sent 1 notification(s)\n")
+        self.client_mock.create.assert_called_once()
@@ -0,0 +1,63 @@
+from typing import Dict, List, Union
+
+from django.conf import settings
+from django.db import models, transaction
+
+from rest_framework.permissions import SAFE_METHODS
+from vng_api_common.notifications.viewsets import NotificationMixin
+
+from .outbox import enqueue
+
+
+class QueuedNotificationMixin(NotificationMixin):
+    """
+    Queue the notifications in the outbox instead of sending them right away.
+
+    Put this mixin before the notification mixins of ``vng_api_common``.
+
+    A write and its queued notifications are committed in one transaction, so
+    that a notification is never lost while the write is kept. The
+    transaction wraps the whole request, because the notification mixins
+    notify after the write, outside the ``perform_*`` hooks.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method in SAFE_METHODS:
+            return super().dispatch(request, *args, **kwargs)
+
+        with transaction.atomic():
+            response = super().dispatch(request, *args, **kwargs)
+            # errors are turned into responses instead of exceptions
+            if response.status_code >= 400:
+                transaction.set_rollback(True)
+        return response
+
+    def construct_message(self, data: dict, instance: models.Model = None) -> dict:
+        message = super().construct_message(data, instance=instance)
+        # the objects of a bulk create are notified like single creates
+        if self.action == "bulk":
+            message["actie"] = "create"
+        return message
+
+    def notify(
+        self,
+        status_code: int,
+        data: Union[List, Dict],
+        instance: Union[List[models.Model], models.Model] = None,
+    ) -> None:
+        if settings.NOTIFICATIONS_DISABLED:
+            return
+
+        if not 200 <= status_code < 300:
+            return
+
+        if isinstance(data, list):
+            instances = instance or [None] * len(data)
+            messages = [
+                self.construct_message(item, instance=item_instance)
+                for item, item_instance in zip(data, instances)
+            ]
+        else:
+            messages = [self.construct_message(data, instance=instance)]
+
+        enqueue(messages)
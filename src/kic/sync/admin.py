@@ -0,0 +1,17 @@
+from django.contrib import admin
+
+from .models import SyncOperation
+
+
+@admin.register(SyncOperation)
+class SyncOperationAdmin(admin.ModelAdmin):
+    list_display = [
+        "operation",
+        "verzoek",
+        "informatieobject",
+        "status",
+        "attempts",
+        "next_attempt",
+    ]
+    list_filter = ["status", "operation"]
+    search_fields = ["verzoek", "informatieobject"]
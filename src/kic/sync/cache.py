@@ -0,0 +1,38 @@
+"""
+Mark VERZOEK-INFORMATIEOBJECT relations that are being deleted.
+
+While the relation is deleted in the DRC (synchronously), the DRC checks that
+the KIC no longer has the relation. The relation is marked in the
+``drc_sync`` cache during that call, and marked relations are left out of the
+API responses.
+
+Every relation has its own key with a timeout, so concurrent deletes don't
+overwrite each other's marks, and a mark is never left behind forever.
+"""
+from typing import Iterable, Set
+from uuid import UUID
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+def get_cache_key(uuid: UUID) -> str:
+    return f"vio_marked_for_delete:{uuid}"
+
+
+def mark_for_delete(uuid: UUID) -> None:
+    caches["drc_sync"].set(
+        get_cache_key(uuid), True, timeout=settings.DRC_SYNC_MARK_TIMEOUT
+    )
+
+
+def unmark_for_delete(uuid: UUID) -> None:
+    caches["drc_sync"].delete(get_cache_key(uuid))
+
+
+def get_marked_for_delete(uuids: Iterable[UUID]) -> Set[str]:
+    keys = {get_cache_key(uuid): str(uuid) for uuid in uuids}
+    if not keys:
+        return set()
+    marked = caches["drc_sync"].get_many(keys.keys())
+    return {keys[key] for key in marked}
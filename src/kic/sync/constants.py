@@ -0,0 +1,14 @@
+from django.utils.translation import ugettext_lazy as _
+
+from djchoices import ChoiceItem, DjangoChoices
+
+
+class SyncOperationTypes(DjangoChoices):
+    create = ChoiceItem("create", _("Create"))
+    delete = ChoiceItem("delete", _("Delete"))
+
+
+class SyncOperationStatus(DjangoChoices):
+    pending = ChoiceItem("pending", _("Pending"))
+    done = ChoiceItem("done", _("Done"))
+    failed = ChoiceItem("failed", _("Failed"))
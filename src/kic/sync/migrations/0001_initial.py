@@ -0,0 +1,81 @@
+# Generated by Django 2.2.11 on 2026-10-18 10:38
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="SyncOperation",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "operation",
+                    models.CharField(
+                        choices=[("create", "Create"), ("delete", "Delete")],
+                        max_length=20,
+                        verbose_name="operation",
+                    ),
+                ),
+                ("verzoek", models.URLField(max_length=1000, verbose_name="verzoek")),
+                (
+                    "informatieobject",
+                    models.URLField(max_length=1000, verbose_name="informatieobject"),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("done", "Done"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=20,
+                        verbose_name="status",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveSmallIntegerField(
+                        default=0, verbose_name="attempts"
+                    ),
+                ),
+                (
+                    "next_attempt",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="next attempt"
+                    ),
+                ),
+                ("last_error", models.TextField(blank=True, verbose_name="last error")),
+                (
+                    "created",
+                    models.DateTimeField(auto_now_add=True, verbose_name="created"),
+                ),
+            ],
+            options={
+                "verbose_name": "sync operation",
+                "verbose_name_plural": "sync operations",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="syncoperation",
+            index=models.Index(
+                fields=["status", "next_attempt"], name="sync_syncop_status_b72376_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,39 @@
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import ugettext_lazy as _
+
+from .constants import SyncOperationStatus, SyncOperationTypes
+
+
+class SyncOperation(models.Model):
+    """
+    Outbox entry for a change of a VERZOEK-INFORMATIEOBJECT relation that
+    still has to be mirrored in the Documenten API.
+
+    The entry is written in the same transaction as the relation itself, and
+    processed by ``manage.py process_sync_operations``.
+    """
+
+    operation = models.CharField(
+        _("operation"), max_length=20, choices=SyncOperationTypes.choices
+    )
+    verzoek = models.URLField(_("verzoek"), max_length=1000)
+    informatieobject = models.URLField(_("informatieobject"), max_length=1000)
+    status = models.CharField(
+        _("status"),
+        max_length=20,
+        choices=SyncOperationStatus.choices,
+        default=SyncOperationStatus.pending,
+    )
+    attempts = models.PositiveSmallIntegerField(_("attempts"), default=0)
+    next_attempt = models.DateTimeField(_("next attempt"), default=timezone.now)
+    last_error = models.TextField(_("last error"), blank=True)
+    created = models.DateTimeField(_("created"), auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("sync operation")
+        verbose_name_plural = _("sync operations")
+        indexes = [models.Index(fields=["status", "next_attempt"])]
+
+    def __str__(self):
+        return f"{self.operation} {self.verzoek} - {self.informatieobject}"
@@ -0,0 +1,110 @@
+"""
+Transactional outbox for the synchronisation with the Documenten API.
+
+Instead of calling the DRC while handling the request, the change is written
+as a :class:`SyncOperation` in the same transaction as the relation itself,
+and mirrored in the DRC by a worker (``manage.py process_sync_operations``).
+Failed operations are retried with an exponential backoff.
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .constants import SyncOperationStatus, SyncOperationTypes
+from .models import SyncOperation
+from .signals import SyncError, sync_create, sync_delete
+
+logger = logging.getLogger(__name__)
+
+
+def get_backoff(attempts: int) -> timedelta:
+    seconds = settings.DRC_SYNC_RETRY_BACKOFF * 2 ** (attempts - 1)
+    return timedelta(seconds=min(seconds, settings.DRC_SYNC_MAX_BACKOFF))
+
+
+def claim_operation(sync_operation: SyncOperation) -> None:
+    """
+    Count the attempt before the DRC is called.
+
+    The next attempt is scheduled already, so that an operation that crashes
+    the worker is retried after the backoff and eventually given up on, like
+    any other failure.
+    """
+    sync_operation.attempts += 1
+    sync_operation.next_attempt = timezone.now() + get_backoff(sync_operation.attempts)
+    sync_operation.save(update_fields=["attempts", "next_attempt"])
+
+
+def process_operation(sync_operation: SyncOperation) -> None:
+    try:
+        if sync_operation.operation == SyncOperationTypes.create:
+            # an earlier attempt may have reached the DRC even though it
+            # failed for us, or was never recorded, so always check first
+            sync_create(
+                sync_operation.verzoek,
+                sync_operation.informatieobject,
+                check_existing=True,
+            )
+        else:
+            sync_delete(sync_operation.verzoek, sync_operation.informatieobject)
+    except Exception as exc:
+        if not isinstance(exc, SyncError):
+            logger.exception("Could not process sync operation %s", sync_operation.pk)
+        sync_operation.last_error = str(exc.__cause__ or exc)
+        if sync_operation.attempts >= settings.DRC_SYNC_MAX_ATTEMPTS:
+            logger.error("Giving up on sync operation %s", sync_operation.pk)
+            sync_operation.status = SyncOperationStatus.failed
+    else:
+        sync_operation.status = SyncOperationStatus.done
+        sync_operation.last_error = ""
+
+    sync_operation.save(update_fields=["status", "last_error"])
+
+
+def process_pending(batch_size: int = 100) -> int:
+    """
+    Process the operations that are due, returning how many were attempted.
+
+    Every operation is claimed in its own transaction, which is committed
+    before the DRC is called, so that no locks are held during the call and a
+    failure only affects that operation. The claim moves the next attempt
+    forward, so that other workers skip the operation in the meantime. The
+    operations for a relation are processed in order, so a delete never
+    overtakes the create it follows.
+    """
+    processed = 0
+    skipped = []
+    while processed < batch_size:
+        with transaction.atomic():
+            sync_operation = (
+                SyncOperation.objects.select_for_update(skip_locked=True)
+                .filter(
+                    status=SyncOperationStatus.pending,
+                    next_attempt__lte=timezone.now(),
+                )
+                .exclude(pk__in=skipped)
+                .order_by("pk")
+                .first()
+            )
+            if sync_operation is None:
+                break
+
+            blocked = SyncOperation.objects.filter(
+                status=SyncOperationStatus.pending,
+                verzoek=sync_operation.verzoek,
+                informatieobject=sync_operation.informatieobject,
+                pk__lt=sync_operation.pk,
+            ).exists()
+            if blocked:
+                skipped.append(sync_operation.pk)
+                continue
+
+            claim_operation(sync_operation)
+
+        process_operation(sync_operation)
+        processed += 1
+
+    return processed
@@ -1,16 +1,17 @@
 import logging
 
 from django.conf import settings
-from django.contrib.sites.models import Site
-from django.core.cache import caches
-from django.db.models.signals import post_delete, post_save, pre_delete
+from django.db.models.signals import post_save, pre_delete
 from django.dispatch import receiver
-from django.urls import reverse
+from django.utils.module_loading import import_string
 
-from vng_api_common.models import APICredential
-from zds_client import Client, extract_params, get_operation_url
+from kic.api.auth import get_client_auth
+from kic.api.utils import get_absolute_url
+from kic.datamodel.models import VerzoekInformatieObject
 
-from kic.datamodel.models import Verzoek, VerzoekInformatieObject
+from .cache import mark_for_delete, unmark_for_delete
+from .constants import SyncOperationTypes
+from .models import SyncOperation
 
 logger = logging.getLogger(__name__)
 
@@ -19,38 +20,50 @@ class SyncError(Exception):
     pass
 
 
-def sync_create_vio(relation: VerzoekInformatieObject):
-    operation = "create"
+def get_drc_client(informatieobject: str):
+    # dynamic so that it can be mocked in tests easily
+    Client = import_string(settings.ZDS_CLIENT_CLASS)
+    client = Client.from_url(informatieobject)
+    client.auth = get_client_auth(informatieobject)
+    return client
 
-    # build the URL of the Verzoek
-    path = reverse(
-        "verzoek-detail",
-        kwargs={
-            "version": settings.REST_FRAMEWORK["DEFAULT_VERSION"],
-            "uuid": relation.verzoek.uuid,
-        },
+
+def get_remote_relations(client, verzoek_url: str, informatieobject: str) -> list:
+    return client.list(
+        "objectinformatieobject",
+        query_params={"object": verzoek_url, "informatieobject": informatieobject},
     )
-    domain = Site.objects.get_current().domain
-    protocol = "https" if settings.IS_HTTPS else "http"
-    verzoek_url = f"{protocol}://{domain}{path}"
+
+
+def sync_create(verzoek_url: str, informatieobject: str, check_existing=False):
+    """
+    Create the mirrored relation in the DRC.
+
+    With ``check_existing``, nothing is done if the relation already exists,
+    which makes retrying an operation that may have succeeded safe.
+    """
+    operation = "create"
 
     logger.info("Verzoek: %s", verzoek_url)
-    logger.info("Informatieobject: %s", relation.informatieobject)
+    logger.info("Informatieobject: %s", informatieobject)
 
     # Define the remote resource with which we need to interact
     resource = "objectinformatieobject"
-    client = Client.from_url(relation.informatieobject)
-
-    # TODO?
-    client.auth = APICredential.get_auth(relation.informatieobject)
+    client = get_drc_client(informatieobject)
 
     try:
+        if check_existing and get_remote_relations(
+            client, verzoek_url, informatieobject
+        ):
+            logger.info("Remote relation already exists")
+            return
+
         operation_function = getattr(client, operation)
         operation_function(
             resource,
             {
                 "object": verzoek_url,
-                "informatieobject": relation.informatieobject,
+                "informatieobject": informatieobject,
                 "objectType": "verzoek",
             },
         )
@@ -59,46 +72,60 @@ def sync_create_vio(relation: VerzoekInformatieObject):
         raise SyncError(f"Could not {operation} remote relation") from exc
 
 
-def sync_delete_vio(relation: VerzoekInformatieObject):
+def sync_delete(verzoek_url: str, informatieobject: str):
+    """
+    Delete the mirrored relation in the DRC, if it (still) exists.
+    """
     operation = "delete"
 
-    # build the URL of the Verzoek
-    path = reverse(
-        "verzoek-detail",
-        kwargs={
-            "version": settings.REST_FRAMEWORK["DEFAULT_VERSION"],
-            "uuid": relation.verzoek.uuid,
-        },
-    )
-    domain = Site.objects.get_current().domain
-    protocol = "https" if settings.IS_HTTPS else "http"
-    verzoek_url = f"{protocol}://{domain}{path}"
-
     logger.info("Verzoek: %s", verzoek_url)
-    logger.info("Informatieobject: %s", relation.informatieobject)
+    logger.info("Informatieobject: %s", informatieobject)
 
     # Define the remote resource with which we need to interact
     resource = "objectinformatieobject"
-    client = Client.from_url(relation.informatieobject)
-    client.auth = APICredential.get_auth(relation.informatieobject)
+    client = get_drc_client(informatieobject)
 
-    # Retrieve the url of the relation between the object and the
-    response = client.list(resource, query_params={"object": verzoek_url})
     try:
-        relation_url = response[0]["url"]
-    except IndexError as exc:
-        msg = "No relations found in DRC for this Verzoek"
-        logger.error(msg, exc_info=1)
-        raise IndexError(msg) from exc
+        # Retrieve the url of the relation between the object and the
+        # informatieobject
+        relations = get_remote_relations(client, verzoek_url, informatieobject)
+        if not relations:
+            logger.info("No relations found in DRC for this Verzoek")
+            return
 
-    try:
         operation_function = getattr(client, operation)
-        operation_function(resource, url=relation_url)
+        operation_function(resource, url=relations[0]["url"])
     except Exception as exc:
         logger.error(f"Could not {operation} remote relation", exc_info=1)
         raise SyncError(f"Could not {operation} remote relation") from exc
 
 
+def sync_create_vio(relation: VerzoekInformatieObject):
+    # build the URL of the Verzoek
+    verzoek_url = get_absolute_url("verzoek-detail", uuid=relation.verzoek.uuid)
+    sync_create(verzoek_url, relation.informatieobject)
+
+
+def sync_delete_vio(relation: VerzoekInformatieObject):
+    # build the URL of the Verzoek
+    verzoek_url = get_absolute_url("verzoek-detail", uuid=relation.verzoek.uuid)
+    sync_delete(verzoek_url, relation.informatieobject)
+
+
+def enqueue_sync_operation(
+    operation: str, relation: VerzoekInformatieObject
+) -> SyncOperation:
+    """
+    Add the operation to the outbox, processed by :mod:`kic.sync.outbox`.
+    """
+    verzoek_url = get_absolute_url("verzoek-detail", uuid=relation.verzoek.uuid)
+    return SyncOperation.objects.create(
+        operation=operation,
+        verzoek=verzoek_url,
+        informatieobject=relation.informatieobject,
+    )
+
+
 #
 #
 # def sync_create_verzoek(verzoek: Verzoek):
@@ -162,28 +189,23 @@ def sync_delete_vio(relation: VerzoekInformatieObject):
 def sync_informatieobject_relation(
     sender, instance: VerzoekInformatieObject = None, **kwargs
 ):
-    cache_key = "vios_marked_for_delete"
-
     signal = kwargs["signal"]
-    if signal is post_save and kwargs.get("created", False):
+    if settings.DRC_SYNC_ASYNC:
+        if signal is post_save and kwargs.get("created", False):
+            enqueue_sync_operation(SyncOperationTypes.create, instance)
+        elif signal is pre_delete:
+            enqueue_sync_operation(SyncOperationTypes.delete, instance)
+    elif signal is post_save and kwargs.get("created", False):
         sync_create_vio(instance)
     elif signal is pre_delete:
-        # Add the uuid of the VerzoekInformatieObject to the list of vios that are
-        # marked for delete, causing them not to show up when performing
-        # GET requests on the kic, allowing the validation in the DRC to pass
-        cache = caches["drc_sync"]
-        marked_vios = cache.get(cache_key)
-        if marked_vios:
-            cache.set(cache_key, marked_vios + [instance.uuid])
-        else:
-            cache.set(cache_key, [instance.uuid])
-
+        # Mark the VerzoekInformatieObject for delete, causing it not to show
+        # up when performing GET requests on the kic, allowing the validation
+        # in the DRC to pass
+        mark_for_delete(instance.uuid)
         try:
             sync_delete_vio(instance)
         finally:
-            marked_vios = cache.get(cache_key)
-            marked_vios.remove(instance.uuid)
-            cache.set(cache_key, marked_vios)
+            unmark_for_delete(instance.uuid)
 
 
 #
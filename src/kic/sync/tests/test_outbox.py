@@ -0,0 +1,216 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from freezegun import freeze_time
+from zds_client import ClientError
+
+from kic.datamodel.tests.factories import VerzoekInformatieObjectFactory
+
+from ..constants import SyncOperationStatus, SyncOperationTypes
+from ..models import SyncOperation
+from ..outbox import process_pending
+
+INFORMATIEOBJECT = "https://drc.example.com/api/v1/enkelvoudiginformatieobjecten/1234"
+
+
+class WorkerCrash(BaseException):
+    pass
+
+
+@override_settings(
+    DRC_SYNC_ASYNC=True,
+    DRC_SYNC_MAX_ATTEMPTS=3,
+    DRC_SYNC_RETRY_BACKOFF=10,
+    DRC_SYNC_MAX_BACKOFF=15,
+)
+class OutboxTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.drc_client = MagicMock()
+        self.drc_client.list.return_value = []
+        patcher = patch("kic.sync.signals.get_drc_client", return_value=self.drc_client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_write_enqueues_operations(self):
+        relation = VerzoekInformatieObjectFactory.create(
+            informatieobject=INFORMATIEOBJECT
+        )
+        relation.delete()
+
+        sync_operations = SyncOperation.objects.order_by("pk")
+        self.assertEqual(
+            [sync_operation.operation for sync_operation in sync_operations],
+            [SyncOperationTypes.create, SyncOperationTypes.delete],
+        )
+        self.assertEqual(sync_operations[0].informatieobject, INFORMATIEOBJECT)
+        self.assertTrue(sync_operations[0].verzoek.endswith(str(relation.verzoek.uuid)))
+        self.drc_client.create.assert_not_called()
+        self.drc_client.delete.assert_not_called()
+
+    def test_process_create(self):
+        relation = VerzoekInformatieObjectFactory.create(
+            informatieobject=INFORMATIEOBJECT
+        )
+        sync_operation = SyncOperation.objects.get()
+
+        processed = process_pending()
+
+        self.assertEqual(processed, 1)
+        self.drc_client.list.assert_called_once()
+        self.drc_client.create.assert_called_once_with(
+            "objectinformatieobject",
+            {
+                "object": sync_operation.verzoek,
+                "informatieobject": relation.informatieobject,
+                "objectType": "verzoek",
+            },
+        )
+        sync_operation.refresh_from_db()
+        self.assertEqual(sync_operation.status, SyncOperationStatus.done)
+        self.assertEqual(sync_operation.attempts, 1)
+
+    @freeze_time("2020-01-01 12:00:00")
+    def test_failed_operation_is_retried(self):
+        VerzoekInformatieObjectFactory.create(informatieobject=INFORMATIEOBJECT)
+        sync_operation = SyncOperation.objects.get()
+        self.drc_client.create.side_effect = ClientError({"detail": "unavailable"})
+
+        process_pending()
+
+        sync_operation.refresh_from_db()
+        self.assertEqual(sync_operation.status, SyncOperationStatus.pending)
+        self.assertEqual(sync_operation.attempts, 1)
+        self.assertEqual(
+            sync_operation.next_attempt, timezone.now() + timedelta(seconds=10)
+        )
+        self.assertIn("unavailable", sync_operation.last_error)
+
+        # not due yet
+        self.assertEqual(process_pending(), 0)
+
+        with freeze_time("2020-01-01 12:00:10"):
+            process_pending()
+
+        sync_operation.refresh_from_db()
+        self.assertEqual(sync_operation.attempts, 2)
+        # capped by DRC_SYNC_MAX_BACKOFF
+        self.assertEqual(
+            sync_operation.next_attempt, timezone.now() + timedelta(seconds=10 + 15),
+        )
+
+        with freeze_time("2020-01-01 12:00:25"):
+            process_pending()
+
+        sync_operation.refresh_from_db()
+        self.assertEqual(sync_operation.status, SyncOperationStatus.failed)
+        self.assertEqual(sync_operation.attempts, 3)
+
+    def test_retried_create_is_idempotent(self):
+        VerzoekInformatieObjectFactory.create(informatieobject=INFORMATIEOBJECT)
+        SyncOperation.objects.update(attempts=1)
+        self.drc_client.list.return_value = [{"url": "https://drc.example.com/oio/1"}]
+
+        process_pending()
+
+        self.drc_client.create.assert_not_called()
+        self.assertEqual(SyncOperation.objects.get().status, SyncOperationStatus.done)
+
+    def test_unexpected_error_is_recorded(self):
+        VerzoekInformatieObjectFactory.create(informatieobject=INFORMATIEOBJECT)
+        VerzoekInformatieObjectFactory.create(informatieobject=INFORMATIEOBJECT)
+        self.drc_client.create.side_effect = [ValueError("bad response"), None]
+
+        processed = process_pending()
+
+        self.assertEqual(processed, 2)
+        first, second = SyncOperation.objects.order_by("pk")
+        self.assertEqual(first.status, SyncOperationStatus.pending)
+        self.assertEqual(first.attempts, 1)
+        self.assertEqual(first.last_error, "bad response")
+        self.assertEqual(second.status, SyncOperationStatus.done)
+
+    def test_attempt_is_recorded_before_call(self):
+        VerzoekInformatieObjectFactory.create(informatieobject=INFORMATIEOBJECT)
+        self.drc_client.create.side_effect = WorkerCrash
+
+        with self.assertRaises(WorkerCrash):
+            process_pending()
+
+        sync_operation = SyncOperation.objects.get()
+        self.assertEqual(sync_operation.status, SyncOperationStatus.pending)
+        self.assertEqual(sync_operation.attempts, 1)
+        self.assertGreater(sync_operation.next_attempt, timezone.now())
+
+    def test_process_delete(self):
+        relation = VerzoekInformatieObjectFactory.create(
+            informatieobject=INFORMATIEOBJECT
+        )
+        relation.delete()
+        SyncOperation.objects.filter(operation=SyncOperationTypes.create).update(
+            status=SyncOperationStatus.done
+        )
+        self.drc_client.list.return_value = [{"url": "https://drc.example.com/oio/1"}]
+
+        process_pending()
+
+        self.drc_client.delete.assert_called_once_with(
+            "objectinformatieobject", url="https://drc.example.com/oio/1"
+        )
+
+    def test_delete_without_remote_relation(self):
+        relation = VerzoekInformatieObjectFactory.create(
+            informatieobject=INFORMATIEOBJECT
+        )
+        relation.delete()
+        SyncOperation.objects.filter(operation=SyncOperationTypes.create).update(
+            status=SyncOperationStatus.done
+        )
+
+        process_pending()
+
+        self.drc_client.delete.assert_not_called()
+        self.assertEqual(
+            SyncOperation.objects.get(operation=SyncOperationTypes.delete).status,
+            SyncOperationStatus.done,
+        )
+
+    def test_operations_on_relation_are_ordered(self):
+        relation = VerzoekInformatieObjectFactory.create(
+            informatieobject=INFORMATIEOBJECT
+        )
+        relation.delete()
+        # the create is waiting for a retry
+        SyncOperation.objects.filter(operation=SyncOperationTypes.create).update(
+            attempts=1, next_attempt=timezone.now() + timedelta(minutes=1)
+        )
+
+        processed = process_pending()
+
+        self.assertEqual(processed, 0)
+        self.drc_client.delete.assert_not_called()
+
+    def test_command(self):
+        VerzoekInformatieObjectFactory.create(informatieobject=INFORMATIEOBJECT)
+        stdout = StringIO()
+
+        call_command("process_sync_operations", stdout=stdout)
+
+        self.assertEqual(stdout.getvalue(), "Processed 1 sync operation(s)\n")
+        self.drc_client.create.assert_called_once()
+
+
+@override_settings(DRC_SYNC_ASYNC=False)
+class SynchronousSyncTests(TestCase):
+    @patch("kic.sync.signals.get_drc_client")
+    def test_create_synced_during_save(self, m):
+        VerzoekInformatieObjectFactory.create(informatieobject=INFORMATIEOBJECT)
+
+        m.return_value.create.assert_called_once()
+        self.assertFalse(SyncOperation.objects.exists())
@@ -5,6 +5,8 @@ from django.contrib.staticfiles.urls import staticfiles_urlpatterns
 from django.urls import include, path
 from django.views.generic.base import TemplateView
 
+from kic.utils.views import metrics
+
 handler500 = "kic.utils.views.server_error"
 
 urlpatterns = [
@@ -14,6 +16,7 @@ urlpatterns = [
     path("", TemplateView.as_view(template_name="index.html")),
     path("ref/", include("vng_api_common.urls")),
     path("ref/", include("vng_api_common.notifications.urls")),
+    path("metrics", metrics, name="metrics"),
 ]
 
 # NOTE: The staticfiles_urlpatterns also discovers static files (ie. no need to run collectstatic). Both the static
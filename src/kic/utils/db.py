@@ -0,0 +1,47 @@
+from typing import List
+
+from django.contrib.postgres.lookups import PostgresSimpleLookup
+from django.db import connection, models
+from django.db.models import Func
+
+
+def bulk_create(
+    model: models.Model, objs: List[models.Model], key: str
+) -> List[models.Model]:
+    """
+    Bulk create the objects and make sure their primary keys are set.
+
+    PostgreSQL returns the primary keys of the inserted rows, on other
+    backends the objects are looked up by the unique field ``key``.
+    """
+    objs = model.objects.bulk_create(objs)
+    if objs and not connection.features.can_return_ids_from_bulk_insert:
+        values = [getattr(obj, key) for obj in objs]
+        pks = dict(
+            model.objects.filter(**{f"{key}__in": values}).values_list(key, "pk")
+        )
+        for obj in objs:
+            obj.pk = pks[getattr(obj, key)]
+    return objs
+
+
+class TrigramWordSimilar(PostgresSimpleLookup):
+    """
+    Match if a word of the field is similar to the value (pg_trgm ``%>``).
+
+    Unlike ``trigram_similar``, the value is compared with the parts of the
+    field of about the same length, so that a short search term matches a
+    longer text.
+    """
+
+    lookup_name = "trigram_word_similar"
+    operator = "%%>"
+
+
+class WordSimilarity(Func):
+    """
+    The word similarity of the expressions (pg_trgm ``word_similarity``).
+    """
+
+    function = "WORD_SIMILARITY"
+    output_field = models.FloatField()
@@ -0,0 +1,319 @@
+"""
+Instrumentation of the time spent handling the requests.
+
+:class:`PerformanceMiddleware` measures per request the total time, the time
+and number of the database queries, the time of the calls to remote APIs (per
+host) and the time of the serialization, tagged with the viewset and action
+that handled the request. The timings are written to the ``performance``
+logger and added to the totals of the process, which are exposed in the
+Prometheus text format on ``/metrics`` if ``PERFORMANCE_METRICS_ENABLED`` is
+set.
+
+The categories overlap: a query or a remote call made while serializing is
+counted in both.
+"""
+import logging
+import threading
+import time
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from django.db import connections
+
+logger = logging.getLogger("performance")
+
+# upper bounds (in seconds) of the buckets of the request duration histogram
+DURATION_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+_local = threading.local()
+
+
+class RequestTimings:
+    def __init__(self):
+        self.total = 0.0
+        self.db_time = 0.0
+        self.db_queries = 0
+        self.serialization_time = 0.0
+        # host -> [number of calls, seconds]
+        self.remote: Dict[str, List] = defaultdict(lambda: [0, 0.0])
+
+    @property
+    def remote_time(self) -> float:
+        return sum(duration for calls, duration in self.remote.values())
+
+    @property
+    def remote_calls(self) -> int:
+        return sum(calls for calls, duration in self.remote.values())
+
+    def execute_wrapper(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - start
+            self.db_queries += 1
+
+
+def get_current_timings() -> Optional[RequestTimings]:
+    return getattr(_local, "timings", None)
+
+
+@contextmanager
+def bind_timings(timings: Optional[RequestTimings]) -> Iterator[None]:
+    """
+    Count the calls in another thread in the timings of the request.
+    """
+    previous = get_current_timings()
+    _local.timings = timings
+    try:
+        yield
+    finally:
+        _local.timings = previous
+
+
+def record_remote_call(url: str, duration: float) -> None:
+    """
+    Add a call to a remote API to the timings of the current request.
+    """
+    timings = get_current_timings()
+    if timings is None:
+        return
+    host = urlparse(url).netloc
+    timings.remote[host][0] += 1
+    timings.remote[host][1] += duration
+
+
+@contextmanager
+def timed_remote_call(url: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_remote_call(url, time.perf_counter() - start)
+
+
+@contextmanager
+def timed_serialization() -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings = get_current_timings()
+        if timings is not None:
+            timings.serialization_time += time.perf_counter() - start
+
+
+def get_view_name(view_func, method: str) -> str:
+    """
+    Return the viewset and action, or the name of a plain view.
+    """
+    viewset = getattr(view_func, "cls", None)
+    if viewset is None:
+        return f"{view_func.__module__}.{view_func.__name__}"
+    actions = getattr(view_func, "actions", None) or {}
+    action = actions.get(method.lower(), method.lower())
+    return f"{viewset.__name__}.{action}"
+
+
+class Metrics:
+    """
+    Totals of the request timings of this process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.requests = defaultdict(int)  # (view, method, status) -> count
+        self.buckets = defaultdict(lambda: [0] * len(DURATION_BUCKETS))
+        # view -> [count, total, db, queries, serialization]
+        self.views = defaultdict(lambda: [0, 0.0, 0.0, 0, 0.0])
+        # (view, host) -> [calls, seconds]
+        self.remote = defaultdict(lambda: [0, 0.0])
+
+    def observe(
+        self, view: str, method: str, status: int, timings: RequestTimings
+    ) -> None:
+        with self._lock:
+            self.requests[(view, method, status)] += 1
+            buckets = self.buckets[view]
+            for index, bound in enumerate(DURATION_BUCKETS):
+                if timings.total <= bound:
+                    buckets[index] += 1
+            totals = self.views[view]
+            totals[0] += 1
+            totals[1] += timings.total
+            totals[2] += timings.db_time
+            totals[3] += timings.db_queries
+            totals[4] += timings.serialization_time
+            for host, (calls, duration) in timings.remote.items():
+                self.remote[(view, host)][0] += calls
+                self.remote[(view, host)][1] += duration
+
+    def render(self) -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+        """
+        lines = []
+
+        def add(name: str, type_: str, help_: str, samples: List[Tuple]) -> None:
+            lines.append(f"# HELP {name} {help_}")
+            lines.append(f"# TYPE {name} {type_}")
+            for suffix, labels, value in samples:
+                label_text = ",".join(
+                    f'{key}="{escape(str(label))}"' for key, label in labels
+                )
+                lines.append(f"{name}{suffix}{{{label_text}}} {value}")
+
+        with self._lock:
+            add(
+                "kic_requests_total",
+                "counter",
+                "Number of handled requests.",
+                [
+                    ("", (("view", view), ("method", method), ("status", status)), n)
+                    for (view, method, status), n in sorted(self.requests.items())
+                ],
+            )
+
+            duration_samples = []
+            for view, (count, total, *rest) in sorted(self.views.items()):
+                for bound, n in zip(DURATION_BUCKETS, self.buckets[view]):
+                    duration_samples.append(
+                        ("_bucket", (("view", view), ("le", bound)), n)
+                    )
+                duration_samples += [
+                    ("_bucket", (("view", view), ("le", "+Inf")), count),
+                    ("_sum", (("view", view),), total),
+                    ("_count", (("view", view),), count),
+                ]
+            add(
+                "kic_request_duration_seconds",
+                "histogram",
+                "Total time of handling the request.",
+                duration_samples,
+            )
+
+            for name, index, help_ in (
+                (
+                    "kic_request_db_duration_seconds_total",
+                    2,
+                    "Time spent on database queries.",
+                ),
+                ("kic_request_db_queries_total", 3, "Number of database queries."),
+                (
+                    "kic_request_serialization_duration_seconds_total",
+                    4,
+                    "Time spent on serializing the responses.",
+                ),
+            ):
+                add(
+                    name,
+                    "counter",
+                    help_,
+                    [
+                        ("", (("view", view),), totals[index])
+                        for view, totals in sorted(self.views.items())
+                    ],
+                )
+
+            remote = sorted(self.remote.items())
+            add(
+                "kic_remote_requests_total",
+                "counter",
+                "Number of calls to remote APIs.",
+                [
+                    ("", (("view", view), ("host", host)), calls)
+                    for (view, host), (calls, duration) in remote
+                ],
+            )
+            add(
+                "kic_remote_request_duration_seconds_total",
+                "counter",
+                "Time spent on calls to remote APIs.",
+                [
+                    ("", (("view", view), ("host", host)), duration)
+                    for (view, host), (calls, duration) in remote
+                ],
+            )
+
+        return "\n".join(lines) + "\n"
+
+
+def escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+metrics = Metrics()
+
+
+class PerformanceMiddleware:
+    """
+    Record the timings of every request.
+
+    Should be the first middleware, so that the total time includes the other
+    middleware. The time between :meth:`process_template_response` and the
+    end of the request is the rendering of the response, which is counted as
+    serialization.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        timings = RequestTimings()
+        _local.timings = timings
+        request._performance_view = "-"
+        start = time.perf_counter()
+
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(
+                        connection.execute_wrapper(timings.execute_wrapper)
+                    )
+                response = self.get_response(request)
+        finally:
+            _local.timings = None
+
+        end = time.perf_counter()
+        timings.total = end - start
+        render_start = getattr(request, "_performance_render_start", None)
+        if render_start is not None:
+            timings.serialization_time += end - render_start
+
+        self.record(request, response, timings)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request._performance_view = get_view_name(view_func, request.method)
+
+    def process_template_response(self, request, response):
+        request._performance_render_start = time.perf_counter()
+        return response
+
+    def record(self, request, response, timings: RequestTimings) -> None:
+        view = request._performance_view
+        remote_hosts = ",".join(
+            f"{host}:{calls}:{duration * 1000:.1f}ms"
+            for host, (calls, duration) in sorted(timings.remote.items())
+        )
+        logger.info(
+            "%s %s %s view=%s total=%.1fms db=%.1fms queries=%d "
+            "remote=%.1fms remote_calls=%d serialization=%.1fms remote_hosts=%s",
+            request.method,
+            request.path,
+            response.status_code,
+            view,
+            timings.total * 1000,
+            timings.db_time * 1000,
+            timings.db_queries,
+            timings.remote_time * 1000,
+            timings.remote_calls,
+            timings.serialization_time * 1000,
+            remote_hosts or "-",
+        )
+        metrics.observe(view, request.method, response.status_code, timings)
@@ -0,0 +1,100 @@
+from unittest.mock import patch
+
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.urls import reverse as django_reverse
+
+from requests import Response
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, reverse
+
+from kic.api.clients import fetch
+from kic.datamodel.tests.factories import KlantFactory
+
+from ..performance import PerformanceMiddleware, metrics
+
+
+class PerformanceMiddlewareTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+
+        metrics.reset()
+        self.addCleanup(metrics.reset)
+
+    def test_request_is_logged(self):
+        KlantFactory.create_batch(2)
+
+        with self.assertLogs("performance", "INFO") as logs:
+            response = self.client.get(reverse("klant-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(logs.records), 1)
+        message = logs.records[0].getMessage()
+        self.assertTrue(message.startswith("GET /api/v1/klanten 200 "))
+        self.assertIn(" view=KlantViewSet.list ", message)
+        self.assertRegex(message, r" queries=[1-9]\d* ")
+        self.assertIn(" remote=0.0ms remote_calls=0 ", message)
+        self.assertIn(" remote_hosts=-", message)
+
+    def test_unresolved_request(self):
+        with self.assertLogs("performance", "INFO") as logs:
+            self.client.get("/api/v1/onbekend")
+
+        self.assertIn(" 404 view=- ", logs.records[0].getMessage())
+
+    def test_remote_calls(self):
+        def get_response(request):
+            fetch("https://zrc.example.com/api/v1/zaken/1")
+            fetch("https://zrc.example.com/api/v1/zaken/2")
+            return HttpResponse()
+
+        request = RequestFactory().get("/api/v1/verzoeken")
+        middleware = PerformanceMiddleware(get_response)
+
+        with patch("requests.Session.get", return_value=Response()):
+            with self.assertLogs("performance", "INFO") as logs:
+                middleware(request)
+
+        message = logs.records[0].getMessage()
+        self.assertIn(" remote_calls=2 ", message)
+        self.assertRegex(message, r" remote_hosts=zrc\.example\.com:2:\d+\.\dms$")
+        self.assertEqual(metrics.remote[("-", "zrc.example.com")][0], 2)
+
+    def test_remote_call_outside_request(self):
+        with patch("requests.Session.get", return_value=Response()):
+            fetch("https://zrc.example.com/api/v1/zaken/1")
+
+        self.assertFalse(metrics.remote)
+
+    @override_settings(PERFORMANCE_METRICS_ENABLED=True)
+    def test_metrics(self):
+        with self.assertLogs("performance", "INFO"):
+            self.client.get(reverse("klant-list"))
+            response = self.client.get(django_reverse("metrics"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        content = response.content.decode()
+        self.assertIn(
+            'kic_requests_total{view="KlantViewSet.list",method="GET",status="200"} 1',
+            content,
+        )
+        self.assertIn(
+            'kic_request_duration_seconds_bucket{view="KlantViewSet.list",le="+Inf"} 1',
+            content,
+        )
+        self.assertIn(
+            'kic_request_duration_seconds_count{view="KlantViewSet.list"} 1', content
+        )
+        self.assertIn("# TYPE kic_request_db_queries_total counter", content)
+
+
+class MetricsDisabledTests(SimpleTestCase):
+    @override_settings(PERFORMANCE_METRICS_ENABLED=False)
+    def test_metrics_disabled(self):
+        with self.assertLogs("performance", "INFO"):
+            response = self.client.get(django_reverse("metrics"))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -1,8 +1,11 @@
 from django import http
+from django.conf import settings
 from django.template import TemplateDoesNotExist, loader
 from django.views.decorators.csrf import requires_csrf_token
 from django.views.defaults import ERROR_500_TEMPLATE_NAME
 
+from .performance import metrics as performance_metrics
+
 
 @requires_csrf_token
 def server_error(request, template_name=ERROR_500_TEMPLATE_NAME):
@@ -23,3 +26,14 @@ def server_error(request, template_name=ERROR_500_TEMPLATE_NAME):
         )
     context = {"request": request}
     return http.HttpResponseServerError(template.render(context))
+
+
+def metrics(request):
+    """
+    The request timings of this process, in the Prometheus text format.
+    """
+    if not settings.PERFORMANCE_METRICS_ENABLED:
+        raise http.Http404
+    return http.HttpResponse(
+        performance_metrics.render(), content_type="text/plain; version=0.0.4"
+    )